@@ -1 +1,218 @@
-# Register your models here.
+import json
+
+from django.contrib import admin, messages
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Count, IntegerField, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.html import format_html
+
+from apps.events.models import Event, EventChange, LoadBatch
+from apps.events.runner import enqueue_import, resume_import
+from utils.enums import BatchSource
+
+# Below this many estimated rows the paginator runs an exact COUNT(*).
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that takes the row count from the PostgreSQL planner instead
+    of running COUNT(*), which reads the whole table or partition set.
+
+    Small results are still counted exactly, and other databases always
+    are. Page counts of large results are approximate.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]['Plan']['Plan Rows'])
+        if estimate < EXACT_COUNT_THRESHOLD:
+            return super().count
+        return estimate
+
+
+class UpcomingListFilter(admin.SimpleListFilter):
+    """Events not over yet, or past ones, read off the end_date index."""
+
+    title = 'upcoming'
+    parameter_name = 'upcoming'
+
+    def lookups(self, request, model_admin):  # noqa: PLR6301
+        return [('yes', 'Upcoming'), ('no', 'Past')]
+
+    def queryset(self, request, queryset):
+        now = timezone.now()
+        if self.value() == 'yes':
+            return queryset.filter(end_date__gte=now)
+        if self.value() == 'no':
+            return queryset.filter(end_date__lt=now)
+        return queryset
+
+
+@admin.register(Event)
+class EventAdmin(admin.ModelAdmin):
+    """
+    Events admin for tables of millions of rows: estimated page counts,
+    no full-table result count, and only indexed filters and search.
+    Events of one batch are listed with ``?load_batch__id__exact=<id>``.
+    Events cannot be deleted here: the delete would cascade to their
+    orders and participants, and the next import would create them again.
+    """
+
+    list_display = [
+        'event_id',
+        'name',
+        'start_date',
+        'end_date',
+        'event_type',
+        'city',
+        'load_batch',
+    ]
+    list_select_related = ['load_batch']
+    list_filter = [
+        ('start_date', admin.DateFieldListFilter),
+        UpcomingListFilter,
+    ]
+    # Exact match only: a substring search cannot use the event_id index.
+    search_fields = ['event_id__exact']
+    search_help_text = 'Exact event ID.'
+    ordering = ['-start_date']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ['load_batch']
+
+    def has_delete_permission(self, request, obj=None):  # noqa: PLR6301
+        return False
+
+
+def _count_per_batch(model) -> Coalesce:
+    """Rows of ``model`` per batch, as a subquery on its load_batch index."""
+    rows = (
+        model.objects
+        .filter(load_batch=OuterRef('pk'))
+        .order_by()
+        .values('load_batch')
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    return Coalesce(Subquery(rows, output_field=IntegerField()), 0)
+
+
+@admin.register(LoadBatch)
+class LoadBatchAdmin(admin.ModelAdmin):
+    """
+    Load batches with the events they own and the changes they recorded,
+    counted in the page query itself. Batches are created by imports and
+    webhooks, so they are read-only here and cannot be deleted, which
+    would cascade to their events and change log; failed imports can be
+    resumed and any import re-run from the actions.
+    """
+
+    list_display = [
+        'id',
+        'status',
+        'source',
+        'organizer',
+        'started_at',
+        'finished_at',
+        'events_imported_count',
+        'event_count',
+        'change_count',
+        'validation_failures_count',
+        'rows_per_second',
+    ]
+    list_filter = ['status', 'source']
+    ordering = ['-id']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ['rerun_imports', 'resume_imports']
+
+    def get_queryset(self, request) -> QuerySet:
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                event_count=_count_per_batch(Event),
+                change_count=_count_per_batch(EventChange),
+            )
+        )
+
+    def get_readonly_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+
+    def has_add_permission(self, request):  # noqa: PLR6301
+        return False
+
+    def has_delete_permission(self, request, obj=None):  # noqa: PLR6301
+        return False
+
+    @admin.display(description='Events')
+    def event_count(self, batch: LoadBatch) -> str:  # noqa: PLR6301
+        url = reverse('admin:events_event_changelist')
+        return format_html(
+            '<a href="{}?load_batch__id__exact={}">{}</a>',
+            url,
+            batch.pk,
+            batch.event_count,
+        )
+
+    @admin.display(description='Changes')
+    def change_count(self, batch: LoadBatch) -> int:  # noqa: PLR6301
+        return batch.change_count
+
+    @admin.action(description='Re-run the import of the selected batches')
+    def rerun_imports(self, request, queryset: QuerySet) -> None:
+        """Queue a new import per organizer of the selected batches."""
+        organizers = (
+            queryset
+            .filter(source=BatchSource.IMPORT.name)
+            .order_by()
+            .values_list('organizer', flat=True)
+            .distinct()
+        )
+        for organizer in organizers:
+            batch, created = enqueue_import(organizer)
+            label = organizer or 'default organizer'
+            if created:
+                self.message_user(
+                    request, f'Import of {label} queued as batch {batch.pk}.'
+                )
+            else:
+                self.message_user(
+                    request,
+                    f'An import of {label} is already active '
+                    f'(batch {batch.pk}).',
+                    messages.WARNING,
+                )
+
+    @admin.action(description='Resume the selected failed imports')
+    def resume_imports(self, request, queryset: QuerySet) -> None:
+        """Queue the failed or abandoned selected batches to run again."""
+        batches = list(queryset.order_by('pk'))
+        resumed = [batch.pk for batch in batches if resume_import(batch)]
+        if resumed:
+            self.message_user(
+                request,
+                f'Batches {", ".join(map(str, resumed))} queued to resume.',
+            )
+        if len(resumed) < len(batches):
+            self.message_user(
+                request,
+                'Only failed imports, or imports abandoned for longer than '
+                'IMPORT_LOCK_TTL, can be resumed.',
+                messages.WARNING,
+            )
@@ -0,0 +1,101 @@
+import hashlib
+from typing import Any, Callable, Dict, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Subquery, Sum
+
+from apps.events.metrics import record_cache_lookup
+from apps.events.models import Event, LoadBatch
+from apps.events.serializers import EventSerializer
+from utils.enums import Status
+
+
+def data_version() -> str:
+    """
+    Version of the event data, changing whenever events may have changed.
+
+    Combines the latest batch, the latest finish time and the events
+    written so far by running batches, which import commits chunk by
+    chunk together with its progress. One query, each part read off an
+    index, so its cost does not grow with the number of batches.
+    """
+    finished = (
+        LoadBatch.objects
+        .filter(finished_at__isnull=False)
+        .order_by('-finished_at')
+        .values('finished_at')[:1]
+    )
+    written = (
+        LoadBatch.objects
+        .filter(status=Status.PENDING.name)
+        .order_by()
+        .values('status')
+        .annotate(total=Sum('events_imported_count'))
+        .values('total')
+    )
+    latest = (
+        LoadBatch.objects
+        .order_by('-id')
+        .annotate(finished=Subquery(finished), written=Subquery(written))
+        .values_list('id', 'finished', 'written')
+        .first()
+    )
+    if latest is None:
+        return '0'
+    batch_id, finished_at, events_written = latest
+    stamp = finished_at.timestamp() if finished_at else 0
+    return f'{batch_id}.{stamp}.{events_written}'
+
+
+def event_cache_key(event_id: str, version: str) -> str:
+    return f'event:{version}:{event_id}'
+
+
+def get_upcoming_data(url: str, build: Callable[[], Any]) -> Any:
+    """
+    Response data of the upcoming events page at ``url``, cached for the
+    current data version; ``build`` renders it on a miss.
+    """
+    digest = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    key = f'upcoming:{data_version()}:{digest}'
+    data = cache.get(key)
+    record_cache_lookup('upcoming', data is not None)
+    if data is None:
+        data = build()
+        cache.set(key, data, settings.UPCOMING_CACHE_TTL)
+    return data
+
+
+def get_events_data(event_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Serialized events by ``event_id``, read from the cache in one
+    round-trip. Misses are loaded with a single query and cached for the
+    current data version; unknown ids are left out.
+    """
+    version = data_version()
+    keys = {
+        event_cache_key(event_id, version): event_id for event_id in event_ids
+    }
+    events = {
+        keys[key]: data for key, data in cache.get_many(list(keys)).items()
+    }
+    for event_id in event_ids:
+        record_cache_lookup('event', event_id in events)
+
+    missing = [event_id for event_id in event_ids if event_id not in events]
+    if missing:
+        queryset = Event.objects.filter(event_id__in=missing).order_by()
+        loaded = {
+            data['event_id']: data
+            for data in EventSerializer(queryset, many=True).data
+        }
+        cache.set_many(
+            {
+                event_cache_key(event_id, version): data
+                for event_id, data in loaded.items()
+            },
+            settings.EVENT_CACHE_TTL,
+        )
+        events.update(loaded)
+    return events
@@ -0,0 +1,102 @@
+import logging
+import os
+import socket
+import zlib
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Iterator
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from apps.events.models import ImportLock
+
+logger = logging.getLogger(__name__)
+
+IMPORT_LOCK_NAME = 'sympla-import'
+EVENTS_WRITE_LOCK_NAME = 'sympla-events-write'
+
+
+def _advisory_key(name: str) -> int:
+    """Stable 32-bit key for ``pg_try_advisory_lock`` derived from a name."""
+    return zlib.crc32(name.encode())
+
+
+def _owner() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def _acquire_row_lock(name: str, owner: str) -> bool:
+    """Insert the lock row, or take it over if its holder went stale."""
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=settings.IMPORT_LOCK_TTL)
+    try:
+        with transaction.atomic():
+            ImportLock.objects.create(
+                name=name, owner=owner, expires_at=expires_at
+            )
+        return True
+    except IntegrityError:
+        taken_over = ImportLock.objects.filter(
+            name=name, expires_at__lt=now
+        ).update(owner=owner, acquired_at=now, expires_at=expires_at)
+        if taken_over:
+            logger.warning('Stale import lock %s taken over.', name)
+        return bool(taken_over)
+
+
+@contextmanager
+def import_lock(name: str = IMPORT_LOCK_NAME) -> Iterator[bool]:
+    """
+    Try to become the only running import across processes and containers.
+
+    Yields whether the lock was acquired; it never waits. On PostgreSQL a
+    session advisory lock is used, so it is released even if the process
+    dies. Other databases fall back to an ``ImportLock`` row that expires
+    after ``IMPORT_LOCK_TTL`` seconds.
+    """
+    if connection.vendor == 'postgresql':
+        key = _advisory_key(name)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_try_advisory_lock(%s)', [key])
+            acquired = cursor.fetchone()[0]
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT pg_advisory_unlock(%s)', [key])
+        return
+
+    owner = _owner()
+    acquired = _acquire_row_lock(name, owner)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            ImportLock.objects.filter(name=name, owner=owner).delete()
+
+
+def lock_events_for_write(*organizers: str) -> None:
+    """
+    Serialize writers of the events of ``organizers`` until the current
+    transaction ends (the importer's chunks and the webhook flushes).
+
+    A partitioned events table has no unique constraint on ``event_id``,
+    so two writers that each looked an event up and found nothing would
+    both insert it. On PostgreSQL this takes a transaction advisory lock
+    per organizer slug, ``''`` (the default) standing for the events of
+    ``SYMPLA_API_TOKEN``: ids of different organizers never collide, so
+    their imports write concurrently. The locks are taken in a fixed order
+    so writers of several organizers cannot deadlock. Elsewhere
+    ``event_id`` is unique and the database serializes writes.
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        for organizer in sorted(set(organizers) or {''}):
+            cursor.execute(
+                'SELECT pg_advisory_xact_lock(%s)',
+                [_advisory_key(f'{EVENTS_WRITE_LOCK_NAME}:{organizer}')],
+            )
@@ -0,0 +1,231 @@
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+from contextlib import contextmanager
+from io import StringIO
+from time import perf_counter
+from typing import Any, Dict, Iterator
+
+from django.core.management import call_command
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import connection
+
+from apps.events.middleware import QueryTracker
+from apps.events.models import LoadBatch
+from benchmarks.fake_sympla import fake_sympla_process
+
+logger = logging.getLogger(__name__)
+
+ENGINES = {
+    'sqlite': 'django.db.backends.sqlite3',
+    'postgresql': 'django.db.backends.postgresql',
+}
+
+
+class Command(BaseCommand):
+    """Command to benchmark the importer against a local fake Sympla API."""
+
+    help = (
+        'Runs import_sympla_events against a local fake Sympla server on a '
+        'throwaway test database and reports events/s, peak RSS and query '
+        'counts.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument('--pages', type=int, default=10)
+        parser.add_argument('--page-size', type=int, default=100)
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.0,
+            help='Seconds of latency added to each fake API response.',
+        )
+        parser.add_argument(
+            '--error-rate',
+            type=float,
+            default=0.0,
+            help='Fraction of fake API responses failing with HTTP 500.',
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--pipeline',
+            action='store_true',
+            help='Run the import with --pipeline.',
+        )
+        parser.add_argument(
+            '--engines',
+            default=None,
+            help=(
+                'Comma separated engines to compare (sqlite,postgresql). '
+                'Each runs in its own process. Defaults to the configured DB.'
+            ),
+        )
+        parser.add_argument(
+            '--label',
+            default='',
+            help='Free-form label stored with the results (e.g. a release).',
+        )
+        parser.add_argument(
+            '--output',
+            default=None,
+            help='Append results as JSON lines to this file.',
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the raw JSON result only.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        if options['engines']:
+            results = [
+                self._run_in_subprocess(engine.strip(), options)
+                for engine in options['engines'].split(',')
+            ]
+        else:
+            results = [self._run_benchmark(options)]
+
+        for result in results:
+            if options['json']:
+                self.stdout.write(json.dumps(result))
+            else:
+                self.stdout.write(self._format_result(result))
+
+        if options['output']:
+            with open(options['output'], 'a', encoding='utf-8') as output:
+                for result in results:
+                    output.write(json.dumps(result) + '\n')
+
+    def _run_in_subprocess(  # noqa: PLR6301
+        self, engine: str, options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Benchmark one engine in a fresh process so RSS is not shared."""
+        if engine not in ENGINES:
+            raise CommandError(
+                f'Unknown engine {engine!r}. Choose from {", ".join(ENGINES)}.'
+            )
+        command = [
+            sys.executable,
+            '-m',
+            'django',
+            'benchmark_import',
+            '--json',
+            f'--pages={options["pages"]}',
+            f'--page-size={options["page_size"]}',
+            f'--latency={options["latency"]}',
+            f'--error-rate={options["error_rate"]}',
+            f'--seed={options["seed"]}',
+            f'--label={options["label"]}',
+        ]
+        if options['pipeline']:
+            command.append('--pipeline')
+        env = {**os.environ, 'DATABASE_ENGINE': ENGINES[engine]}
+        completed = subprocess.run(  # noqa: S603
+            command, env=env, capture_output=True, text=True, check=False
+        )
+        if completed.returncode != 0:
+            raise CommandError(
+                f'Benchmark on {engine} failed:\n{completed.stderr}'
+            )
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    def _run_benchmark(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one import on a throwaway database and collect results. The
+        fake API runs in its own process, so the RSS and time reported are
+        the importer's alone.
+        """
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            with (
+                fake_sympla_process(
+                    pages=options['pages'],
+                    page_size=options['page_size'],
+                    latency=options['latency'],
+                    error_rate=options['error_rate'],
+                    seed=options['seed'],
+                ) as url,
+                self._sympla_env(url),
+            ):
+                tracker = QueryTracker()
+                start = perf_counter()
+                with connection.execute_wrapper(tracker):
+                    call_command(
+                        'import_sympla_events',
+                        pipeline=options['pipeline'],
+                        stdout=StringIO(),
+                    )
+                elapsed = perf_counter() - start
+            batch = LoadBatch.objects.latest('id')
+            return self._build_result(options, batch, tracker, elapsed)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    @staticmethod
+    @contextmanager
+    def _sympla_env(url: str) -> Iterator[None]:
+        """Point SymplaService at the fake server for the duration."""
+        overrides = {'SYMPLA_BASE_URL': url, 'SYMPLA_API_TOKEN': 'benchmark'}
+        previous = {key: os.environ.get(key) for key in overrides}
+        os.environ.update(overrides)
+        try:
+            yield
+        finally:
+            for key, value in previous.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    @staticmethod
+    def _build_result(
+        options: Dict[str, Any],
+        batch: LoadBatch,
+        tracker: QueryTracker,
+        elapsed: float,
+    ) -> Dict[str, Any]:
+        # ru_maxrss is reported in kilobytes on Linux.
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {
+            'label': options['label'],
+            'engine': connection.vendor,
+            'pages': options['pages'],
+            'page_size': options['page_size'],
+            'latency': options['latency'],
+            'error_rate': options['error_rate'],
+            'pipeline': options['pipeline'],
+            'status': batch.status,
+            'events': batch.events_imported_count,
+            'seconds': round(elapsed, 3),
+            'events_per_second': round(
+                batch.events_imported_count / elapsed if elapsed else 0.0, 1
+            ),
+            'peak_rss_mb': round(peak_rss / 1024, 1),
+            'queries': tracker.count,
+            'http_time': round(batch.http_time, 3),
+            'validation_time': round(batch.validation_time, 3),
+            'db_time': round(batch.db_time, 3),
+        }
+
+    @staticmethod
+    def _format_result(result: Dict[str, Any]) -> str:
+        return (
+            f'[{result["engine"]}{" pipeline" * result["pipeline"]}] '
+            f'{result["events"]} events in '
+            f'{result["seconds"]}s ({result["events_per_second"]} events/s), '
+            f'peak RSS {result["peak_rss_mb"]} MB, '
+            f'{result["queries"]} queries, status {result["status"]} '
+            f'(HTTP {result["http_time"]}s, validation '
+            f'{result["validation_time"]}s, DB {result["db_time"]}s)'
+        )
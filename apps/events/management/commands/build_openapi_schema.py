@@ -0,0 +1,52 @@
+import logging
+from typing import Any
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from apps.events.openapi import (
+    SCHEMA_MEDIA_TYPES,
+    generate_schema,
+    schema_path,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command to prebuild the OpenAPI schema served at /schema/."""
+
+    help = (
+        'Writes the OpenAPI schema as YAML and JSON to OPENAPI_SCHEMA_DIR so '
+        'web workers serve it without generating it per request.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Fail if the prebuilt schema is missing or out of date.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        stale = []
+        for fmt in SCHEMA_MEDIA_TYPES:
+            path = schema_path(fmt)
+            schema = generate_schema(fmt)
+            if options['check']:
+                if not path.exists() or path.read_bytes() != schema:
+                    stale.append(str(path))
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(schema)
+            self.stdout.write(f'OpenAPI schema written to {path}.')
+
+        if stale:
+            raise CommandError(
+                f'OpenAPI schema out of date: {", ".join(stale)}. '
+                'Run build_openapi_schema.'
+            )
@@ -0,0 +1,43 @@
+import logging
+import os
+from time import perf_counter
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.events.snapshots import describe_counts, export_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command to export the events and load batches to a snapshot file."""
+
+    help = (
+        'Writes every event and load batch to a gzipped NDJSON snapshot, '
+        'read through a streaming cursor, for load_events_snapshot to seed '
+        'another database.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument('path', help='Snapshot file to write.')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        start = perf_counter()
+        with open(options['path'], 'wb') as output:
+            counts = export_snapshot(output)
+        elapsed = perf_counter() - start
+        size = os.path.getsize(options['path'])
+        logger.info(
+            'Snapshot exported to %s in %.2fs.',
+            options['path'],
+            elapsed,
+            extra={'counts': counts, 'bytes': size},
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{describe_counts(counts)} exported to {options["path"]} '
+                f'({size / 1024 / 1024:.1f} MB) in {elapsed:.2f}s.'
+            )
+        )
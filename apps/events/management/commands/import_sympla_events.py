@@ -1,18 +1,70 @@
+import argparse
 import logging
-from typing import Any, Dict
+import os
+import sys
+import threading
+from contextlib import ExitStack
+from datetime import datetime
+from queue import Empty, Full, Queue
+from subprocess import Popen
+from tempfile import TemporaryFile
+from time import perf_counter
+from typing import IO, Any, Dict, Iterable, List, Tuple
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
+import orjson
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import connection, transaction
+from django.db.models import QuerySet
 from django.utils import timezone
 from pydantic import ValidationError
 
-from apps.events.models import Event, LoadBatch
+from apps.events.locks import (
+    IMPORT_LOCK_NAME,
+    import_lock,
+    lock_events_for_write,
+)
+from apps.events.metrics import record_finished_import
+from apps.events.models import TRACKED_FIELDS, Event, EventChange, LoadBatch
+from apps.events.partitions import archive_cutoff, is_archived
 from apps.events.schemas import SymplaEventSchema
-from apps.events.services import SymplaService
-from utils.enums import Status
+from apps.events.services import (
+    Organizer,
+    SymplaService,
+    find_organizer,
+    load_organizers,
+)
+from apps.events.stats import ImportStats
+from utils.enums import ChangeKind, Status
 
 logger = logging.getLogger(__name__)
 
+CHANGE_LOG_BATCH_SIZE = 1000
+
+# Events are written in chunks of CHUNK_SIZE, each committed with the
+# batch progress. Per-event lines are only emitted at DEBUG, or for one in
+# every EVENT_LOG_SAMPLE_RATE events at INFO; progress is logged per chunk.
+CHUNK_SIZE = 500
+EVENT_LOG_SAMPLE_RATE = 100
+VALIDATION_ERROR_LOG_LIMIT = 20
+
+# Rows read at a time when indexing the stored events for --dry-run.
+DRY_RUN_INDEX_CHUNK_SIZE = 5000
+
+# How often a pipeline stage blocked on the queue checks whether the other
+# stage has stopped.
+PIPELINE_POLL_INTERVAL = 0.1
+
+# A page of validated events with its pagination block, as queued by the
+# fetch thread of the pipelined import; no pagination for the events of a
+# page that failed midway.
+PageChunk = Tuple[List[SymplaEventSchema], Dict[str, Any] | None]
+
 
 class Command(BaseCommand):
     """Command to fetch events from Sympla API and save them to database."""
@@ -22,21 +74,369 @@ class Command(BaseCommand):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.batch: LoadBatch | None = None
+        self.organizer: Organizer | None = None
         self.events_processed_count = 0
+        self.events_created_count = 0
+        self.existing_events: Dict[str, Dict[str, Any]] = {}
+        self.changes: List[EventChange] = []
+        self.stats = ImportStats()
+        self.queue_depth = 0
+        self.fetch_wait = 0.0
+        self.write_wait = 0.0
+        self.archive_cutoff: datetime | None = None
+        self.archived_skipped = 0
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument(
+            '--batch-id',
+            type=int,
+            default=None,
+            help='Run a batch queued by the imports API instead of a new one.',
+        )
+        parser.add_argument(
+            '--organizer',
+            default=None,
+            help='Import the events of one organizer of SYMPLA_ORGANIZERS.',
+        )
+        parser.add_argument(
+            '--all-organizers',
+            action='store_true',
+            help='Import all organizers of SYMPLA_ORGANIZERS concurrently.',
+        )
+        parser.add_argument(
+            '--pipeline',
+            action=argparse.BooleanOptionalAction,
+            default=settings.IMPORT_PIPELINE,
+            help=(
+                'Fetch pages in a background thread while the previous ones '
+                'are written, instead of fetching everything first.'
+            ),
+        )
+        parser.add_argument(
+            '--queue-depth',
+            type=int,
+            default=settings.IMPORT_QUEUE_DEPTH,
+            help='With --pipeline, pages fetched ahead of the writer.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help=(
+                'Compare the API with the stored events and report what an '
+                'import would create, update or leave behind, writing '
+                'nothing.'
+            ),
+        )
+        parser.add_argument(
+            '--diff-file',
+            default=None,
+            help='With --dry-run, write the diff as NDJSON to this file.',
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Main command execution handler."""
-        self._start_import_process()
+        if options['diff_file'] and not options['dry_run']:
+            raise CommandError('--diff-file requires --dry-run.')
+        if options['dry_run'] and (
+            options['all_organizers'] or options['batch_id'] is not None
+        ):
+            raise CommandError(
+                '--dry-run cannot be combined with --all-organizers or '
+                '--batch-id.'
+            )
+        if options['all_organizers']:
+            self._import_all_organizers()
+            return
+        if options['organizer']:
+            self.organizer = self._get_organizer(options['organizer'])
+        if options['dry_run']:
+            self._dry_run(options['diff_file'])
+            return
+        if options['pipeline']:
+            self.queue_depth = max(options['queue_depth'], 1)
+        if options['batch_id'] is not None:
+            self.batch = self._get_queued_batch(options['batch_id'])
+
+        lock_name = IMPORT_LOCK_NAME
+        if self.organizer:
+            lock_name = f'{IMPORT_LOCK_NAME}:{self.organizer_slug}'
+        with import_lock(lock_name) as acquired:
+            if acquired:
+                self._start_import_process()
+            else:
+                self._record_skipped_run()
+
+    @property
+    def organizer_slug(self) -> str:
+        """Slug of the organizer imported; ``''`` for the default token."""
+        return self.organizer.slug if self.organizer else ''
+
+    def _import_all_organizers(self) -> None:
+        """
+        Run one import per organizer, each in its own process, at most
+        ``IMPORT_ORGANIZER_PROCESSES`` at a time.
+
+        Threads of one process would take turns on the GIL to parse and
+        validate, so the run took as long as the organizers one after the
+        other. SQLite allows a single writer at a time, so concurrent
+        imports would fail with "database is locked"; they run one by one
+        in this process there.
+        """
+        organizers = load_organizers()
+        if not organizers:
+            raise CommandError('SYMPLA_ORGANIZERS is not configured.')
+        if connection.vendor == 'sqlite':
+            for organizer in organizers:
+                self._import_organizer(organizer)
+            return
+        max_processes = max(settings.IMPORT_ORGANIZER_PROCESSES, 1)
+        running: List[Tuple[str, Popen, IO[bytes]]] = []
+        with ExitStack() as stack:
+            for organizer in organizers:
+                if len(running) >= max_processes:
+                    self._wait_for_organizer(*running.pop(0))
+                output = stack.enter_context(TemporaryFile())
+                process = self._start_organizer_process(organizer.slug, output)
+                running.append((organizer.slug, process, output))
+            for slug, process, output in running:
+                self._wait_for_organizer(slug, process, output)
+
+    def _import_organizer(self, organizer: Organizer) -> None:
+        try:
+            call_command(
+                'import_sympla_events',
+                organizer=organizer.slug,
+                stdout=self.stdout,
+            )
+        except Exception:
+            logger.exception(
+                'Import of organizer %s failed.',
+                organizer.slug,
+                extra={'organizer': organizer.slug},
+            )
+
+    def _wait_for_organizer(
+        self, slug: str, process: Popen, output: IO[bytes]
+    ) -> None:
+        """Wait for the import of one organizer and relay its output."""
+        process.wait()
+        output.seek(0)
+        self.stdout.write(output.read().decode(), ending='')
+        if process.returncode:
+            logger.error(
+                'Import of organizer %s failed with exit code %s.',
+                slug,
+                process.returncode,
+                extra={'organizer': slug},
+            )
+
+    @staticmethod
+    def _start_organizer_process(slug: str, output: IO[bytes]) -> Popen:
+        """Start the import of one organizer, its output sent to ``output``."""
+        env = {
+            **os.environ,
+            # The database of this process, which is not POSTGRES_DB when
+            # running under the test runner.
+            'POSTGRES_DB': connection.settings_dict['NAME'],
+        }
+        return Popen(  # noqa: S603
+            [
+                sys.executable,
+                '-m',
+                'django',
+                'import_sympla_events',
+                f'--organizer={slug}',
+            ],
+            cwd=settings.BASE_DIR,
+            env=env,
+            stdout=output,
+        )
+
+    @staticmethod
+    def _get_organizer(slug: str) -> Organizer:
+        organizer = find_organizer(slug)
+        if organizer is None:
+            raise CommandError(
+                f'Organizer {slug!r} is not in SYMPLA_ORGANIZERS.'
+            )
+        return organizer
+
+    @staticmethod
+    def _get_queued_batch(batch_id: int) -> LoadBatch:
+        try:
+            return LoadBatch.objects.get(
+                pk=batch_id, status=Status.QUEUED.name
+            )
+        except LoadBatch.DoesNotExist:
+            raise CommandError(f'No queued batch with id {batch_id}.')
+
+    def _dry_run(self, diff_file: str | None) -> None:
+        """
+        Diff the API against the stored events without writing anything.
+
+        The stored events of the organizer are indexed once by
+        ``event_id``; API events are streamed page by page into a second
+        index of the same shape, so the diff is made of set and dict
+        operations with no per-event queries. Events that are stored but no
+        longer returned by the API are reported as vanished.
+        """
+        started_at = timezone.now()
+        self.stdout.write('Computing the import diff (dry run)...')
+        with self.stats.measure('db_time'):
+            stored = self._index_stored_events()
+            self.archive_cutoff = archive_cutoff()
+
+        pages: List[Dict[str, Any]] = []
+        service = SymplaService(stats=self.stats, organizer=self.organizer)
+        incoming: Dict[str, Tuple] = {}
+        # make_aware looks the current time zone up on every call.
+        tz = timezone.get_current_timezone()
+        for event_data in service.iter_events(on_page=pages.append):
+            event = self._validate_event(event_data)
+            if event is None:
+                continue
+            incoming[event.id] = tuple(
+                value.replace(tzinfo=tz)
+                if isinstance(value, datetime) and value.tzinfo is None
+                else value
+                for value in event.to_event_fields().values()
+            )
+
+        created = incoming.keys() - stored.keys()
+        vanished = stored.keys() - incoming.keys()
+        updated = {
+            event_id: [
+                field
+                for field, old, new in zip(
+                    TRACKED_FIELDS, stored[event_id], values
+                )
+                if old != new
+            ]
+            for event_id, values in incoming.items()
+            if event_id in stored and stored[event_id] != values
+        }
+        unchanged = len(incoming) - len(created) - len(updated)
+
+        if diff_file:
+            with open(diff_file, 'wb') as output:
+                self._write_diff(output, created, updated, vanished)
+
+        elapsed = (timezone.now() - started_at).total_seconds()
+        rate = self.stats.rate(len(incoming), elapsed)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Dry run: {len(created)} to create, {len(updated)} to '
+                f'update, {unchanged} unchanged, {len(vanished)} vanished '
+                f'({len(stored)} stored, {len(incoming)} from the API) in '
+                f'{elapsed:.2f}s. '
+                f'{self.stats.summary(rate)}'
+            )
+        )
+        if not pages or pages[-1].get('next_page_url'):
+            self.stdout.write(
+                self.style.WARNING(
+                    'The API listing ended early; events of the pages not '
+                    'fetched are counted as vanished.'
+                )
+            )
+
+    def _index_stored_events(self) -> Dict[str, Tuple]:
+        """Tracked field values of the stored events, by ``event_id``."""
+        rows = (
+            self
+            ._events_in_scope()
+            .values_list('event_id', *TRACKED_FIELDS)
+            .iterator(chunk_size=DRY_RUN_INDEX_CHUNK_SIZE)
+        )
+        return {row[0]: row[1:] for row in rows}
+
+    def _events_in_scope(self) -> QuerySet:
+        """Events of the organizer, or of the default token."""
+        events = Event.objects.order_by()
+        if self.organizer:
+            return events.filter(
+                event_id__startswith=f'{self.organizer.slug}-'
+            )
+        for organizer in load_organizers():
+            events = events.exclude(event_id__startswith=f'{organizer.slug}-')
+        return events
+
+    @staticmethod
+    def _write_diff(
+        output: IO[bytes],
+        created: set[str],
+        updated: Dict[str, List[str]],
+        vanished: set[str],
+    ) -> None:
+        """One NDJSON line per event an import would touch or leave."""
+        entries = [
+            *(
+                {'event_id': event_id, 'diff': 'created'}
+                for event_id in created
+            ),
+            *(
+                {
+                    'event_id': event_id,
+                    'diff': 'updated',
+                    'changed_fields': fields,
+                }
+                for event_id, fields in updated.items()
+            ),
+            *(
+                {'event_id': event_id, 'diff': 'vanished'}
+                for event_id in vanished
+            ),
+        ]
+        for entry in sorted(entries, key=lambda entry: entry['event_id']):
+            output.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+
+    def _open_batch(self, status: Status, **fields: Any) -> None:
+        """Create the batch of this run, or take over the queued one."""
+        if self.organizer:
+            fields['organizer'] = self.organizer.slug
+        if self.batch is None:
+            self.batch = LoadBatch.objects.create(status=status.name, **fields)
+            return
+        self.batch.status = status.name
+        self.batch.started_at = timezone.now()
+        for field, value in fields.items():
+            setattr(self.batch, field, value)
+        self.batch.save()
+
+    def _record_skipped_run(self) -> None:
+        """Record a run skipped because another import holds the lock."""
+        self._open_batch(Status.SKIPPED, finished_at=timezone.now())
+        logger.warning(
+            'Another import is running; batch %s skipped.',
+            self.batch.id,
+            extra={'batch_id': self.batch.id},
+        )
+        self.stdout.write(
+            self.style.WARNING(
+                f'Another import is already running. '
+                f'Batch {self.batch.id} recorded as skipped.'
+            )
+        )
 
     def _start_import_process(self) -> None:
         """Initialize and control the import process flow."""
         self.stdout.write('Starting Sympla events import...')
+        process_events = (
+            self._process_events_pipelined
+            if self.queue_depth
+            else self._process_events
+        )
 
         try:
-            self.batch = LoadBatch.objects.create(status=Status.PENDING.name)
-            logger.info(f'New load batch created: {self.batch.id}')
+            self._open_batch(Status.PENDING)
+            self.archive_cutoff = archive_cutoff()
+            logger.info(
+                'Load batch started: %s',
+                self.batch.id,
+                extra={'batch_id': self.batch.id},
+            )
 
-            self._process_events()
+            process_events()
             self._mark_batch_success()
 
         except Exception as e:
@@ -46,63 +446,357 @@ class Command(BaseCommand):
 
     def _process_events(self) -> None:
         """Fetch and process events from Sympla API."""
-        service = SymplaService()
-        api_events = service.fetch_events()
+        service = SymplaService(stats=self.stats, organizer=self.organizer)
+        api_events = service.fetch_events(on_page=self._save_fetch_progress)
+        self.batch.events_total = len(api_events)
+        self.batch.save(update_fields=['events_total'])
+        with self.stats.measure('db_time'):
+            self._load_existing_events(
+                str(event_data['id'])
+                for event_data in api_events
+                if event_data.get('id') is not None
+            )
+
+        # One transaction per chunk, so the progress saved with it is
+        # visible to the imports API while the batch is still running. The
+        # organizer's write lock keeps webhook flushes from inserting the
+        # same events.
+        for start in range(0, len(api_events), CHUNK_SIZE):
+            with transaction.atomic():
+                lock_events_for_write(self.organizer_slug)
+                for event_data in api_events[start : start + CHUNK_SIZE]:
+                    self._process_single_event(event_data)
+                with self.stats.measure('db_time'):
+                    self._save_changes()
+                    self._save_write_progress()
+            self._log_progress()
 
+    def _save_fetch_progress(self, pagination: Dict[str, Any]) -> None:
+        """Persist the number of pages fetched after each page."""
+        self.batch.pages_fetched = self.stats.pages_fetched
+        self.batch.pages_total = pagination.get('total_page')
+        self.batch.save(update_fields=['pages_fetched', 'pages_total'])
+
+    def _save_write_progress(self) -> None:
+        """Persist the number of events written after each chunk."""
+        self.batch.events_imported_count = self.events_processed_count
+        self.batch.validation_failures_count = self.stats.validation_failures
+        self.batch.save(
+            update_fields=[
+                'events_total',
+                'events_imported_count',
+                'validation_failures_count',
+                'pages_fetched',
+                'pages_total',
+            ]
+        )
+
+    def _load_existing_events(self, event_ids: Iterable[str]) -> None:
+        """Load the current state of the incoming events in one query."""
+        self.existing_events = {
+            row['event_id']: row
+            for row in Event.objects.filter(
+                event_id__in=set(event_ids)
+            ).values('event_id', *TRACKED_FIELDS)
+        }
+
+    def _process_events_pipelined(self) -> None:
+        """
+        Fetch pages in a background thread while the writer, this thread,
+        writes the pages already fetched.
+
+        The fetch thread validates each page and puts it on a queue of
+        ``queue_depth`` pages, blocking while the queue is full, so memory
+        stays bounded whichever stage is slower. It does not touch the
+        database; the writer saves the fetch progress and the events
+        received so far with each page. The time each stage spends blocked
+        on the queue, stored on the batch, shows the bottleneck: a fetcher
+        waiting on a full queue means the database is slower.
+        """
+        pages: Queue = Queue(maxsize=self.queue_depth)
+        stop = threading.Event()
+        fetcher = threading.Thread(
+            target=self._fetch_pages,
+            args=(pages, stop),
+            name='import-fetch',
+            daemon=True,
+        )
+        fetcher.start()
+        events_received = 0
+        try:
+            while True:
+                item = self._next_page(pages, fetcher)
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                events, pagination = item
+                events_received += len(events)
+                self.batch.events_total = self._events_total(events_received)
+                self._write_page(events, pagination)
+        finally:
+            stop.set()
+            fetcher.join()
+            self.batch.events_total = self._events_total(events_received)
+            self._log_pipeline_waits()
+
+    def _events_total(self, events_received: int) -> int:
+        """
+        Events fetched so far by the pipelined import, invalid and archived
+        ones included; the total once the fetch thread is done.
+        """
+        return (
+            events_received
+            + self.stats.validation_failures
+            + self.archived_skipped
+        )
+
+    def _fetch_pages(self, pages: Queue, stop: threading.Event) -> None:
+        """Fetch and validate pages onto ``pages``; runs in a thread."""
+        service = SymplaService(stats=self.stats, organizer=self.organizer)
+        events: List[SymplaEventSchema] = []
+
+        def enqueue(item: Any) -> bool:
+            start = perf_counter()
+            try:
+                while not stop.is_set():
+                    try:
+                        pages.put(item, timeout=PIPELINE_POLL_INTERVAL)
+                        return True
+                    except Full:
+                        continue
+                return False
+            finally:
+                self.fetch_wait += perf_counter() - start
+
+        def on_page(pagination: Dict[str, Any]) -> None:
+            nonlocal events
+            if not enqueue((events, pagination)):
+                raise InterruptedError
+            events = []
+
+        try:
+            for event_data in service.iter_events(on_page=on_page):
+                event = self._validate_event(event_data)
+                if event is not None:
+                    events.append(event)
+        except InterruptedError:
+            return
+        except Exception as e:
+            enqueue(e)
+            return
+        # Events of a page that failed midway, as the sequential import
+        # writes them too.
+        if events:
+            enqueue((events, None))
+        enqueue(None)
+
+    def _next_page(
+        self, pages: Queue, fetcher: threading.Thread
+    ) -> PageChunk | BaseException | None:
+        """The next queued page; ``None`` once the fetch thread is done."""
+        start = perf_counter()
+        try:
+            while True:
+                try:
+                    return pages.get(timeout=PIPELINE_POLL_INTERVAL)
+                except Empty:
+                    if not fetcher.is_alive() and pages.empty():
+                        return None
+        finally:
+            self.write_wait += perf_counter() - start
+
+    def _write_page(
+        self,
+        events: List[SymplaEventSchema],
+        pagination: Dict[str, Any] | None,
+    ) -> None:
+        """Write one page of validated events and the batch progress."""
         with transaction.atomic():
-            for event_data in api_events:
-                self._process_single_event(event_data)
+            lock_events_for_write(self.organizer_slug)
+            with self.stats.measure('db_time'):
+                self._load_existing_events(event.id for event in events)
+            for event in events:
+                self._update_or_create_event(event)
+            with self.stats.measure('db_time'):
+                self._save_changes()
+                if pagination is not None:
+                    self.batch.pages_fetched = self.stats.pages_fetched
+                    self.batch.pages_total = pagination.get('total_page')
+                self._save_write_progress()
+        self._log_progress()
+
+    def _log_pipeline_waits(self) -> None:
+        """Report how long each pipeline stage was blocked on the other."""
+        logger.info(
+            'Batch %s pipeline: fetch waited %.2fs on a full queue, writer '
+            'waited %.2fs for pages.',
+            self.batch.id,
+            self.fetch_wait,
+            self.write_wait,
+            extra={
+                'batch_id': self.batch.id,
+                'fetch_wait': round(self.fetch_wait, 3),
+                'write_wait': round(self.write_wait, 3),
+            },
+        )
+        self.stdout.write(
+            f'Pipeline waits: fetch {self.fetch_wait:.2f}s (writer slower), '
+            f'write {self.write_wait:.2f}s (network slower).'
+        )
 
     def _process_single_event(self, event_data: Dict[str, Any]) -> None:
         """Process and validate a single event."""
-        try:
-            validated_event = SymplaEventSchema.model_validate(event_data)
+        validated_event = self._validate_event(event_data)
+        if validated_event is not None:
             self._update_or_create_event(validated_event)
 
+    def _validate_event(
+        self, event_data: Dict[str, Any]
+    ) -> SymplaEventSchema | None:
+        """
+        Validate an API event, counting and logging failures. Events of
+        archived months are counted and dropped too, so a detached
+        partition is not filled again through the default one.
+        """
+        try:
+            with self.stats.measure('validation_time'):
+                event = SymplaEventSchema.model_validate(event_data)
         except ValidationError as e:
+            self.stats.validation_failures += 1
             self._log_validation_error(event_data, e)
+            return None
+        if is_archived(event.start_date, self.archive_cutoff):
+            self.archived_skipped += 1
+            return None
+        return event
 
     def _update_or_create_event(
         self, validated_event: SymplaEventSchema
     ) -> None:
         """Update or create an event in the database."""
-        event_obj, created = Event.objects.update_or_create(
-            event_id=validated_event.id,
-            defaults=self._build_event_defaults(validated_event),
-        )
+        defaults = self._build_event_defaults(validated_event)
+        with self.stats.measure('db_time'):
+            event_obj, created = Event.objects.update_or_create(
+                event_id=validated_event.id,
+                defaults=defaults,
+            )
 
         self.events_processed_count += 1
+        self._record_change(validated_event.id, defaults)
         self._log_event_operation(event_obj, created)
 
+    def _record_change(self, event_id: str, defaults: Dict[str, Any]) -> None:
+        """Queue a change log entry if the event is new or was modified."""
+        current = {
+            field: self._normalize(defaults[field]) for field in TRACKED_FIELDS
+        }
+        previous = self.existing_events.get(event_id)
+        self.existing_events[event_id] = current
+
+        if previous is None:
+            kind, changed_fields = ChangeKind.CREATED, list(TRACKED_FIELDS)
+        else:
+            changed_fields = [
+                field
+                for field in TRACKED_FIELDS
+                if previous[field] != current[field]
+            ]
+            if not changed_fields:
+                return
+            kind = ChangeKind.UPDATED
+
+        self.changes.append(
+            EventChange(
+                load_batch=self.batch,
+                event_id=event_id,
+                kind=kind.name,
+                changed_fields=changed_fields,
+            )
+        )
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        """Make naive datetimes aware so they compare with stored values."""
+        if isinstance(value, datetime) and timezone.is_naive(value):
+            return timezone.make_aware(value)
+        return value
+
+    def _save_changes(self) -> None:
+        """Write the queued change log entries in bulk."""
+        EventChange.objects.bulk_create(
+            self.changes, batch_size=CHANGE_LOG_BATCH_SIZE
+        )
+        logger.debug(
+            'Recorded %d event changes for batch %s.',
+            len(self.changes),
+            self.batch.id,
+        )
+        self.changes = []
+
     def _build_event_defaults(
         self, event: SymplaEventSchema
     ) -> Dict[str, Any]:
         """Build dictionary of event attributes for update_or_create."""
-        return {
-            'name': event.name,
-            'start_date': event.start_date,
-            'end_date': event.end_date,
-            'event_type': event.event_type,
-            'venue_name': event.address.name,
-            'city': event.address.city,
-            'category': event.category_prim,
-            'sub_category': event.category_sec,
-            'load_batch': self.batch,
-        }
+        return {**event.to_event_fields(), 'load_batch': self.batch}
 
-    def _log_event_operation(self, event: Event, created: bool) -> None:  # noqa: PLR6301
-        """Log event creation or update."""
-        action = 'created' if created else 'updated'
-        logger.info(f'Event {action}: {event.name}')
+    def _log_event_operation(self, event: Event, created: bool) -> None:
+        """Count the operation and log a sample of individual events."""
+        self.events_created_count += created
+        count = self.events_processed_count
 
-    def _log_validation_error(  # noqa: PLR6301
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'Event %s: %s', 'created' if created else 'updated', event.name
+            )
+        elif count % EVENT_LOG_SAMPLE_RATE == 1:
+            logger.info(
+                'Event %s: %s (sampled 1 in %d)',
+                'created' if created else 'updated',
+                event.name,
+                EVENT_LOG_SAMPLE_RATE,
+            )
+
+    def _log_progress(self) -> None:
+        """Log a structured summary of the events processed so far."""
+        created = self.events_created_count
+        updated = self.events_processed_count - created
+        failures = self.stats.validation_failures
+        logger.info(
+            'Batch %s progress: %d events processed '
+            '(%d created, %d updated, %d validation failures).',
+            self.batch.id,
+            self.events_processed_count,
+            created,
+            updated,
+            failures,
+            extra={
+                'batch_id': self.batch.id,
+                'events_processed': self.events_processed_count,
+                'events_created': created,
+                'events_updated': updated,
+                'validation_failures': failures,
+            },
+        )
+
+    def _log_validation_error(
         self, event_data: Dict[str, Any], error: ValidationError
     ) -> None:
-        """Log validation errors for problematic events."""
-        event_id = event_data.get('id', 'N/A')
+        """Log the first validation errors in detail, then only count."""
+        failures = self.stats.validation_failures
+        if failures > VALIDATION_ERROR_LOG_LIMIT:
+            if failures == VALIDATION_ERROR_LOG_LIMIT + 1:
+                logger.warning(
+                    'Validation error limit (%d) reached; further failures '
+                    'are only counted in the batch summary.',
+                    VALIDATION_ERROR_LOG_LIMIT,
+                )
+            return
         logger.warning(
-            'Skipping event due to validation error. '
-            f'ID: {event_id}. Details: {error.json()}'
+            'Skipping event due to validation error. ID: %s. Details: %s',
+            event_data.get('id', 'N/A'),
+            error.json(),
+            extra={'event_id': event_data.get('id')},
         )
 
     def _mark_batch_success(self) -> None:
@@ -115,26 +809,58 @@ class Command(BaseCommand):
 
     def _handle_import_error(self, error: Exception) -> None:
         """Handle errors during the import process."""
-        if self.batch:
-            self.batch.status = Status.ERROR.name
-            logger.error(
-                f'An error occurred during import for batch {self.batch.id}:'
-                f'{error}',
-                exc_info=True,
-            )
-            self.stdout.write(
-                self.style.ERROR('Import failed. Check logs for details.')
-            )
+        if self.batch is None:
+            # Failed before a batch recorded the run, e.g. on a database
+            # error; fail the command so its exit code tells.
+            raise CommandError(f'Import failed: {error}') from error
+        self.batch.status = Status.ERROR.name
+        logger.error(
+            'An error occurred during import for batch %s: %s',
+            self.batch.id,
+            error,
+            exc_info=True,
+            extra={'batch_id': self.batch.id},
+        )
+        self.stdout.write(
+            self.style.ERROR('Import failed. Check logs for details.')
+        )
 
     def _finalize_batch(self) -> None:
-        """Finalize the batch by setting completion timestamp and count."""
+        """Finalize the batch by setting completion timestamp and metrics."""
         if self.batch:
             self.batch.finished_at = timezone.now()
             self.batch.events_imported_count = self.events_processed_count
-            self.batch.save()
+            self._apply_stats()
+            with transaction.atomic():
+                self.batch.save()
+                record_finished_import(self.batch)
 
             self.stdout.write(
                 f'Batch {self.batch.id} finished with status '
                 f"'{self.batch.status}'. "
-                f'{self.events_processed_count} events processed.'
+                f'{self.events_processed_count} events processed. '
+                f'{self.stats.summary(self.batch.rows_per_second)}'
             )
+            if self.archived_skipped:
+                self.stdout.write(
+                    f'{self.archived_skipped} events of archived months '
+                    f'skipped.'
+                )
+
+    def _apply_stats(self) -> None:
+        """Copy the collected import metrics onto the batch."""
+        elapsed = (
+            self.batch.finished_at - self.batch.started_at
+        ).total_seconds()
+        self.batch.pages_fetched = self.stats.pages_fetched
+        self.batch.bytes_downloaded = self.stats.bytes_downloaded
+        self.batch.http_responses = self.stats.http_responses
+        self.batch.http_time = self.stats.http_time
+        self.batch.validation_time = self.stats.validation_time
+        self.batch.db_time = self.stats.db_time
+        self.batch.fetch_wait = self.fetch_wait
+        self.batch.write_wait = self.write_wait
+        self.batch.validation_failures_count = self.stats.validation_failures
+        self.batch.rows_per_second = self.stats.rate(
+            self.events_processed_count, elapsed
+        )
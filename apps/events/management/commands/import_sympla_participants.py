@@ -0,0 +1,368 @@
+import logging
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from decouple import config
+from django.conf import settings
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q, QuerySet
+from django.utils import timezone
+from pydantic import BaseModel, ValidationError
+
+from apps.events.locks import IMPORT_LOCK_NAME, import_lock
+from apps.events.models import (
+    Event,
+    EventChange,
+    EventOrder,
+    EventParticipant,
+    EventSalesSync,
+)
+from apps.events.schemas import SymplaOrderSchema, SymplaParticipantSchema
+from apps.events.services import (
+    Organizer,
+    SymplaService,
+    find_organizer,
+    load_organizers,
+)
+from apps.events.stats import ImportStats
+
+logger = logging.getLogger(__name__)
+
+# (event pk, event id, orders, participants); the lists are None when the
+# requests of that event failed.
+EventSales = Tuple[int, str, List[Dict] | None, List[Dict] | None]
+
+# Results are written every WRITE_CHUNK_SIZE events in one transaction;
+# rows are inserted BULK_BATCH_SIZE at a time.
+WRITE_CHUNK_SIZE = 100
+BULK_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    """Command to import the orders and participants of Sympla events."""
+
+    help = (
+        'Fetches the orders and participants of each event from the Sympla '
+        'API, skipping events that have not changed since their last sync.'
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.organizer: Organizer | None = None
+        self.rate_limit = 0.0
+        self.stats = ImportStats()
+        self.thread_stats: List[ImportStats] = []
+        self.local = threading.local()
+        self.synced_count = 0
+        self.failed_count = 0
+        self.orders_count = 0
+        self.participants_count = 0
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument(
+            '--organizer',
+            default=None,
+            help='Import the sales of one organizer of SYMPLA_ORGANIZERS.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.SALES_IMPORT_WORKERS,
+            help='Events fetched concurrently.',
+        )
+        parser.add_argument(
+            '--max-age',
+            type=int,
+            default=settings.SALES_SYNC_MAX_AGE,
+            help=(
+                'Seconds after which the sales of an event not yet over are '
+                're-synced even if the event did not change.'
+            ),
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Sync every event, changed or not.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        lock_name = f'{IMPORT_LOCK_NAME}:sales'
+        if options['organizer']:
+            self.organizer = find_organizer(options['organizer'])
+            if self.organizer is None:
+                raise CommandError(
+                    f'Organizer {options["organizer"]!r} is not in '
+                    'SYMPLA_ORGANIZERS.'
+                )
+            lock_name = f'{lock_name}:{self.organizer.slug}'
+
+        with import_lock(lock_name) as acquired:
+            if not acquired:
+                self.stdout.write(
+                    self.style.WARNING(
+                        'Another participants import is already running.'
+                    )
+                )
+                return
+            self._import_sales(options)
+
+    def _import_sales(self, options: Dict[str, Any]) -> None:
+        """Fetch the sales of the events to sync and write them in bulk."""
+        started_at = timezone.now()
+        workers = max(options['workers'], 1)
+        # Each worker has its own session; split the rate limit among them.
+        self.rate_limit = (
+            config('SYMPLA_RATE_LIMIT', default=0.0, cast=float) / workers
+        )
+        scope = self._events_in_scope()
+        pending_events = self._events_to_sync(
+            scope, options['max_age'], options['force']
+        )
+        events = list(pending_events.values_list('pk', 'event_id'))
+        skipped_count = scope.count() - len(events)
+        self.stdout.write(
+            f'Syncing the sales of {len(events)} events '
+            f'({skipped_count} unchanged skipped) with {workers} workers...'
+        )
+
+        chunk: List[EventSales] = []
+        for sales in self._fetch_concurrently(events, workers):
+            chunk.append(sales)
+            if len(chunk) >= WRITE_CHUNK_SIZE:
+                self._write_sales(chunk, started_at)
+                chunk = []
+        self._write_sales(chunk, started_at)
+
+        for stats in self.thread_stats:
+            self.stats.add(stats)
+        elapsed = (timezone.now() - started_at).total_seconds()
+        rows = self.orders_count + self.participants_count
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{self.synced_count} events synced, {skipped_count} '
+                f'skipped, {self.failed_count} failed: '
+                f'{self.orders_count} orders, '
+                f'{self.participants_count} participants. '
+                f'{self.stats.summary(self.stats.rate(rows, elapsed))}'
+            )
+        )
+
+    def _events_in_scope(self) -> QuerySet:
+        """Events of the organizer, or of the default token."""
+        events = Event.objects.order_by()
+        if self.organizer:
+            return events.filter(
+                event_id__startswith=f'{self.organizer.slug}-'
+            )
+        for organizer in load_organizers():
+            events = events.exclude(event_id__startswith=f'{organizer.slug}-')
+        return events
+
+    @staticmethod
+    def _events_to_sync(
+        events: QuerySet, max_age: int, force: bool
+    ) -> QuerySet:
+        """
+        Keep events never synced, changed by a batch finished after their
+        last sync, or not over at their last sync and synced more than
+        ``max_age`` seconds ago. Sales of finished events no longer change.
+        """
+        if force:
+            return events
+        changed = EventChange.objects.filter(
+            event_id=OuterRef('event_id'),
+            load_batch__finished_at__gt=OuterRef('sales_sync__synced_at'),
+        )
+        stale_before = timezone.now() - timedelta(seconds=max_age)
+        return events.filter(
+            Q(sales_sync__isnull=True)
+            | Exists(changed)
+            | (
+                Q(sales_sync__synced_at__lt=F('end_date'))
+                & Q(sales_sync__synced_at__lt=stale_before)
+            )
+        )
+
+    def _fetch_concurrently(
+        self, events: List[Tuple[int, str]], workers: int
+    ) -> Iterable[EventSales]:
+        """
+        Fetch the sales of ``events`` on a pool of ``workers`` threads,
+        yielding them as they complete. At most two requests per worker are
+        in flight, so results never pile up faster than they are written.
+        """
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='sales'
+        ) as pool:
+            in_flight: set[Future] = set()
+            for pk, event_id in events:
+                if len(in_flight) >= workers * 2:
+                    done, in_flight = wait(
+                        in_flight, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        yield future.result()
+                in_flight.add(pool.submit(self._fetch_sales, pk, event_id))
+            for future in wait(in_flight).done:
+                yield future.result()
+
+    def _fetch_sales(self, pk: int, event_id: str) -> EventSales:
+        """Fetch the orders and participants of one event; runs in a worker."""
+        service = self._get_service()
+        sympla_id = event_id
+        if self.organizer:
+            sympla_id = event_id.removeprefix(f'{self.organizer.slug}-')
+        orders = service.fetch_event_resource(sympla_id, 'orders')
+        if orders is None:
+            return pk, event_id, None, None
+        participants = service.fetch_event_resource(sympla_id, 'participants')
+        return pk, event_id, orders, participants
+
+    def _get_service(self) -> SymplaService:
+        """The Sympla service of the current worker thread."""
+        service = getattr(self.local, 'service', None)
+        if service is None:
+            stats = ImportStats()
+            self.thread_stats.append(stats)
+            service = SymplaService(
+                stats=stats,
+                organizer=self.organizer,
+                rate_limit=self.rate_limit,
+            )
+            self.local.service = service
+        return service
+
+    def _write_sales(
+        self, chunk: List[EventSales], synced_at: datetime
+    ) -> None:
+        """Replace the orders and participants of a chunk of events."""
+        orders, participants, syncs = [], [], []
+        for pk, event_id, order_data, participant_data in chunk:
+            if order_data is None or participant_data is None:
+                self.failed_count += 1
+                logger.warning(
+                    'Could not fetch the sales of event %s.',
+                    event_id,
+                    extra={'event_id': event_id},
+                )
+                continue
+            event_orders = [
+                self._build_order(pk, order)
+                for order in self._validate(SymplaOrderSchema, order_data)
+            ]
+            event_participants = [
+                self._build_participant(pk, participant)
+                for participant in self._validate(
+                    SymplaParticipantSchema, participant_data
+                )
+            ]
+            orders.extend(event_orders)
+            participants.extend(event_participants)
+            syncs.append(
+                EventSalesSync(
+                    event_id=pk,
+                    synced_at=synced_at,
+                    orders_count=len(event_orders),
+                    participants_count=len(event_participants),
+                )
+            )
+        if not syncs:
+            return
+
+        synced_pks = [sync.event_id for sync in syncs]
+        with self.stats.measure('db_time'), transaction.atomic():
+            EventOrder.objects.filter(event__in=synced_pks).delete()
+            EventParticipant.objects.filter(event__in=synced_pks).delete()
+            EventOrder.objects.bulk_create(orders, batch_size=BULK_BATCH_SIZE)
+            EventParticipant.objects.bulk_create(
+                participants, batch_size=BULK_BATCH_SIZE
+            )
+            EventSalesSync.objects.bulk_create(
+                syncs,
+                update_conflicts=True,
+                unique_fields=['event'],
+                update_fields=[
+                    'synced_at',
+                    'orders_count',
+                    'participants_count',
+                ],
+            )
+
+        self.synced_count += len(syncs)
+        self.orders_count += len(orders)
+        self.participants_count += len(participants)
+        logger.info(
+            'Sales progress: %d events synced (%d orders, %d participants).',
+            self.synced_count,
+            self.orders_count,
+            self.participants_count,
+            extra={
+                'events_synced': self.synced_count,
+                'orders': self.orders_count,
+                'participants': self.participants_count,
+            },
+        )
+
+    def _validate(
+        self, schema: Type[BaseModel], items: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """Validate ``items``, counting and skipping the invalid ones."""
+        valid = []
+        with self.stats.measure('validation_time'):
+            for item in items:
+                try:
+                    valid.append(schema.model_validate(item))
+                except ValidationError as e:
+                    self.stats.validation_failures += 1
+                    logger.debug(
+                        'Skipping %s %s: %s',
+                        schema.__name__,
+                        item.get('id', 'N/A'),
+                        e.json(),
+                    )
+        return valid
+
+    @classmethod
+    def _build_order(cls, pk: int, order: SymplaOrderSchema) -> EventOrder:
+        return EventOrder(
+            event_id=pk,
+            order_id=order.id,
+            status=order.order_status,
+            order_date=cls._aware(order.order_date),
+            transaction_type=order.transaction_type or '',
+            total_sale_price=order.order_total_sale_price,
+        )
+
+    @staticmethod
+    def _build_participant(
+        pk: int, participant: SymplaParticipantSchema
+    ) -> EventParticipant:
+        return EventParticipant(
+            event_id=pk,
+            participant_id=participant.id,
+            order_id=participant.order_id,
+            ticket_number=participant.ticket_number or '',
+            ticket_name=participant.ticket_name or '',
+            ticket_sale_price=participant.ticket_sale_price,
+            checked_in=participant.checked_in,
+        )
+
+    @staticmethod
+    def _aware(value: datetime) -> datetime:
+        """Sympla sends naive local datetimes; store them as aware."""
+        if timezone.is_naive(value):
+            return timezone.make_aware(value)
+        return value
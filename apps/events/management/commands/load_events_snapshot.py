@@ -0,0 +1,59 @@
+import logging
+from time import perf_counter
+from typing import Any
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from apps.events.snapshots import (
+    SnapshotError,
+    describe_counts,
+    load_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command to load a snapshot written by export_events_snapshot."""
+
+    help = (
+        'Loads the events and load batches of a snapshot, keeping their ids, '
+        'with COPY on PostgreSQL and executemany on SQLite.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument('path', help='Snapshot file to load.')
+        parser.add_argument(
+            '--replace',
+            action='store_true',
+            help=(
+                'Delete the stored events, load batches, change log and '
+                'sales before loading.'
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        start = perf_counter()
+        try:
+            with open(options['path'], 'rb') as source:
+                counts = load_snapshot(source, replace=options['replace'])
+        except SnapshotError as e:
+            raise CommandError(str(e)) from e
+        elapsed = perf_counter() - start
+        logger.info(
+            'Snapshot %s loaded in %.2fs.',
+            options['path'],
+            elapsed,
+            extra={'counts': counts},
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{describe_counts(counts)} loaded from '
+                f'{options["path"]} in {elapsed:.2f}s.'
+            )
+        )
@@ -0,0 +1,225 @@
+import logging
+import random
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+import requests
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from apps.events.models import Event, LoadBatch
+from utils.enums import BatchSource, EventType, Status
+
+logger = logging.getLogger(__name__)
+
+SEED_PREFIX = 'loadtest-'
+SEED_FIRST_DATE = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+SEED_BATCH_SIZE = 2000
+
+Params = Dict[str, Any]
+
+
+def first_page(rng: random.Random, total: int) -> Params:
+    return {'limit': 20}
+
+
+def deep_page(rng: random.Random, total: int) -> Params:
+    return {'limit': 20, 'offset': rng.randrange(max(total, 1))}
+
+
+def large_page(rng: random.Random, total: int) -> Params:
+    return {'limit': 100}
+
+
+def date_range(rng: random.Random, total: int) -> Params:
+    start = SEED_FIRST_DATE + timedelta(hours=rng.randrange(max(total, 1)))
+    return {
+        'limit': 20,
+        'start_date_after': start.isoformat(),
+        'start_date_before': (start + timedelta(days=30)).isoformat(),
+    }
+
+
+# Scenario name -> (weight, query parameter factory).
+SCENARIOS: Dict[str, Tuple[int, Callable[[random.Random, int], Params]]] = {
+    'first_page': (50, first_page),
+    'deep_page': (20, deep_page),
+    'large_page': (10, large_page),
+    'date_range': (20, date_range),
+}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class Command(BaseCommand):
+    """Command to load test the events API with a realistic request mix."""
+
+    help = (
+        'Seeds synthetic events and hits /api/events/ with a mix of '
+        'limit/offset/filter requests at a target concurrency, reporting '
+        'p50/p95/p99 latency and requests per second.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument(
+            '--url',
+            default='http://localhost:8000',
+            help='Base URL of the deployment under test.',
+        )
+        parser.add_argument(
+            '--seed-events',
+            type=int,
+            default=0,
+            help='Create this many synthetic events before the run.',
+        )
+        parser.add_argument(
+            '--cleanup',
+            action='store_true',
+            help='Delete the synthetic events and batches after the run.',
+        )
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=1000,
+            help='Total number of requests to send.',
+        )
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        if options['seed_events']:
+            self._seed_events(options['seed_events'])
+
+        try:
+            total = Event.objects.count()
+            results, elapsed = self._run(options, total)
+            self._report(results, elapsed, options['concurrency'])
+        finally:
+            if options['cleanup']:
+                self._cleanup()
+
+    def _seed_events(self, count: int) -> None:
+        """Bulk create synthetic events, one hour apart."""
+        batch = LoadBatch.objects.create(
+            status=Status.SUCCESS.name, source=BatchSource.LOAD_TEST.name
+        )
+        offset = Event.objects.filter(event_id__startswith=SEED_PREFIX).count()
+        Event.objects.bulk_create(
+            (
+                self._build_event(offset + index, batch)
+                for index in range(count)
+            ),
+            batch_size=SEED_BATCH_SIZE,
+        )
+        self.stdout.write(f'{count} synthetic events seeded.')
+
+    @staticmethod
+    def _build_event(number: int, batch: LoadBatch) -> Event:
+        start = SEED_FIRST_DATE + timedelta(hours=number)
+        return Event(
+            event_id=f'{SEED_PREFIX}{number}',
+            name=f'Load test event {number}',
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            event_type=EventType.ONLINE.name,
+            category='Load test',
+            sub_category=f'Group {number % 10}',
+            load_batch=batch,
+        )
+
+    def _cleanup(self) -> None:
+        """
+        Delete the synthetic events and the batches that seeded them.
+
+        Nothing references this data, so plain DELETEs are issued instead
+        of the ORM delete, which would first load every row to collect
+        cascades and send signals.
+        """
+        with transaction.atomic():
+            deleted = Event.objects.filter(
+                event_id__startswith=SEED_PREFIX
+            )._raw_delete(Event.objects.db)
+            LoadBatch.objects.filter(
+                source=BatchSource.LOAD_TEST.name
+            )._raw_delete(LoadBatch.objects.db)
+        self.stdout.write(f'{deleted} synthetic events removed.')
+
+    def _run(  # noqa: PLR6301
+        self, options: Dict[str, Any], total: int
+    ) -> Tuple[Dict[str, List[Tuple[float, bool]]], float]:
+        """Send the request mix concurrently and collect latencies."""
+        rng = random.Random(options['seed'])
+        names = list(SCENARIOS)
+        weights = [SCENARIOS[name][0] for name in names]
+        plan = [
+            (name, SCENARIOS[name][1](rng, total))
+            for name in rng.choices(names, weights, k=options['requests'])
+        ]
+
+        url = f'{options["url"].rstrip("/")}/api/events/'
+        local = threading.local()
+
+        def send(item: Tuple[str, Params]) -> Tuple[str, float, bool]:
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+            name, params = item
+            start = perf_counter()
+            try:
+                response = local.session.get(url, params=params, timeout=30)
+                ok = response.status_code == requests.codes.ok
+            except requests.RequestException:
+                ok = False
+            return name, perf_counter() - start, ok
+
+        results: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            for name, latency, ok in pool.map(send, plan):
+                results[name].append((latency, ok))
+        return results, perf_counter() - start
+
+    def _report(
+        self,
+        results: Dict[str, List[Tuple[float, bool]]],
+        elapsed: float,
+        concurrency: int,
+    ) -> None:
+        """Print latency percentiles per scenario and overall."""
+        self.stdout.write(
+            f'{"scenario":<12} {"requests":>8} {"errors":>6} '
+            f'{"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}'
+        )
+        everything = []
+        for name in SCENARIOS:
+            samples = results.get(name, [])
+            everything.extend(samples)
+            self.stdout.write(self._format_row(name, samples))
+        self.stdout.write(self._format_row('all', everything))
+
+        rps = len(everything) / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f'{len(everything)} requests in {elapsed:.2f}s at concurrency '
+            f'{concurrency}: {rps:.1f} requests/s.'
+        )
+
+    @staticmethod
+    def _format_row(name: str, samples: List[Tuple[float, bool]]) -> str:
+        latencies = sorted(latency * 1000 for latency, _ in samples)
+        errors = sum(1 for _, ok in samples if not ok)
+        p50, p95, p99 = (percentile(latencies, pct) for pct in (50, 95, 99))
+        return (
+            f'{name:<12} {len(samples):>8} {errors:>6} '
+            f'{p50:>8.1f} {p95:>8.1f} {p99:>8.1f}'
+        )
@@ -0,0 +1,104 @@
+import logging
+from datetime import date
+from typing import Any
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.utils import timezone
+
+from apps.events import partitions
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command to maintain the monthly partitions of the events table."""
+
+    help = (
+        'Partitions the events table by start_date month (PostgreSQL only), '
+        'creates upcoming partitions and detaches or archives old ones.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument(
+            '--convert',
+            action='store_true',
+            help='Convert the events table to a partitioned table first.',
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Number of future monthly partitions to keep created.',
+        )
+        parser.add_argument(
+            '--retain-months',
+            type=int,
+            default=None,
+            help='Detach partitions older than this many months.',
+        )
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Drop detached partitions instead of archiving them.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        if not partitions.is_supported():
+            raise CommandError('Event partitioning requires PostgreSQL.')
+
+        if options['convert'] and not partitions.is_partitioned():
+            copied = partitions.convert_to_partitioned()
+            self.stdout.write(
+                f'Events table partitioned ({copied} rows copied).'
+            )
+
+        if not partitions.is_partitioned():
+            raise CommandError(
+                'Events table is not partitioned. Run with --convert first.'
+            )
+
+        current = partitions.month_start(timezone.now().date())
+        self._create_partitions(current, options['months_ahead'])
+
+        if options['retain_months'] is not None:
+            self._detach_partitions(
+                current, options['retain_months'], options['drop']
+            )
+
+    def _create_partitions(self, current: date, months_ahead: int) -> None:
+        """Make sure partitions exist from this month up to the horizon."""
+        created = 0
+        for offset in range(months_ahead + 1):
+            month = partitions.add_months(current, offset)
+            created += partitions.create_partition(month)
+        self.stdout.write(f'{created} partitions created.')
+
+    def _detach_partitions(
+        self, current: date, retain_months: int, drop: bool
+    ) -> None:
+        """
+        Detach every partition older than the retention window. Events of
+        those months sitting in the default partition are first moved
+        into a partition of their month, so they are archived too.
+        """
+        cutoff = partitions.add_months(current, -retain_months)
+        months = {
+            *partitions.list_partitions(),
+            *partitions.default_partition_months(),
+        }
+        for month in sorted(months):
+            if month >= cutoff:
+                continue
+            partitions.create_partition(month)
+            archived = partitions.detach_partition(month, drop=drop)
+            name = partitions.partition_name(month)
+            self.stdout.write(
+                f'Partition {name} archived as {archived}.'
+                if archived
+                else f'Partition {name} dropped.'
+            )
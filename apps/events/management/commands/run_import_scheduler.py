@@ -0,0 +1,115 @@
+import logging
+import random
+import signal
+import threading
+from time import monotonic
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Long-running command that imports Sympla events on an interval."""
+
+    help = (
+        'Starts import_sympla_events every --interval seconds plus a random '
+        'jitter, counted from the start of the previous run. Overlapping '
+        'runs across processes or containers are skipped by the import lock.'
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stop_event = threading.Event()
+        self.import_options: Dict[str, Any] = {}
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=settings.IMPORT_INTERVAL,
+            help='Seconds between the start of consecutive imports.',
+        )
+        parser.add_argument(
+            '--jitter',
+            type=int,
+            default=settings.IMPORT_JITTER,
+            help='Maximum random seconds added to each wait.',
+        )
+        parser.add_argument(
+            '--max-runs',
+            type=int,
+            default=None,
+            help='Exit after this many runs (runs forever by default).',
+        )
+        parser.add_argument(
+            '--all-organizers',
+            action='store_true',
+            help='Import all organizers of SYMPLA_ORGANIZERS on each run.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        previous_handlers = self._install_signal_handlers()
+        interval, jitter = options['interval'], options['jitter']
+        if options['all_organizers']:
+            self.import_options['all_organizers'] = True
+        self.stdout.write(
+            f'Import scheduler started (interval {interval}s, '
+            f'jitter up to {jitter}s).'
+        )
+
+        runs = 0
+        try:
+            while not self.stop_event.is_set():
+                started = monotonic()
+                self._run_import()
+                runs += 1
+                if (
+                    options['max_runs'] is not None
+                    and runs >= options['max_runs']
+                ):
+                    break
+                # Count the interval from the start of the run, so imports
+                # don't drift by their own duration; one that outlasted the
+                # interval is followed right away (after the jitter).
+                remaining = max(interval - (monotonic() - started), 0)
+                delay = remaining + random.uniform(0, jitter)  # noqa: S311
+                logger.info('Next import in %.0f seconds.', delay)
+                self.stop_event.wait(delay)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write('Import scheduler stopped.')
+
+    def _run_import(self) -> None:
+        """Run one import, keeping the daemon alive if it crashes."""
+        close_old_connections()
+        try:
+            call_command(
+                'import_sympla_events',
+                stdout=self.stdout,
+                **self.import_options,
+            )
+        except Exception:
+            logger.exception('Scheduled import crashed.')
+        finally:
+            close_old_connections()
+
+    def _install_signal_handlers(self) -> Dict[int, Any]:
+        """Stop after the current run on SIGTERM/SIGINT."""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        return {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+    def _request_stop(self, signum, frame) -> None:
+        logger.info('Signal %s received; stopping scheduler.', signum)
+        self.stop_event.set()
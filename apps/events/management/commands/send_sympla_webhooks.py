@@ -0,0 +1,128 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
+
+import orjson
+import requests
+from django.conf import settings
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from apps.events.management.commands.loadtest_events_api import percentile
+from apps.events.webhooks import SIGNATURE_HEADER, sign
+from benchmarks.fake_sympla import build_event
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command acting as Sympla to exercise the webhook receiver."""
+
+    help = (
+        'Sends signed event notifications to /api/webhooks/sympla/ at a '
+        'target concurrency, reporting latency percentiles. Notifications '
+        'cycle over --distinct events, so repeats exercise deduplication.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: PLR6301
+        parser.add_argument(
+            '--url',
+            default='http://localhost:8000',
+            help='Base URL of the deployment under test.',
+        )
+        parser.add_argument(
+            '--events',
+            type=int,
+            default=1000,
+            help='Total number of event notifications to send.',
+        )
+        parser.add_argument(
+            '--distinct',
+            type=int,
+            default=100,
+            help='Number of distinct events the notifications refer to.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10,
+            help='Events per request.',
+        )
+        parser.add_argument('--concurrency', type=int, default=4)
+        parser.add_argument(
+            '--secret',
+            default=None,
+            help='Signing secret (default: SYMPLA_WEBHOOK_SECRET).',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution handler."""
+        secret = options['secret'] or settings.SYMPLA_WEBHOOK_SECRET
+        if not secret:
+            raise CommandError(
+                'Set SYMPLA_WEBHOOK_SECRET or pass --secret to sign requests.'
+            )
+        bodies = self._build_bodies(options)
+        url = f'{options["url"].rstrip("/")}/api/webhooks/sympla/'
+        local = threading.local()
+
+        def send(body: bytes) -> Tuple[float, bool]:
+            if not hasattr(local, 'session'):
+                local.session = requests.Session()
+            start = perf_counter()
+            try:
+                response = local.session.post(
+                    url,
+                    data=body,
+                    headers={
+                        'Content-Type': 'application/json',
+                        SIGNATURE_HEADER: sign(body, secret),
+                    },
+                    timeout=30,
+                )
+                ok = response.status_code == requests.codes.accepted
+            except requests.RequestException:
+                ok = False
+            return perf_counter() - start, ok
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            results = list(pool.map(send, bodies))
+        self._report(results, perf_counter() - start, options['events'])
+
+    @staticmethod
+    def _build_bodies(options: Dict[str, Any]) -> List[bytes]:
+        """Request bodies, each carrying up to ``batch_size`` events."""
+        events = []
+        for number in range(options['events']):
+            event = build_event(0, number % options['distinct'])
+            event['id'] = f'webhook-{number % options["distinct"]}'
+            event['name'] = f'{event["name"]} (revision {number})'
+            events.append(event)
+        size = max(options['batch_size'], 1)
+        return [
+            orjson.dumps(events[index : index + size])
+            for index in range(0, len(events), size)
+        ]
+
+    def _report(
+        self, results: List[Tuple[float, bool]], elapsed: float, events: int
+    ) -> None:
+        """Print latency percentiles and throughput."""
+        latencies = sorted(latency * 1000 for latency, _ in results)
+        errors = sum(not ok for _, ok in results)
+        self.stdout.write(
+            f'{len(results)} requests, {errors} errors, '
+            f'p50 {percentile(latencies, 50):.1f} ms, '
+            f'p95 {percentile(latencies, 95):.1f} ms, '
+            f'p99 {percentile(latencies, 99):.1f} ms.'
+        )
+        rate = events / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f'{events} events sent in {elapsed:.2f}s: {rate:.1f} events/s.'
+        )
@@ -0,0 +1,164 @@
+import os
+
+from django.db.models import F, Sum
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from apps.events.models import ImportTotal, LoadBatch
+from utils.enums import BatchSource, Status
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request latency per route.',
+    ['route', 'method', 'status'],
+)
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'Number of SQL queries executed per request.',
+    ['route'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+REQUEST_DB_TIME = Histogram(
+    'http_request_db_duration_seconds',
+    'Time spent in SQL queries per request.',
+    ['route'],
+)
+CACHE_LOOKUPS = Counter(
+    'cache_lookups_total',
+    'Cache lookups by cache name and result (hit or miss).',
+    ['cache', 'result'],
+)
+WEBHOOK_EVENTS = Counter(
+    'sympla_webhook_events_total',
+    'Webhook event notifications by result (accepted, rejected, written, '
+    'dropped).',
+    ['result'],
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache lookup so hit ratios can be derived per cache."""
+    CACHE_LOOKUPS.labels(cache=cache, result='hit' if hit else 'miss').inc()
+
+
+def record_webhook_events(result: str, count: int) -> None:
+    """Count webhook event notifications by what became of them."""
+    WEBHOOK_EVENTS.labels(result=result).inc(count)
+
+
+def record_finished_import(batch: LoadBatch) -> None:
+    """
+    Add a finished import batch to the running totals read by /metrics.
+
+    Called when the batch is saved with its final status, in the same
+    transaction, so a scrape costs a few rows however many batches exist.
+    """
+    amounts = [('events_written', batch.status, batch.events_imported_count)]
+    amounts.extend(
+        ('sympla_http_responses', status, count)
+        for status, count in batch.http_responses.items()
+    )
+    for metric, label, amount in amounts:
+        ImportTotal.objects.get_or_create(metric=metric, label=label)
+        ImportTotal.objects.filter(metric=metric, label=label).update(
+            value=F('value') + amount
+        )
+
+
+class LoadBatchCollector:
+    """
+    Exposes importer metrics straight from the database.
+
+    Reading them at scrape time keeps them correct no matter which process
+    or container ran the import, such as the scheduler's, whose in-process
+    counters the web workers never see. Totals come from ``ImportTotal``
+    rows kept up to date as batches finish, plus the running batches.
+    """
+
+    def collect(self):  # noqa: PLR6301
+        # Webhook micro-batches are reported by sympla_webhook_events_total.
+        batches = LoadBatch.objects.filter(source=BatchSource.IMPORT.name)
+        last_batch = (
+            batches
+            .filter(finished_at__isnull=False)
+            .order_by('-finished_at')
+            .first()
+        )
+        duration = GaugeMetricFamily(
+            'importer_last_batch_duration_seconds',
+            'Wall time of the most recent finished import batch.',
+        )
+        last_events = GaugeMetricFamily(
+            'importer_last_batch_events_written',
+            'Events written by the most recent finished import batch.',
+        )
+        if last_batch:
+            duration.add_metric(
+                [],
+                (
+                    last_batch.finished_at - last_batch.started_at
+                ).total_seconds(),
+            )
+            last_events.add_metric([], last_batch.events_imported_count)
+        yield duration
+        yield last_events
+
+        totals = {
+            (metric, label): value
+            for metric, label, value in ImportTotal.objects.values_list(
+                'metric', 'label', 'value'
+            )
+        }
+        running = batches.filter(status=Status.PENDING.name).aggregate(
+            total=Sum('events_imported_count')
+        )['total']
+        totals['events_written', Status.PENDING.name] = running or 0
+
+        written = CounterMetricFamily(
+            'importer_events_written',
+            'Events written by import batches, by the status each run '
+            'finished with (PENDING: runs in progress).',
+            labels=['status'],
+        )
+        for status in Status:
+            written.add_metric(
+                [status.name], totals.get(('events_written', status.name), 0)
+            )
+        yield written
+
+        responses = CounterMetricFamily(
+            'sympla_http_responses',
+            'Responses received from the Sympla API by import batches, by '
+            'HTTP status.',
+            labels=['status'],
+        )
+        for (metric, status), count in sorted(totals.items()):
+            if metric == 'sympla_http_responses':
+                responses.add_metric([status], count)
+        yield responses
+
+
+def render_metrics() -> bytes:
+    """
+    Render all metrics in the Prometheus text exposition format.
+
+    When ``PROMETHEUS_MULTIPROC_DIR`` is set (gunicorn with several
+    workers), the per-process metric files are merged so every scrape sees
+    the totals of all workers instead of the one that served the request.
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    import_registry = CollectorRegistry()
+    import_registry.register(LoadBatchCollector())
+    return generate_latest(registry) + generate_latest(import_registry)
@@ -0,0 +1,241 @@
+import gzip
+import hashlib
+import logging
+from functools import partial
+from time import perf_counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.utils.cache import patch_vary_headers
+
+from apps.events.metrics import (
+    REQUEST_DB_QUERIES,
+    REQUEST_DB_TIME,
+    REQUEST_LATENCY,
+    record_cache_lookup,
+)
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available.
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output, and so its cached copy, deterministic.
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+# Content-Encoding -> compressor, in order of preference.
+ENCODERS = {'gzip': _gzip}
+if brotli is not None:
+    ENCODERS = {'br': partial(brotli.compress, quality=5), **ENCODERS}
+
+# Only API bodies are compressed; HTML pages carrying CSRF tokens are left
+# alone (BREACH).
+COMPRESSIBLE_TYPES = ('application/json', 'application/vnd.oai.openapi')
+
+
+def _route_name(request) -> str:
+    """Use the URL name so paths with ids share a single label."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+    return match.view_name or match.route or 'unnamed'
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    The preferred encoding of ``ENCODERS`` acceptable per an
+    ``Accept-Encoding`` header, honouring q-values (``gzip;q=0`` refuses).
+    """
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        name, _, value = params.strip().partition('=')
+        if name.strip() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+    wildcard = weights.get('*', 0.0)
+    accepted = [
+        (weights.get(coding, wildcard), -rank, coding)
+        for rank, coding in enumerate(ENCODERS)
+    ]
+    quality, _, coding = max(accepted)
+    return coding if quality > 0 else None
+
+
+class QueryTracker:
+    """Database execute wrapper counting and timing SQL queries."""
+
+    def __init__(self, keep_queries: bool = False):
+        self.count = 0
+        self.duration = 0.0
+        self.keep_queries = keep_queries
+        self.queries: list[tuple[float, str]] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            if self.keep_queries:
+                self.queries.append((elapsed, sql))
+
+    def slowest(self, limit: int) -> list[tuple[float, str]]:
+        """The ``limit`` slowest recorded queries, slowest first."""
+        return sorted(self.queries, reverse=True)[:limit]
+
+
+class MetricsMiddleware:
+    """
+    Records latency and SQL usage of every request per resolved route.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        tracker = QueryTracker()
+        start = perf_counter()
+        with connection.execute_wrapper(tracker):
+            response = self.get_response(request)
+        elapsed = perf_counter() - start
+
+        route = _route_name(request)
+        REQUEST_LATENCY.labels(
+            route=route, method=request.method, status=response.status_code
+        ).observe(elapsed)
+        REQUEST_DB_QUERIES.labels(route=route).observe(tracker.count)
+        REQUEST_DB_TIME.labels(route=route).observe(tracker.duration)
+        return response
+
+
+class QueryProfilingMiddleware:
+    """
+    Opt-in SQL profiler enabled by ``QUERY_PROFILING``.
+
+    Adds ``X-DB-Query-Count``/``X-DB-Query-Time-Ms`` headers to every
+    response and logs requests exceeding ``QUERY_PROFILING_MAX_QUERIES`` or
+    ``QUERY_PROFILING_MAX_DURATION`` together with their slowest queries.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_PROFILING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.max_queries = settings.QUERY_PROFILING_MAX_QUERIES
+        self.max_duration = settings.QUERY_PROFILING_MAX_DURATION
+        self.top_queries = settings.QUERY_PROFILING_TOP_QUERIES
+
+    def __call__(self, request):
+        tracker = QueryTracker(keep_queries=True)
+        start = perf_counter()
+        with connection.execute_wrapper(tracker):
+            response = self.get_response(request)
+        elapsed = perf_counter() - start
+
+        response['X-DB-Query-Count'] = str(tracker.count)
+        response['X-DB-Query-Time-Ms'] = f'{tracker.duration * 1000:.1f}'
+        if tracker.count > self.max_queries or elapsed > self.max_duration:
+            self._log_slow_request(request, tracker, elapsed)
+        return response
+
+    def _log_slow_request(
+        self, request, tracker: QueryTracker, elapsed: float
+    ) -> None:
+        """Log a request over budget with its slowest queries."""
+        top = '\n'.join(
+            f'  {duration * 1000:.1f}ms {sql}'
+            for duration, sql in tracker.slowest(self.top_queries)
+        )
+        logger.warning(
+            'Slow request %s %s: %.1fms, %d queries (%.1fms in SQL).'
+            '\nTop queries:\n%s',
+            request.method,
+            request.get_full_path(),
+            elapsed * 1000,
+            tracker.count,
+            tracker.duration * 1000,
+            top,
+        )
+
+
+class CompressionMiddleware:
+    """
+    Compresses API responses with brotli (when installed) or gzip,
+    negotiated on ``Accept-Encoding``.
+
+    For the routes in ``COMPRESSION_CACHED_ROUTES`` the compressed bytes are
+    cached under a hash of the uncompressed body: a page that only changes
+    when a load batch lands is compressed once and then served from the
+    cache, while a changed body simply hashes to a new key.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_length = settings.COMPRESSION_MIN_LENGTH
+        self.cached_routes = set(settings.COMPRESSION_CACHED_ROUTES)
+        self.cache_ttl = settings.COMPRESSION_CACHE_TTL
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self._is_compressible(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate_encoding(
+            request.headers.get('Accept-Encoding', '')
+        )
+        if encoding is None:
+            return response
+
+        content = response.content
+        compressed = self._compress(request, content, encoding)
+        if len(compressed) >= len(content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # The representation changed, so a strong ETag must be weakened.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = f'W/{etag}'
+        return response
+
+    def _is_compressible(self, response) -> bool:
+        return (
+            not response.streaming
+            and not response.has_header('Content-Encoding')
+            and response.get('Content-Type', '').startswith(COMPRESSIBLE_TYPES)
+            and len(response.content) >= self.min_length
+        )
+
+    def _compress(self, request, content: bytes, encoding: str) -> bytes:
+        """Compress ``content``, through the cache for cacheable routes."""
+        if (
+            request.method != 'GET'
+            or _route_name(request) not in self.cached_routes
+        ):
+            return ENCODERS[encoding](content)
+
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        key = f'compressed:{encoding}:{digest}'
+        compressed = cache.get(key)
+        record_cache_lookup('compressed-response', compressed is not None)
+        if compressed is None:
+            compressed = ENCODERS[encoding](content)
+            cache.set(key, compressed, self.cache_ttl)
+        return compressed
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_start_date_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.CharField(max_length=50, verbose_name='Event ID')),
+                ('kind', models.CharField(choices=[('CREATED', 'Criado'), ('UPDATED', 'Atualizado')], max_length=20, verbose_name='Change Kind')),
+                ('changed_fields', models.JSONField(default=list, verbose_name='Changed Fields')),
+                ('load_batch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='events.loadbatch')),
+            ],
+            options={
+                'verbose_name': 'Event Change',
+                'verbose_name_plural': 'Event Changes',
+                'ordering': ['id'],
+            },
+        ),
+    ]
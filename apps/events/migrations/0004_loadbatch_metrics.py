@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_eventchange'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loadbatch',
+            name='bytes_downloaded',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='Bytes Downloaded'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='db_time',
+            field=models.FloatField(default=0.0, verbose_name='DB Time (s)'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='http_time',
+            field=models.FloatField(default=0.0, verbose_name='HTTP Time (s)'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='pages_fetched',
+            field=models.PositiveIntegerField(default=0, verbose_name='Pages Fetched'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='rows_per_second',
+            field=models.FloatField(default=0.0, verbose_name='Rows per Second'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='validation_failures_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Validation Failures Count'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='validation_time',
+            field=models.FloatField(default=0.0, verbose_name='Validation Time (s)'),
+        ),
+    ]
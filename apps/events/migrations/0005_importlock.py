@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_loadbatch_metrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportLock',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False, verbose_name='Name')),
+                ('owner', models.CharField(max_length=255, verbose_name='Owner')),
+                ('acquired_at', models.DateTimeField(auto_now_add=True, verbose_name='Acquired At')),
+                ('expires_at', models.DateTimeField(verbose_name='Expires At')),
+            ],
+            options={
+                'verbose_name': 'Import Lock',
+                'verbose_name_plural': 'Import Locks',
+            },
+        ),
+        migrations.AlterField(
+            model_name='loadbatch',
+            name='status',
+            field=models.CharField(choices=[('SUCCESS', 'Sucesso'), ('ERROR', 'Error'), ('PENDING', 'Pendente'), ('SKIPPED', 'Ignorado')], max_length=20, verbose_name='Status'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_importlock'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loadbatch',
+            name='events_total',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Events Total'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='pages_total',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Pages Total'),
+        ),
+        migrations.AlterField(
+            model_name='loadbatch',
+            name='status',
+            field=models.CharField(choices=[('SUCCESS', 'Sucesso'), ('ERROR', 'Error'), ('PENDING', 'Pendente'), ('QUEUED', 'Na fila'), ('SKIPPED', 'Ignorado')], max_length=20, verbose_name='Status'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_loadbatch_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loadbatch',
+            name='organizer',
+            field=models.CharField(blank=True, default='', max_length=50, verbose_name='Organizer'),
+        ),
+    ]
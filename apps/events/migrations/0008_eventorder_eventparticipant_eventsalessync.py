@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_loadbatch_organizer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventOrder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order_id', models.CharField(db_index=True, max_length=50, verbose_name='Order ID')),
+                ('status', models.CharField(max_length=20, verbose_name='Order Status')),
+                ('order_date', models.DateTimeField(verbose_name='Order Date')),
+                ('transaction_type', models.CharField(blank=True, default='', max_length=50, verbose_name='Transaction Type')),
+                ('total_sale_price', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Total Sale Price')),
+                ('event', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='orders', to='events.event')),
+            ],
+            options={
+                'verbose_name': 'Event Order',
+                'verbose_name_plural': 'Event Orders',
+            },
+        ),
+        migrations.CreateModel(
+            name='EventParticipant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('participant_id', models.CharField(db_index=True, max_length=50, verbose_name='Participant ID')),
+                ('order_id', models.CharField(max_length=50, verbose_name='Order ID')),
+                ('ticket_number', models.CharField(blank=True, default='', max_length=50, verbose_name='Ticket Number')),
+                ('ticket_name', models.CharField(blank=True, default='', max_length=255, verbose_name='Ticket Name')),
+                ('ticket_sale_price', models.DecimalField(decimal_places=2, default=0, max_digits=12, verbose_name='Ticket Sale Price')),
+                ('checked_in', models.BooleanField(default=False, verbose_name='Checked In')),
+                ('event', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='participants', to='events.event')),
+            ],
+            options={
+                'verbose_name': 'Event Participant',
+                'verbose_name_plural': 'Event Participants',
+            },
+        ),
+        migrations.CreateModel(
+            name='EventSalesSync',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('synced_at', models.DateTimeField(verbose_name='Synced At')),
+                ('orders_count', models.PositiveIntegerField(default=0, verbose_name='Orders Count')),
+                ('participants_count', models.PositiveIntegerField(default=0, verbose_name='Participants Count')),
+                ('event', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='sales_sync', to='events.event')),
+            ],
+            options={
+                'verbose_name': 'Event Sales Sync',
+                'verbose_name_plural': 'Event Sales Syncs',
+            },
+        ),
+    ]
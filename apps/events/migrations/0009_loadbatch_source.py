@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_eventorder_eventparticipant_eventsalessync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loadbatch',
+            name='source',
+            field=models.CharField(choices=[('IMPORT', 'Importação'), ('WEBHOOK', 'Webhook')], default='IMPORT', max_length=20, verbose_name='Source'),
+        ),
+    ]
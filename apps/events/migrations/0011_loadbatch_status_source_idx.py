@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_event_upcoming_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loadbatch',
+            index=models.Index(fields=['status'], name='loadbatch_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loadbatch',
+            index=models.Index(fields=['source'], name='loadbatch_source_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0012_eventarchive'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventchange',
+            index=models.Index(fields=['event_id', 'load_batch'], name='eventchange_event_batch_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_eventchange_event_batch_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loadbatch',
+            index=models.Index(fields=['finished_at'], name='loadbatch_finished_idx'),
+        ),
+    ]
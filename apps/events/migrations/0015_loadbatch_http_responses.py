@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0014_loadbatch_finished_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loadbatch',
+            name='http_responses',
+            field=models.JSONField(blank=True, default=dict, help_text='Sympla API responses by HTTP status, timeout or error.', verbose_name='HTTP Responses'),
+        ),
+    ]
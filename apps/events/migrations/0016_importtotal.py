@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:46
+
+from collections import Counter
+
+from django.db import migrations, models
+
+FINISHED_STATUSES = ('SUCCESS', 'ERROR')
+
+
+def backfill_totals(apps, schema_editor):
+    """Start the running totals from the batches imported so far."""
+    LoadBatch = apps.get_model('events', 'LoadBatch')
+    ImportTotal = apps.get_model('events', 'ImportTotal')
+    totals = Counter()
+    batches = LoadBatch.objects.filter(
+        source='IMPORT', status__in=FINISHED_STATUSES
+    ).values_list('status', 'events_imported_count', 'http_responses')
+    for status, events_written, http_responses in batches.iterator():
+        totals['events_written', status] += events_written
+        for label, count in http_responses.items():
+            totals['sympla_http_responses', label] += count
+    ImportTotal.objects.bulk_create(
+        ImportTotal(metric=metric, label=label, value=value)
+        for (metric, label), value in totals.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0015_loadbatch_http_responses'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(max_length=50, verbose_name='Metric')),
+                ('label', models.CharField(max_length=50, verbose_name='Label')),
+                ('value', models.PositiveBigIntegerField(default=0, verbose_name='Value')),
+            ],
+            options={
+                'verbose_name': 'Import Total',
+                'verbose_name_plural': 'Import Totals',
+                'constraints': [models.UniqueConstraint(fields=('metric', 'label'), name='importtotal_metric_label')],
+            },
+        ),
+        migrations.RunPython(backfill_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0016_importtotal'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loadbatch',
+            name='fetch_wait',
+            field=models.FloatField(default=0.0, help_text='Pipelined import: fetcher blocked on a full queue.', verbose_name='Fetch Wait (s)'),
+        ),
+        migrations.AddField(
+            model_name='loadbatch',
+            name='write_wait',
+            field=models.FloatField(default=0.0, help_text='Pipelined import: writer waiting for fetched pages.', verbose_name='Write Wait (s)'),
+        ),
+    ]
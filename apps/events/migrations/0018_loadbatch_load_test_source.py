@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0017_loadbatch_pipeline_waits'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='loadbatch',
+            name='source',
+            field=models.CharField(choices=[('IMPORT', 'Importação'), ('WEBHOOK', 'Webhook'), ('LOAD_TEST', 'Teste de carga')], default='IMPORT', max_length=20, verbose_name='Source'),
+        ),
+    ]
@@ -1,6 +1,18 @@
 from django.db import models
 
-from utils.enums import EventType, Status
+from utils.enums import BatchSource, ChangeKind, EventType, Status
+
+# Event fields compared to detect changes and recorded in the change log.
+TRACKED_FIELDS = (
+    'name',
+    'start_date',
+    'end_date',
+    'event_type',
+    'venue_name',
+    'city',
+    'category',
+    'sub_category',
+)
 
 
 class LoadBatch(models.Model):
@@ -22,10 +34,68 @@ class LoadBatch(models.Model):
     events_imported_count = models.PositiveIntegerField(
         default=0, verbose_name='Events Imported Count'
     )
+    pages_fetched = models.PositiveIntegerField(
+        default=0, verbose_name='Pages Fetched'
+    )
+    pages_total = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name='Pages Total'
+    )
+    events_total = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name='Events Total'
+    )
+    bytes_downloaded = models.PositiveBigIntegerField(
+        default=0, verbose_name='Bytes Downloaded'
+    )
+    http_responses = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='HTTP Responses',
+        help_text='Sympla API responses by HTTP status, timeout or error.',
+    )
+    http_time = models.FloatField(default=0.0, verbose_name='HTTP Time (s)')
+    validation_time = models.FloatField(
+        default=0.0, verbose_name='Validation Time (s)'
+    )
+    db_time = models.FloatField(default=0.0, verbose_name='DB Time (s)')
+    fetch_wait = models.FloatField(
+        default=0.0,
+        verbose_name='Fetch Wait (s)',
+        help_text='Pipelined import: fetcher blocked on a full queue.',
+    )
+    write_wait = models.FloatField(
+        default=0.0,
+        verbose_name='Write Wait (s)',
+        help_text='Pipelined import: writer waiting for fetched pages.',
+    )
+    rows_per_second = models.FloatField(
+        default=0.0, verbose_name='Rows per Second'
+    )
+    validation_failures_count = models.PositiveIntegerField(
+        default=0, verbose_name='Validation Failures Count'
+    )
+    organizer = models.CharField(
+        max_length=50, blank=True, default='', verbose_name='Organizer'
+    )
+    source = models.CharField(
+        max_length=20,
+        choices=BatchSource.choices(),
+        default=BatchSource.IMPORT.name,
+        verbose_name='Source',
+    )
 
     class Meta:
         verbose_name = 'Load Batch'
         verbose_name_plural = 'Load Batches'
+        indexes = [
+            models.Index(fields=['status'], name='loadbatch_status_idx'),
+            models.Index(fields=['source'], name='loadbatch_source_idx'),
+            models.Index(
+                fields=['finished_at'], name='loadbatch_finished_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'Batch {self.pk} ({self.get_status_display()})'
 
 
 class Event(models.Model):
@@ -37,7 +107,7 @@ class Event(models.Model):
         max_length=50, unique=True, verbose_name='Event ID'
     )
     name = models.CharField(max_length=255, verbose_name='Event Name')
-    start_date = models.DateTimeField(verbose_name='Start Date')
+    start_date = models.DateTimeField(db_index=True, verbose_name='Start Date')
     end_date = models.DateTimeField(verbose_name='End Date')
     event_type = models.CharField(
         max_length=20,
@@ -62,6 +132,223 @@ class Event(models.Model):
         verbose_name = 'Event'
         verbose_name_plural = 'Events'
         ordering = ['-start_date']
+        indexes = [
+            # Upcoming events: a range scan on end_date reads only the
+            # events not over yet, already paired with their start_date.
+            models.Index(
+                fields=['end_date', 'start_date'], name='event_upcoming_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.name} ({self.event_id})'
+
+
+class EventChange(models.Model):
+    """
+    Represents a change applied to an event by a load batch.
+    """
+
+    load_batch = models.ForeignKey(
+        LoadBatch, on_delete=models.CASCADE, related_name='changes'
+    )
+    event_id = models.CharField(max_length=50, verbose_name='Event ID')
+    kind = models.CharField(
+        max_length=20,
+        choices=ChangeKind.choices(),
+        verbose_name='Change Kind',
+    )
+    changed_fields = models.JSONField(
+        default=list, verbose_name='Changed Fields'
+    )
+
+    class Meta:
+        verbose_name = 'Event Change'
+        verbose_name_plural = 'Event Changes'
+        ordering = ['id']
+        indexes = [
+            # The participants import looks up the changes of each event
+            # and joins their batch; both columns come from the index.
+            models.Index(
+                fields=['event_id', 'load_batch'],
+                name='eventchange_event_batch_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.kind} {self.event_id} (batch {self.load_batch_id})'
+
+
+class EventOrder(models.Model):
+    """
+    Represents an order placed for an event, imported from Sympla.
+
+    Links to ``Event`` without a database constraint: the events table may
+    be partitioned, and its primary key then includes ``start_date``.
+    """
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='orders',
+        db_constraint=False,
+    )
+    order_id = models.CharField(
+        max_length=50, db_index=True, verbose_name='Order ID'
+    )
+    status = models.CharField(max_length=20, verbose_name='Order Status')
+    order_date = models.DateTimeField(verbose_name='Order Date')
+    transaction_type = models.CharField(
+        max_length=50, blank=True, default='', verbose_name='Transaction Type'
+    )
+    total_sale_price = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name='Total Sale Price',
+    )
+
+    class Meta:
+        verbose_name = 'Event Order'
+        verbose_name_plural = 'Event Orders'
+
+    def __str__(self):
+        return f'{self.order_id} ({self.status})'
+
+
+class EventParticipant(models.Model):
+    """
+    Represents a ticket holder of an event, imported from Sympla.
+    """
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='participants',
+        db_constraint=False,
+    )
+    participant_id = models.CharField(
+        max_length=50, db_index=True, verbose_name='Participant ID'
+    )
+    order_id = models.CharField(max_length=50, verbose_name='Order ID')
+    ticket_number = models.CharField(
+        max_length=50, blank=True, default='', verbose_name='Ticket Number'
+    )
+    ticket_name = models.CharField(
+        max_length=255, blank=True, default='', verbose_name='Ticket Name'
+    )
+    ticket_sale_price = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name='Ticket Sale Price',
+    )
+    checked_in = models.BooleanField(default=False, verbose_name='Checked In')
+
+    class Meta:
+        verbose_name = 'Event Participant'
+        verbose_name_plural = 'Event Participants'
+
+    def __str__(self):
+        return f'{self.participant_id} ({self.ticket_name})'
+
+
+class EventSalesSync(models.Model):
+    """
+    Records when the orders and participants of an event were last
+    imported, so unchanged events can be skipped.
+    """
+
+    event = models.OneToOneField(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='sales_sync',
+        db_constraint=False,
+    )
+    synced_at = models.DateTimeField(verbose_name='Synced At')
+    orders_count = models.PositiveIntegerField(
+        default=0, verbose_name='Orders Count'
+    )
+    participants_count = models.PositiveIntegerField(
+        default=0, verbose_name='Participants Count'
+    )
+
+    class Meta:
+        verbose_name = 'Event Sales Sync'
+        verbose_name_plural = 'Event Sales Syncs'
+
+    def __str__(self):
+        return f'{self.event_id} synced at {self.synced_at}'
+
+
+class EventArchive(models.Model):
+    """
+    A month of events detached from the partitioned events table. Imports
+    and webhooks skip events starting before the end of the latest
+    archived month, so they do not write archived events back.
+    """
+
+    month = models.DateField(unique=True, verbose_name='Month')
+    table_name = models.CharField(
+        max_length=63,
+        blank=True,
+        default='',
+        verbose_name='Archive Table',
+        help_text='Empty when the partition was dropped.',
+    )
+    archived_at = models.DateTimeField(
+        auto_now_add=True, verbose_name='Archived At'
+    )
+
+    class Meta:
+        verbose_name = 'Event Archive'
+        verbose_name_plural = 'Event Archives'
+
+    def __str__(self):
+        return f'{self.month:%Y-%m} ({self.table_name or "dropped"})'
+
+
+class ImportTotal(models.Model):
+    """
+    Running total of a metric over the finished import batches, by label,
+    so /metrics reads a few rows instead of every batch.
+    """
+
+    metric = models.CharField(max_length=50, verbose_name='Metric')
+    label = models.CharField(max_length=50, verbose_name='Label')
+    value = models.PositiveBigIntegerField(default=0, verbose_name='Value')
+
+    class Meta:
+        verbose_name = 'Import Total'
+        verbose_name_plural = 'Import Totals'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['metric', 'label'], name='importtotal_metric_label'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.metric}{{{self.label}}} {self.value}'
+
+
+class ImportLock(models.Model):
+    """
+    Lock row used to run a single import at a time on databases without
+    advisory locks (PostgreSQL uses ``pg_try_advisory_lock`` instead).
+    """
+
+    name = models.CharField(
+        max_length=100, primary_key=True, verbose_name='Name'
+    )
+    owner = models.CharField(max_length=255, verbose_name='Owner')
+    acquired_at = models.DateTimeField(
+        auto_now_add=True, verbose_name='Acquired At'
+    )
+    expires_at = models.DateTimeField(verbose_name='Expires At')
+
+    class Meta:
+        verbose_name = 'Import Lock'
+        verbose_name_plural = 'Import Locks'
+
+    def __str__(self):
+        return f'{self.name} ({self.owner})'
@@ -0,0 +1,62 @@
+import hashlib
+import logging
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Format -> media type, as negotiated by drf-spectacular's schema view.
+SCHEMA_MEDIA_TYPES = {
+    'yaml': 'application/vnd.oai.openapi',
+    'json': 'application/vnd.oai.openapi+json',
+}
+
+
+def schema_path(fmt: str) -> Path:
+    """Location of the schema written by ``build_openapi_schema``."""
+    return Path(settings.OPENAPI_SCHEMA_DIR) / f'openapi.{fmt}'
+
+
+def generate_schema(fmt: str) -> bytes:
+    """
+    Render the OpenAPI schema with drf-spectacular.
+
+    drf-spectacular's generator is imported here rather than at module level
+    so web workers only pay for it when no prebuilt schema is available.
+    """
+    from drf_spectacular.renderers import (  # noqa: PLC0415
+        OpenApiJsonRenderer,
+        OpenApiYamlRenderer,
+    )
+    from drf_spectacular.settings import spectacular_settings  # noqa: PLC0415
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+    renderer = (
+        OpenApiJsonRenderer() if fmt == 'json' else OpenApiYamlRenderer()
+    )
+    return renderer.render(schema, renderer_context={})
+
+
+@cache
+def get_schema(fmt: str) -> bytes:
+    """
+    The schema in ``fmt``, read from the prebuilt file or, when it is
+    missing, generated once per process.
+    """
+    path = schema_path(fmt)
+    if path.exists():
+        return path.read_bytes()
+    logger.warning(
+        'Prebuilt OpenAPI schema %s not found; generating it at runtime. '
+        'Run build_openapi_schema at build time.',
+        path,
+    )
+    return generate_schema(fmt)
+
+
+@cache
+def get_schema_etag(fmt: str) -> str:
+    return hashlib.sha256(get_schema(fmt)).hexdigest()[:32]
@@ -0,0 +1,258 @@
+import logging
+from datetime import date, datetime, timezone
+from typing import List
+
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone as django_timezone
+
+from apps.events.models import Event, EventArchive
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = Event._meta.db_table
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+LEGACY_TABLE = f'{PARENT_TABLE}_legacy'
+ID_SEQUENCE = f'{PARENT_TABLE}_part_id_seq'
+PARTITION_PREFIX = f'{PARENT_TABLE}_p'
+ARCHIVE_PREFIX = f'{PARENT_TABLE}_archive_'
+
+
+def month_start(value: date) -> date:
+    """Return the first day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Shift a month start by ``months`` (which may be negative)."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding events starting in ``month``."""
+    return f'{PARTITION_PREFIX}{month:%Y_%m}'
+
+
+def archive_name(month: date) -> str:
+    """Name a detached partition is renamed to when archived."""
+    return f'{ARCHIVE_PREFIX}{month:%Y_%m}'
+
+
+def parse_partition_month(name: str) -> date | None:
+    """Recover the month from a partition name, if it is one of ours."""
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        parsed = datetime.strptime(name[len(PARTITION_PREFIX) :], '%Y_%m')
+    except ValueError:
+        return None
+    return parsed.date()
+
+
+def _bound(month: date) -> str:
+    return datetime(
+        month.year, month.month, 1, tzinfo=timezone.utc
+    ).isoformat()
+
+
+def is_supported() -> bool:
+    """Declarative partitioning is only available on PostgreSQL."""
+    return connection.vendor == 'postgresql'
+
+
+def is_partitioned() -> bool:
+    """Check whether the events table is already a partitioned table."""
+    if not is_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table p '
+            'JOIN pg_class c ON c.oid = p.partrelid '
+            'WHERE c.relname = %s AND pg_table_is_visible(c.oid)',
+            [PARENT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions() -> List[date]:
+    """Months that currently have an attached partition, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits i '
+            'JOIN pg_class parent ON parent.oid = i.inhparent '
+            'JOIN pg_class child ON child.oid = i.inhrelid '
+            'WHERE parent.relname = %s',
+            [PARENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    months = [parse_partition_month(name) for name in names]
+    return sorted(month for month in months if month)
+
+
+def default_partition_months() -> List[date]:
+    """Months with events in the default partition, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('month', start_date AT TIME ZONE "
+            f"'UTC')::date FROM {DEFAULT_PARTITION} ORDER BY 1"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def archive_cutoff() -> datetime | None:
+    """
+    Start of the month after the latest archived one, or ``None`` when
+    nothing was archived. Events starting earlier belong to archived
+    months and must not be written again.
+    """
+    latest = EventArchive.objects.aggregate(latest=Max('month'))['latest']
+    if latest is None:
+        return None
+    end = add_months(latest, 1)
+    return datetime(end.year, end.month, 1, tzinfo=timezone.utc)
+
+
+def is_archived(start_date: datetime, cutoff: datetime | None) -> bool:
+    """Whether an event starting at ``start_date`` is before ``cutoff``."""
+    if cutoff is None:
+        return False
+    if django_timezone.is_naive(start_date):
+        start_date = django_timezone.make_aware(start_date)
+    return start_date < cutoff
+
+
+def convert_to_partitioned() -> int:
+    """
+    Rebuild the events table as a table partitioned by ``start_date`` month.
+
+    The primary key becomes ``(id, start_date)`` because PostgreSQL requires
+    the partition key in every unique constraint, so ``event_id`` uniqueness
+    is kept by the importer (which upserts by ``event_id``) and backed by a
+    plain index. Returns the number of rows copied.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} RENAME TO {LEGACY_TABLE}')
+        cursor.execute(
+            f'CREATE TABLE {PARENT_TABLE} '
+            f'(LIKE {LEGACY_TABLE} INCLUDING DEFAULTS) '
+            'PARTITION BY RANGE (start_date)'
+        )
+        cursor.execute(f'SELECT COALESCE(MAX(id), 0) + 1 FROM {LEGACY_TABLE}')
+        next_id = cursor.fetchone()[0]
+        cursor.execute(f'CREATE SEQUENCE {ID_SEQUENCE} START {next_id}')
+        cursor.execute(
+            f'ALTER SEQUENCE {ID_SEQUENCE} OWNED BY {PARENT_TABLE}.id'
+        )
+        cursor.execute(
+            f'ALTER TABLE {PARENT_TABLE} ALTER COLUMN id '
+            f"SET DEFAULT nextval('{ID_SEQUENCE}')"
+        )
+        cursor.execute(
+            f'ALTER TABLE {PARENT_TABLE} ADD PRIMARY KEY (id, start_date)'
+        )
+        cursor.execute(
+            f'ALTER TABLE {PARENT_TABLE} '
+            f'ADD CONSTRAINT {PARENT_TABLE}_load_batch_fk '
+            'FOREIGN KEY (load_batch_id) REFERENCES events_loadbatch (id) '
+            'DEFERRABLE INITIALLY DEFERRED'
+        )
+        for column in ('event_id', 'start_date', 'load_batch_id'):
+            cursor.execute(
+                f'CREATE INDEX {PARENT_TABLE}_{column}_part_idx '
+                f'ON {PARENT_TABLE} ({column})'
+            )
+        cursor.execute(
+            f'CREATE INDEX {PARENT_TABLE}_upcoming_part_idx '
+            f'ON {PARENT_TABLE} (end_date, start_date)'
+        )
+        cursor.execute(
+            f'CREATE TABLE {DEFAULT_PARTITION} '
+            f'PARTITION OF {PARENT_TABLE} DEFAULT'
+        )
+
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('month', start_date AT TIME ZONE "
+            f"'UTC')::date FROM {LEGACY_TABLE}"
+        )
+        for (month,) in cursor.fetchall():
+            create_partition(month)
+
+        cursor.execute(
+            f'INSERT INTO {PARENT_TABLE} SELECT * FROM {LEGACY_TABLE}'
+        )
+        copied = cursor.rowcount
+        cursor.execute(f'DROP TABLE {LEGACY_TABLE}')
+
+    logger.info('Events table partitioned; %d rows copied.', copied)
+    return copied
+
+
+def create_partition(month: date) -> bool:
+    """
+    Create and attach the partition for ``month`` if it does not exist.
+
+    Rows already sitting in the default partition for that range are moved
+    into the new partition before attaching, which PostgreSQL requires.
+    Returns ``True`` when a partition was created.
+    """
+    month = month_start(month)
+    if month in list_partitions():
+        return False
+
+    name = partition_name(month)
+    lower, upper = _bound(month), _bound(add_months(month, 1))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)'
+        )
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} '
+            'WHERE start_date >= %s AND start_date < %s RETURNING *) '
+            f'INSERT INTO {name} SELECT * FROM moved',
+            [lower, upper],
+        )
+        cursor.execute(
+            f'ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} '
+            'FOR VALUES FROM (%s) TO (%s)',
+            [lower, upper],
+        )
+
+    logger.info('Partition %s created.', name)
+    return True
+
+
+def detach_partition(month: date, drop: bool = False) -> str | None:
+    """
+    Detach the partition for ``month`` from the events table.
+
+    The detached table is renamed to its archive name so it can be dumped
+    or queried later, or dropped when ``drop`` is set. The month is
+    recorded as an ``EventArchive`` so imports skip its events from then
+    on. Returns the archive table name, or ``None`` if it was dropped or
+    did not exist.
+    """
+    month = month_start(month)
+    if month not in list_partitions():
+        return None
+
+    name = partition_name(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}')
+        if drop:
+            cursor.execute(f'DROP TABLE {name}')
+            _record_archive(month, '')
+            logger.info('Partition %s detached and dropped.', name)
+            return None
+        archived = archive_name(month)
+        cursor.execute(f'ALTER TABLE {name} RENAME TO {archived}')
+        _record_archive(month, archived)
+
+    logger.info('Partition %s detached and archived as %s.', name, archived)
+    return archived
+
+
+def _record_archive(month: date, table_name: str) -> None:
+    EventArchive.objects.update_or_create(
+        month=month, defaults={'table_name': table_name}
+    )
@@ -0,0 +1,108 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import cache
+from io import StringIO
+from typing import Tuple
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.events.models import LoadBatch
+from utils.enums import BatchSource, Status
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = (Status.QUEUED.name, Status.PENDING.name)
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    # A single worker: the import lock only lets one import run anyway.
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='import')
+
+
+def _stale_cutoff() -> datetime:
+    """Batches started before this and still active have been abandoned."""
+    return timezone.now() - timedelta(seconds=settings.IMPORT_LOCK_TTL)
+
+
+def enqueue_import(organizer: str = '') -> Tuple[LoadBatch, bool]:
+    """
+    Queue an import to run in a background thread of this process.
+
+    Returns the batch and whether it was created. If a batch of the same
+    organizer is already queued or running (and younger than
+    ``IMPORT_LOCK_TTL``), that batch is returned instead of queueing
+    another one.
+    """
+    active = (
+        LoadBatch.objects
+        .filter(
+            status__in=ACTIVE_STATUSES,
+            started_at__gte=_stale_cutoff(),
+            organizer=organizer,
+        )
+        .order_by('-id')
+        .first()
+    )
+    if active:
+        return active, False
+
+    batch = LoadBatch.objects.create(
+        status=Status.QUEUED.name, organizer=organizer
+    )
+    transaction.on_commit(
+        lambda: _executor().submit(run_queued_import, batch.id)
+    )
+    return batch, True
+
+
+def resume_import(batch: LoadBatch) -> bool:
+    """
+    Queue a failed or abandoned import batch to run again under its own id.
+
+    Only import batches that errored, or that are still pending past
+    ``IMPORT_LOCK_TTL`` (their process died), are resumed. The import
+    upserts events, so those written by the interrupted run are only
+    compared again. Returns whether the batch was queued.
+    """
+    resumed = (
+        LoadBatch.objects
+        .filter(pk=batch.pk, source=BatchSource.IMPORT.name)
+        .filter(
+            Q(status=Status.ERROR.name)
+            | Q(status=Status.PENDING.name, started_at__lt=_stale_cutoff())
+        )
+        .update(status=Status.QUEUED.name, finished_at=None)
+    )
+    if resumed:
+        transaction.on_commit(
+            lambda: _executor().submit(run_queued_import, batch.pk)
+        )
+    return bool(resumed)
+
+
+def run_queued_import(batch_id: int) -> None:
+    """Run the import of a queued batch; executed by the thread pool."""
+    try:
+        batch = LoadBatch.objects.only('organizer').get(pk=batch_id)
+        options = {'organizer': batch.organizer} if batch.organizer else {}
+        call_command(
+            'import_sympla_events',
+            batch_id=batch_id,
+            stdout=StringIO(),
+            **options,
+        )
+    except Exception:
+        logger.exception(
+            'Background import of batch %s failed.',
+            batch_id,
+            extra={'batch_id': batch_id},
+        )
+    finally:
+        # Threads keep their own connection; don't leak it between jobs.
+        connection.close()
@@ -1,9 +1,24 @@
+from typing import List
+
+from django.utils import timezone
 from rest_framework import serializers
 
-from apps.events.models import Event
+from apps.events.models import Event, EventChange, LoadBatch
+from utils.enums import Status
 
 
 class EventSerializer(serializers.ModelSerializer):
+    """
+    Event representation. ``fields`` restricts the output to a subset of
+    ``Meta.fields``, for sparse fieldsets.
+    """
+
+    def __init__(self, *args, fields: List[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in self.fields.keys() - set(fields):
+                self.fields.pop(name)
+
     class Meta:
         model = Event
         fields = [
@@ -19,3 +34,100 @@ class EventSerializer(serializers.ModelSerializer):
             'load_batch',
             'event_type',
         ]
+
+
+class EventChangeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = EventChange
+        fields = [
+            'event_id',
+            'kind',
+            'changed_fields',
+        ]
+
+
+class ImportProgressSerializer(serializers.ModelSerializer):
+    """
+    Progress of a load batch, with the rate and ETA of its current phase.
+
+    While fetching, the ETA extrapolates the time per page; while writing,
+    it extrapolates the events written per second since the batch started.
+    """
+
+    events_written = serializers.IntegerField(source='events_imported_count')
+    phase = serializers.SerializerMethodField()
+    rate = serializers.SerializerMethodField()
+    eta_seconds = serializers.SerializerMethodField()
+
+    class Meta:
+        model = LoadBatch
+        fields = [
+            'id',
+            'organizer',
+            'status',
+            'phase',
+            'started_at',
+            'finished_at',
+            'pages_fetched',
+            'pages_total',
+            'events_total',
+            'events_written',
+            'rate',
+            'eta_seconds',
+        ]
+        read_only_fields = fields
+
+    @staticmethod
+    def get_phase(batch: LoadBatch) -> str:
+        if batch.finished_at:
+            return 'finished'
+        if batch.status == Status.QUEUED.name:
+            return 'queued'
+        if batch.events_total is None:
+            return 'fetching'
+        return 'writing'
+
+    @staticmethod
+    def _elapsed(batch: LoadBatch) -> float:
+        end = batch.finished_at or timezone.now()
+        return max((end - batch.started_at).total_seconds(), 0.0)
+
+    def get_rate(self, batch: LoadBatch) -> float | None:
+        """Events written per second."""
+        if batch.finished_at:
+            return batch.rows_per_second
+        elapsed = self._elapsed(batch)
+        if self.get_phase(batch) != 'writing' or not elapsed:
+            return None
+        return round(batch.events_imported_count / elapsed, 1)
+
+    def get_eta_seconds(self, batch: LoadBatch) -> float | None:
+        """Estimated seconds left in the current phase."""
+        phase = self.get_phase(batch)
+        if phase == 'finished':
+            return 0.0
+        if phase == 'fetching' and batch.pages_fetched and batch.pages_total:
+            per_page = self._elapsed(batch) / batch.pages_fetched
+            remaining = batch.pages_total - batch.pages_fetched
+            return round(max(remaining, 0) * per_page, 1)
+        rate = self.get_rate(batch)
+        if phase == 'writing' and rate:
+            remaining = (
+                batch.events_total
+                - batch.events_imported_count
+                - batch.validation_failures_count
+            )
+            return round(max(remaining, 0) / rate, 1)
+        return None
+
+
+class WebhookRejectionSerializer(serializers.Serializer):
+    id = serializers.CharField(allow_null=True)
+    errors = serializers.ListField(child=serializers.CharField())
+
+
+class WebhookResultSerializer(serializers.Serializer):
+    """Outcome of a webhook notification: events buffered and rejected."""
+
+    accepted = serializers.IntegerField()
+    rejected = WebhookRejectionSerializer(many=True)
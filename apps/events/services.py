@@ -1,38 +1,152 @@
 import logging
-from typing import Any, Dict, List
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generator, Iterator, List
 
+import orjson
 import requests
-from decouple import config
+from decouple import Csv, config
 from requests.exceptions import HTTPError, RequestException, Timeout
 
+from apps.events.stats import ImportStats
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class Organizer:
+    """Credentials of one Sympla organizer account."""
+
+    slug: str
+    token: str
+
+    def event_id(self, sympla_id: Any) -> str:
+        """The stored id of one of the organizer's events."""
+        return f'{self.slug}-{sympla_id}'
+
+
+def load_organizers() -> List[Organizer]:
+    """
+    Parse the ``SYMPLA_ORGANIZERS`` setting, a comma separated list of
+    ``slug:token`` pairs.
+    """
+    organizers = []
+    for entry in config('SYMPLA_ORGANIZERS', default='', cast=Csv()):
+        slug, _, token = (part.strip() for part in entry.partition(':'))
+        if not slug or not token:
+            raise ValueError(
+                f'Invalid SYMPLA_ORGANIZERS entry for organizer {slug!r}.'
+            )
+        organizers.append(Organizer(slug=slug, token=token))
+    return organizers
+
+
+def find_organizer(slug: str) -> Organizer | None:
+    """The organizer of ``SYMPLA_ORGANIZERS`` with the given slug."""
+    return next(
+        (
+            organizer
+            for organizer in load_organizers()
+            if organizer.slug == slug
+        ),
+        None,
+    )
+
+
 class SymplaAPIClient:
     """Handles low-level communication with Sympla API."""
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        stats: ImportStats | None = None,
+        rate_limit: float = 0.0,
+    ):
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({'S_Token': token})
+        self.stats = stats or ImportStats()
+        self.min_interval = 1 / rate_limit if rate_limit > 0 else 0.0
+        self._next_request_at = 0.0
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep so requests are at least ``min_interval`` seconds apart."""
+        now = time.monotonic()
+        if now < self._next_request_at:
+            time.sleep(self._next_request_at - now)
+        self._next_request_at = (
+            max(now, self._next_request_at) + self.min_interval
+        )
 
     def get(self, url: str, timeout: int = 15) -> Dict[str, Any] | None:
-        """Make a GET request to the API with error handling."""
+        """
+        Make a GET request to the API with error handling.
+
+        The body is decoded from bytes with orjson, skipping the ``str``
+        copy ``response.json()`` makes and decoding faster.
+        """
+        if self.min_interval:
+            self._wait_for_rate_limit()
         try:
-            response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response.json()
+            with self.stats.measure('http_time'):
+                response = self.session.get(url, timeout=timeout)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            self.stats.count_response('error')
+            logger.error('Invalid JSON from Sympla API: %s - URL: %s', e, url)
         except Timeout:
+            self.stats.count_response('timeout')
             logger.error('Timeout on request to Sympla API: %s', url)
         except HTTPError as http_err:
             self._log_http_error(http_err, url)
         except RequestException as e:
+            self.stats.count_response('error')
             logger.error('Communication error with Sympla API: %s', e)
+        else:
+            self.stats.count_response(response.status_code)
+            self.stats.pages_fetched += 1
+            self.stats.bytes_downloaded += self._wire_size(response)
+            return data
         return None
 
+    @staticmethod
+    def _wire_size(response: requests.Response) -> int:
+        """
+        Bytes of the body as received, before urllib3 decompressed it;
+        ``response.content`` is the decompressed body, several times
+        larger for gzipped pages.
+        """
+        size = response.raw.tell() if response.raw is not None else None
+        if isinstance(size, int) and size > 0:
+            return size
+        return len(response.content)
+
+    def iter_page(
+        self, url: str, timeout: int = 15
+    ) -> Generator[Dict[str, Any], None, Dict[str, Any] | None]:
+        """
+        Fetch one page and yield its events one at a time.
+
+        Each event is released by the page as it is yielded, so a consumer
+        that does not keep them holds at most one decoded page. Returns the
+        page's ``pagination`` block, or ``None`` if the request failed.
+        """
+        data = self.get(url, timeout)
+        if data is None:
+            return None
+        pagination = data.get('pagination', {})
+        events = data.pop('data', [])
+        events.reverse()
+        while events:
+            yield events.pop()
+        return pagination
+
     def _log_http_error(self, error: HTTPError, url: str) -> None:
         """Log HTTP errors with detailed information."""
         status_code = getattr(error.response, 'status_code', 'unknown')
+        self.stats.count_response(status_code)
         logger.error(
             'HTTP error accessing Sympla API: %s - Status: %s - URL: %s',
             error,
@@ -42,12 +156,38 @@ class SymplaAPIClient:
 
 
 class SymplaService:
-    """Service class to interact with the Sympla API."""
+    """
+    Service class to interact with the Sympla API.
 
-    def __init__(self):
-        self.token = self._get_config_value('SYMPLA_API_TOKEN')
+    Given an ``organizer``, its token is used instead of
+    ``SYMPLA_API_TOKEN`` and event ids are prefixed with its slug so
+    events of different organizers never collide.
+    """
+
+    def __init__(
+        self,
+        stats: ImportStats | None = None,
+        organizer: Organizer | None = None,
+        rate_limit: float | None = None,
+    ):
+        self.organizer = organizer
+        self.token = (
+            organizer.token
+            if organizer
+            else self._get_config_value('SYMPLA_API_TOKEN')
+        )
         self.base_url = self._get_config_value('SYMPLA_BASE_URL')
-        self.api_client = SymplaAPIClient(self.base_url, self.token)
+        self.stats = stats or ImportStats()
+        self.api_client = SymplaAPIClient(
+            self.base_url,
+            self.token,
+            self.stats,
+            rate_limit=(
+                config('SYMPLA_RATE_LIMIT', default=0.0, cast=float)
+                if rate_limit is None
+                else rate_limit
+            ),
+        )
 
     def _get_config_value(self, key: str) -> str:
         """Get required configuration value or raise ValueError."""
@@ -56,32 +196,84 @@ class SymplaService:
             raise ValueError(f'Sympla API {key} is not configured.')
         return value
 
-    def fetch_events(self) -> List[Dict[str, Any]]:
+    def fetch_events(
+        self, on_page: Callable[[Dict[str, Any]], None] | None = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetches all events from Sympla, handling pagination.
 
+        Args:
+            on_page: Optional callback receiving the pagination data of
+                each page fetched, used to report progress.
+
         Returns:
             List of event dictionaries. Returns empty list on communication error.
         """
-        all_events: List[Dict[str, Any]] = []
+        all_events = list(self.iter_events(on_page))
+        logger.info('Total of %d events found in Sympla API.', len(all_events))
+        return all_events
+
+    def iter_events(
+        self, on_page: Callable[[Dict[str, Any]], None] | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield events from every page one at a time, handling pagination.
+
+        ``on_page`` is called with the pagination data once all events of a
+        page were consumed. Stops at the first page that fails.
+        """
         next_page_url = self.base_url
 
         while next_page_url:
             logger.info('Fetching events from URL: %s', next_page_url)
-            data = self.api_client.get(next_page_url)
-
-            if not data:
+            page = self.api_client.iter_page(next_page_url)
+            if self.organizer:
+                page = self._namespace_events(page)
+            pagination = yield from page
+            if pagination is None:
                 break
+            if on_page:
+                on_page(pagination)
+            next_page_url = self._get_next_page_url(pagination)
 
-            all_events.extend(data.get('data', []))
-            next_page_url = self._get_next_page_url(data)
+    def fetch_event_resource(
+        self, event_id: str, resource: str
+    ) -> List[Dict[str, Any]] | None:
+        """
+        Fetch every page of one event's ``orders`` or ``participants``.
 
-        logger.info('Total of %d events found in Sympla API.', len(all_events))
-        return all_events
+        ``event_id`` is the id on Sympla, without an organizer prefix.
+        Returns ``None`` if any page fails, so a partial list is never
+        taken for the complete one.
+        """
+        items = []
+        next_page_url = f'{self.base_url.rstrip("/")}/{event_id}/{resource}'
+        while next_page_url:
+            data = self.api_client.get(next_page_url)
+            if data is None:
+                return None
+            items.extend(data.get('data', []))
+            next_page_url = self._get_next_page_url(data.get('pagination', {}))
+        return items
+
+    def _namespace_events(
+        self, page: Generator[Dict[str, Any], None, Dict[str, Any] | None]
+    ) -> Generator[Dict[str, Any], None, Dict[str, Any] | None]:
+        """Prefix event ids with the organizer slug.
 
-    def _get_next_page_url(self, data: Dict[str, Any]) -> str | None:
+        Returns the pagination block returned by ``page``.
+        """
+        while True:
+            try:
+                event = next(page)
+            except StopIteration as stop:
+                return stop.value
+            if event.get('id') is not None:
+                event['id'] = self.organizer.event_id(event['id'])
+            yield event
+
+    def _get_next_page_url(self, pagination: Dict[str, Any]) -> str | None:
         """Extract next page URL from pagination data if available."""
-        pagination = data.get('pagination', {})
         return (
             pagination.get('next_page_url')
             if pagination.get('has_next')
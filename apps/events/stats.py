@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from time import perf_counter
+from typing import Dict, Iterator
+
+
+@dataclass
+class ImportStats:
+    """Counters and per-phase timings collected during an import run."""
+
+    pages_fetched: int = 0
+    bytes_downloaded: int = 0
+    http_time: float = 0.0
+    validation_time: float = 0.0
+    db_time: float = 0.0
+    validation_failures: int = 0
+    http_responses: Dict[str, int] = field(default_factory=dict)
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Add the wall time spent inside the block to ``phase``."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, phase, getattr(self, phase) + perf_counter() - start)
+
+    def count_response(self, status: int | str) -> None:
+        """Count a response (or failure) from the Sympla API."""
+        key = str(status)
+        self.http_responses[key] = self.http_responses.get(key, 0) + 1
+
+    def add(self, other: 'ImportStats') -> None:
+        """Add the counters of ``other``, e.g. collected by another thread."""
+        for stat in fields(self):
+            if stat.name == 'http_responses':
+                for status, count in other.http_responses.items():
+                    self.http_responses[status] = (
+                        self.http_responses.get(status, 0) + count
+                    )
+                continue
+            setattr(
+                self,
+                stat.name,
+                getattr(self, stat.name) + getattr(other, stat.name),
+            )
+
+    @staticmethod
+    def rate(rows: int, seconds: float) -> float:
+        """Rows per second, guarding against zero-length runs."""
+        return rows / seconds if seconds > 0 else 0.0
+
+    def summary(self, rows_per_second: float) -> str:
+        """One-line human readable summary of the collected metrics."""
+        return (
+            f'{self.pages_fetched} pages, '
+            f'{self.bytes_downloaded} bytes downloaded, '
+            f'HTTP {self.http_time:.2f}s, '
+            f'validation {self.validation_time:.2f}s, '
+            f'DB {self.db_time:.2f}s, '
+            f'{rows_per_second:.1f} rows/s, '
+            f'{self.validation_failures} validation failures.'
+        )
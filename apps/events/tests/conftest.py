@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.events.webhooks import WebhookBuffer, get_webhook_buffer
+
+# Maximum number of SQL queries each endpoint may run for one request.
+# Raising a budget should be a deliberate decision reviewed with the change.
+QUERY_BUDGETS = {
+    'event-list': 2,  # COUNT(*) for pagination + one page of events
+    'event-detail': 2,  # data version + the event on a cache miss
+    'event-upcoming': 3,  # data version + COUNT(*) + the page on a miss
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache; ids repeat across tests."""
+    cache.clear()
+
+
+@pytest.fixture
+def assert_query_budget(django_assert_max_num_queries):
+    """
+    Fail the test when the block runs more queries than the route allows.
+
+    Usage: ``with assert_query_budget('event-list'): client.get(...)``.
+    """
+
+    def _assert_query_budget(route: str):
+        return django_assert_max_num_queries(QUERY_BUDGETS[route])
+
+    return _assert_query_budget
+
+
+@pytest.fixture
+def webhook_buffer(settings):
+    """
+    A fresh webhook buffer with signing enabled, whose events are only
+    written when the test calls ``flush()``.
+    """
+    settings.SYMPLA_WEBHOOK_SECRET = 'test-secret'
+    get_webhook_buffer.cache_clear()
+    with patch.object(WebhookBuffer, '_start_flusher'):
+        yield get_webhook_buffer()
+    get_webhook_buffer.cache_clear()
@@ -0,0 +1,200 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.events import admin as events_admin
+from apps.events.admin import EstimatedCountPaginator
+from apps.events.models import Event, EventChange, LoadBatch
+from apps.events.runner import run_queued_import
+from utils.enums import BatchSource, ChangeKind, EventType, Status
+
+
+def _create_events(batch, count):
+    start = timezone.now()
+    Event.objects.bulk_create(
+        Event(
+            event_id=f'evt{index}',
+            name=f'Event {index}',
+            start_date=start + timedelta(days=index),
+            end_date=start + timedelta(days=index, hours=2),
+            event_type=EventType.ONLINE.name,
+            category='Technology',
+            sub_category='Python',
+            load_batch=batch,
+        )
+        for index in range(count)
+    )
+
+
+@pytest.mark.django_db
+def test_load_batch_changelist_counts_events_in_the_page_query(
+    admin_client, django_assert_max_num_queries
+):
+    """
+    Tests that the batch list shows the events and changes of each batch
+    without a query per row.
+    """
+    batches = [
+        LoadBatch.objects.create(status=Status.SUCCESS.name) for _ in range(5)
+    ]
+    _create_events(batches[0], 3)
+    EventChange.objects.create(
+        load_batch=batches[0], event_id='evt0', kind=ChangeKind.CREATED.name
+    )
+
+    # Session, user, row estimate (PostgreSQL), COUNT(*) and the page
+    # itself, whatever the page size.
+    with django_assert_max_num_queries(5):
+        response = admin_client.get('/admin/events/loadbatch/')
+
+    assert response.status_code == 200  # noqa: PLR2004
+    rows = list(response.context['cl'].result_list)
+    assert [(row.event_count, row.change_count) for row in rows][-1] == (
+        3,
+        1,
+    )
+    assert f'?load_batch__id__exact={batches[0].pk}' in response.text
+
+
+@pytest.mark.django_db
+def test_event_changelist_searches_and_filters_on_indexed_columns(
+    admin_client,
+):
+    """
+    Tests that events are searched by exact event_id and filtered by batch
+    and upcoming status, with the batch loaded in the same query.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    other = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    _create_events(batch, 3)
+    Event.objects.filter(event_id='evt2').update(load_batch=other)
+
+    search = admin_client.get('/admin/events/event/', {'q': 'evt1'})
+    by_batch = admin_client.get(
+        '/admin/events/event/', {'load_batch__id__exact': other.pk}
+    )
+    upcoming = admin_client.get('/admin/events/event/', {'upcoming': 'yes'})
+
+    assert [e.event_id for e in search.context['cl'].result_list] == ['evt1']
+    assert [e.event_id for e in by_batch.context['cl'].result_list] == ['evt2']
+    assert upcoming.context['cl'].result_count == 3  # noqa: PLR2004
+    assert search.context['cl'].queryset.query.select_related == {
+        'load_batch': {}
+    }
+
+
+@pytest.mark.django_db
+def test_batches_and_events_cannot_be_deleted(admin_client):
+    """
+    Tests that neither the delete action nor the delete page is offered
+    for batches and events, so no delete cascades from the admin.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    _create_events(batch, 1)
+    event = Event.objects.get()
+
+    changelist = admin_client.get('/admin/events/loadbatch/')
+    admin_client.post(
+        '/admin/events/loadbatch/',
+        {'action': 'delete_selected', '_selected_action': [batch.pk]},
+    )
+    batch_delete = admin_client.post(
+        f'/admin/events/loadbatch/{batch.pk}/delete/', {'post': 'yes'}
+    )
+    event_delete = admin_client.post(
+        f'/admin/events/event/{event.pk}/delete/', {'post': 'yes'}
+    )
+
+    assert 'value="delete_selected"' not in changelist.text
+    assert 'value="rerun_imports"' in changelist.text
+    assert batch_delete.status_code == 403  # noqa: PLR2004
+    assert event_delete.status_code == 403  # noqa: PLR2004
+    assert LoadBatch.objects.filter(pk=batch.pk).exists()
+    assert Event.objects.filter(pk=event.pk).exists()
+
+
+@pytest.mark.django_db
+def test_estimated_count_paginator_counts_small_results_exactly(
+    monkeypatch,
+):
+    """
+    Tests that small results are counted exactly and, on PostgreSQL, that
+    larger ones take the planner estimate.
+    """
+    _create_events(LoadBatch.objects.create(status=Status.SUCCESS.name), 3)
+    queryset = Event.objects.all()
+
+    assert EstimatedCountPaginator(queryset, 10).count == 3  # noqa: PLR2004
+
+    monkeypatch.setattr(events_admin, 'EXACT_COUNT_THRESHOLD', 0)
+    with CaptureQueriesContext(connection) as queries:
+        count = EstimatedCountPaginator(queryset, 10).count
+
+    if connection.vendor == 'postgresql':
+        assert queries[0]['sql'].startswith('EXPLAIN (FORMAT JSON)')
+        assert isinstance(count, int)
+    else:
+        assert count == 3  # noqa: PLR2004
+
+
+@patch('apps.events.runner._executor')
+@pytest.mark.django_db
+def test_load_batch_actions_rerun_and_resume_imports(
+    mock_executor, admin_client, django_capture_on_commit_callbacks
+):
+    """
+    Tests that re-run queues one import per organizer and that resume
+    requeues failed or abandoned imports under their own id only.
+    """
+    failed = LoadBatch.objects.create(status=Status.ERROR.name)
+    abandoned = LoadBatch.objects.create(
+        status=Status.PENDING.name, organizer='acme'
+    )
+    LoadBatch.objects.filter(pk=abandoned.pk).update(
+        started_at=timezone.now() - timedelta(days=2)
+    )
+    running = LoadBatch.objects.create(status=Status.PENDING.name)
+    webhook = LoadBatch.objects.create(
+        status=Status.ERROR.name, source=BatchSource.WEBHOOK.name
+    )
+    url = '/admin/events/loadbatch/'
+    selected = [failed.pk, abandoned.pk, running.pk, webhook.pk]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        admin_client.post(
+            url,
+            {'action': 'resume_imports', '_selected_action': selected},
+        )
+
+    submitted = [
+        call.args for call in mock_executor.return_value.submit.call_args_list
+    ]
+    assert submitted == [
+        (run_queued_import, failed.pk),
+        (run_queued_import, abandoned.pk),
+    ]
+    statuses = dict(LoadBatch.objects.values_list('pk', 'status'))
+    assert statuses[failed.pk] == Status.QUEUED.name
+    assert statuses[running.pk] == Status.PENDING.name
+    assert statuses[webhook.pk] == Status.ERROR.name
+
+    mock_executor.reset_mock()
+    LoadBatch.objects.filter(
+        pk__in=[failed.pk, abandoned.pk, running.pk]
+    ).update(status=Status.SUCCESS.name)
+    with django_capture_on_commit_callbacks(execute=True):
+        admin_client.post(
+            url,
+            {
+                'action': 'rerun_imports',
+                '_selected_action': [failed.pk, abandoned.pk, webhook.pk],
+            },
+        )
+
+    queued = LoadBatch.objects.filter(status=Status.QUEUED.name)
+    assert sorted(queued.values_list('organizer', flat=True)) == ['', 'acme']
+    assert mock_executor.return_value.submit.call_count == 2  # noqa: PLR2004
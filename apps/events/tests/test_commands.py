@@ -1,10 +1,27 @@
-from unittest.mock import patch
+import json
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import ANY, patch
 
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
 
-from apps.events.models import Event, LoadBatch
-from utils.enums import EventType, Status
+from apps.events.management.commands.import_sympla_events import Command
+from apps.events.models import (
+    Event,
+    EventArchive,
+    EventChange,
+    EventOrder,
+    EventParticipant,
+    EventSalesSync,
+    ImportTotal,
+    LoadBatch,
+)
+from apps.events.stats import ImportStats
+from benchmarks.fake_sympla import FakeSymplaServer
+from utils.enums import ChangeKind, EventType, Status
 
 
 @patch('apps.events.management.commands.import_sympla_events.SymplaService')
@@ -109,3 +126,554 @@ def test_import_command_skips_invalid_data(MockSymplaService):
     batch = LoadBatch.objects.first()
     assert batch.status == Status.SUCCESS.name
     assert batch.events_imported_count == LOAD_BATCH_COUNT
+    assert batch.validation_failures_count == 1
+
+
+@patch('apps.events.management.commands.import_sympla_events.SymplaService')
+@pytest.mark.django_db
+def test_import_command_skips_events_of_archived_months(MockSymplaService):
+    """
+    Tests that events starting before the end of the latest archived month
+    are not imported again, so a detached partition stays detached.
+    """
+    EventArchive.objects.create(
+        month=date(2025, 10, 1), table_name='events_event_archive_2025_10'
+    )
+    MockSymplaService.return_value.fetch_events.return_value = [
+        {
+            'id': event_id,
+            'name': 'Evento',
+            'start_date': f'{day}T20:00:00',
+            'end_date': f'{day}T22:00:00',
+            'address': {'address_num': 0},
+            'category_prim': {'name': 'Música'},
+            'category_sec': {'name': 'Pop'},
+        }
+        for event_id, day in (
+            ('evt001', '2025-09-30'),
+            ('evt002', '2025-10-31'),
+            ('evt003', '2025-11-01'),
+        )
+    ]
+    out = StringIO()
+
+    call_command('import_sympla_events', stdout=out)
+
+    assert list(Event.objects.values_list('event_id', flat=True)) == ['evt003']
+    assert EventChange.objects.count() == 1
+    batch = LoadBatch.objects.get()
+    assert batch.events_total == 3  # noqa: PLR2004
+    assert batch.events_imported_count == 1
+    assert '2 events of archived months skipped.' in out.getvalue()
+
+
+@patch('apps.events.management.commands.import_sympla_events.SymplaService')
+@pytest.mark.django_db
+def test_import_command_records_change_log(MockSymplaService):
+    """
+    Tests that each batch records only the events it created or changed.
+    """
+    event_data = {
+        'id': 'evt001',
+        'name': 'Evento Original',
+        'start_date': '2025-10-20T20:00:00',
+        'end_date': '2025-10-20T22:00:00',
+        'address': {'name': 'Local A', 'city': 'Recife'},
+        'category_prim': {'name': 'Música'},
+        'category_sec': {'name': 'Rock'},
+    }
+    unchanged_data = {**event_data, 'id': 'evt002'}
+    mock_service_instance = MockSymplaService.return_value
+    mock_service_instance.fetch_events.return_value = [
+        event_data,
+        unchanged_data,
+    ]
+
+    call_command('import_sympla_events')
+
+    first_batch = LoadBatch.objects.latest('id')
+    assert sorted(first_batch.changes.values_list('event_id', 'kind')) == [
+        ('evt001', ChangeKind.CREATED.name),
+        ('evt002', ChangeKind.CREATED.name),
+    ]
+
+    mock_service_instance.fetch_events.return_value = [
+        {**event_data, 'name': 'Evento Renomeado'},
+        unchanged_data,
+    ]
+
+    call_command('import_sympla_events')
+
+    second_batch = LoadBatch.objects.latest('id')
+    change = EventChange.objects.get(load_batch=second_batch)
+    assert change.event_id == 'evt001'
+    assert change.kind == ChangeKind.UPDATED.name
+    assert change.changed_fields == ['name']
+
+
+@patch('apps.events.management.commands.import_sympla_events.SymplaService')
+@pytest.mark.django_db
+def test_import_command_stores_phase_metrics(MockSymplaService):
+    """
+    Tests that the per-phase metrics are persisted and summarized, and
+    the finished batch added to the running totals of /metrics.
+    """
+    mock_service_instance = MockSymplaService.return_value
+    mock_service_instance.fetch_events.return_value = [
+        {
+            'id': 'evt001',
+            'name': 'Evento',
+            'start_date': '2025-10-20T20:00:00',
+            'end_date': '2025-10-20T22:00:00',
+            'address': {'name': 'Local A', 'city': 'Recife'},
+            'category_prim': {'name': 'Música'},
+            'category_sec': {'name': 'Rock'},
+        },
+    ]
+    out = StringIO()
+
+    call_command('import_sympla_events', stdout=out)
+
+    batch = LoadBatch.objects.get()
+    assert isinstance(MockSymplaService.call_args.kwargs['stats'], ImportStats)
+    assert batch.validation_time > 0
+    assert batch.db_time > 0
+    assert batch.rows_per_second > 0
+    assert 'rows/s' in out.getvalue()
+    assert '0 validation failures' in out.getvalue()
+    total = ImportTotal.objects.get(
+        metric='events_written', label=Status.SUCCESS.name
+    )
+    assert total.value == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_loadtest_command_reports_latency_percentiles(live_server):
+    """
+    Tests that the load test seeds events, exercises the API and reports
+    percentiles, removing the synthetic events and their batch afterwards.
+    """
+    out = StringIO()
+
+    call_command(
+        'loadtest_events_api',
+        url=live_server.url,
+        seed_events=50,
+        requests=20,
+        concurrency=4,
+        cleanup=True,
+        stdout=out,
+    )
+
+    output = out.getvalue()
+    assert '50 synthetic events seeded.' in output
+    assert 'p99 ms' in output
+    assert '20 requests in' in output
+    assert '50 synthetic events removed.' in output
+    assert not Event.objects.filter(event_id__startswith='loadtest-').exists()
+    assert not LoadBatch.objects.exists()
+    all_row = next(
+        line for line in output.splitlines() if line.startswith('all ')
+    )
+    assert all_row.split()[2] == '0'  # no failed requests
+
+
+@patch('apps.events.management.commands.import_sympla_events.import_lock')
+@patch('apps.events.management.commands.import_sympla_events.SymplaService')
+@pytest.mark.django_db
+def test_import_command_skips_when_lock_is_held(
+    MockSymplaService, mock_import_lock
+):
+    """
+    Tests that an import overlapping a running one is recorded as skipped
+    without touching the Sympla API.
+    """
+    mock_import_lock.return_value.__enter__.return_value = False
+
+    call_command('import_sympla_events', stdout=StringIO())
+
+    MockSymplaService.assert_not_called()
+    batch = LoadBatch.objects.get()
+    assert batch.status == Status.SKIPPED.name
+    assert batch.finished_at is not None
+
+
+@patch('apps.events.management.commands.run_import_scheduler.call_command')
+@pytest.mark.django_db
+def test_import_scheduler_runs_imports_on_interval(mock_call_command):
+    """
+    Tests that the scheduler keeps running imports, surviving a crash.
+    """
+    mock_call_command.side_effect = [RuntimeError('boom'), None, None]
+
+    call_command(
+        'run_import_scheduler',
+        interval=0,
+        jitter=0,
+        max_runs=3,
+        stdout=StringIO(),
+    )
+
+    assert mock_call_command.call_count == 3  # noqa: PLR2004
+    mock_call_command.assert_called_with('import_sympla_events', stdout=ANY)
+
+
+@patch('apps.events.management.commands.run_import_scheduler.monotonic')
+@patch('apps.events.management.commands.run_import_scheduler.call_command')
+@pytest.mark.django_db
+def test_import_scheduler_counts_interval_from_run_start(
+    mock_call_command, mock_monotonic
+):
+    """
+    Tests that the wait before the next import discounts the time the
+    previous one took, so runs start every --interval seconds.
+    """
+    mock_monotonic.side_effect = [0.0, 40.0, 100.0]
+
+    with patch(
+        'apps.events.management.commands.run_import_scheduler'
+        '.threading.Event.wait'
+    ) as mock_wait:
+        call_command(
+            'run_import_scheduler',
+            interval=100,
+            jitter=0,
+            max_runs=2,
+            stdout=StringIO(),
+        )
+
+    mock_wait.assert_called_once_with(60.0)
+
+
+@patch('apps.events.management.commands.import_sympla_events.SymplaService')
+@pytest.mark.django_db
+def test_import_command_runs_queued_batch_with_progress(MockSymplaService):
+    """
+    Tests that a batch queued by the imports API is reused and its fetch
+    and write progress is saved.
+    """
+    events = [
+        {
+            'id': f'evt{index}',
+            'name': f'Evento {index}',
+            'start_date': '2025-10-20T20:00:00',
+            'end_date': '2025-10-20T22:00:00',
+            'address': {'name': 'Local', 'city': 'Recife'},
+            'category_prim': {'name': 'Música'},
+            'category_sec': {'name': 'Rock'},
+        }
+        for index in range(3)
+    ]
+
+    def fetch_events(on_page):
+        on_page({'page': 1, 'total_page': 1})
+        return events
+
+    MockSymplaService.return_value.fetch_events.side_effect = fetch_events
+    queued = LoadBatch.objects.create(status=Status.QUEUED.name)
+
+    call_command('import_sympla_events', batch_id=queued.id, stdout=StringIO())
+
+    batch = LoadBatch.objects.get()
+    assert batch.id == queued.id
+    assert batch.status == Status.SUCCESS.name
+    assert batch.pages_total == 1
+    assert batch.events_total == len(events)
+    assert batch.events_imported_count == len(events)
+
+
+@pytest.mark.django_db
+def test_import_command_rejects_unknown_batch():
+    """Tests that --batch-id must point to a queued batch."""
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+
+    with pytest.raises(CommandError):
+        call_command('import_sympla_events', batch_id=batch.id)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_command_imports_all_organizers(monkeypatch, settings):
+    """
+    Tests that --all-organizers records one batch per organizer, each
+    with its own events, and reports the output of every import. On
+    PostgreSQL each organizer is imported by its own process.
+    """
+    monkeypatch.setenv('SYMPLA_ORGANIZERS', 'acme:token-a,beta:token-b')
+    settings.IMPORT_ORGANIZER_PROCESSES = 2
+    out = StringIO()
+    with FakeSymplaServer(pages=2, page_size=3) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+
+        call_command('import_sympla_events', all_organizers=True, stdout=out)
+
+    batches = LoadBatch.objects.order_by('organizer')
+    assert [batch.organizer for batch in batches] == ['acme', 'beta']
+    assert {batch.status for batch in batches} == {Status.SUCCESS.name}
+    for batch in batches:
+        events = Event.objects.filter(load_batch=batch)
+        assert events.count() == 6  # noqa: PLR2004
+        assert all(
+            event_id.startswith(f'{batch.organizer}-')
+            for event_id in events.values_list('event_id', flat=True)
+        )
+    assert out.getvalue().count("with status 'SUCCESS'") == 2  # noqa: PLR2004
+
+
+def test_import_command_rejects_unknown_organizer(monkeypatch):
+    """Tests that --organizer must be one of SYMPLA_ORGANIZERS."""
+    monkeypatch.setenv('SYMPLA_ORGANIZERS', 'acme:token-a')
+
+    with pytest.raises(CommandError, match='beta'):
+        call_command('import_sympla_events', organizer='beta')
+
+
+def _create_upcoming_events(count):
+    batch = LoadBatch.objects.create(
+        status=Status.SUCCESS.name, finished_at=timezone.now()
+    )
+    start = timezone.now() + timedelta(days=30)
+    return batch, [
+        Event.objects.create(
+            event_id=f'evt{index}',
+            name=f'Evento {index}',
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            event_type=EventType.ONLINE.name,
+            category='Música',
+            sub_category='Rock',
+            load_batch=batch,
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.django_db
+def test_participants_import_fetches_sales_concurrently(monkeypatch):
+    """
+    Tests that the orders and participants of every event are fetched on
+    the worker pool and written in bulk with a sync record per event.
+    """
+    _, events = _create_upcoming_events(3)
+    out = StringIO()
+
+    with FakeSymplaServer(orders_per_event=2) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        call_command('import_sympla_participants', workers=2, stdout=out)
+
+    assert server.requests_served == 2 * len(events)
+    assert EventOrder.objects.count() == 2 * len(events)
+    assert EventParticipant.objects.count() == 2 * len(events)
+    assert EventParticipant.objects.filter(checked_in=True).count() == len(
+        events
+    )
+    sync = EventSalesSync.objects.get(event=events[0])
+    assert (sync.orders_count, sync.participants_count) == (2, 2)
+    assert '3 events synced, 0 skipped, 0 failed' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_participants_import_skips_unchanged_events(monkeypatch):
+    """
+    Tests that a second run only re-fetches events changed by a batch
+    finished after their last sync, replacing their previous sales.
+    """
+    _, events = _create_upcoming_events(3)
+
+    with FakeSymplaServer(orders_per_event=1) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        call_command('import_sympla_participants', stdout=StringIO())
+        first_run_requests = server.requests_served
+
+        newer_batch = LoadBatch.objects.create(
+            status=Status.SUCCESS.name,
+            finished_at=timezone.now() + timedelta(seconds=1),
+        )
+        EventChange.objects.create(
+            load_batch=newer_batch,
+            event_id=events[0].event_id,
+            kind=ChangeKind.UPDATED.name,
+            changed_fields=['name'],
+        )
+        out = StringIO()
+        call_command('import_sympla_participants', stdout=out)
+
+    assert server.requests_served == first_run_requests + 2
+    assert '1 events synced, 2 skipped' in out.getvalue()
+    assert EventOrder.objects.filter(event=events[0]).count() == 1
+
+
+@pytest.mark.django_db
+def test_participants_import_keeps_sales_when_requests_fail(monkeypatch):
+    """Tests that failed requests never wipe the sales already stored."""
+    _, events = _create_upcoming_events(1)
+    EventOrder.objects.create(
+        event=events[0],
+        order_id='kept',
+        status='A',
+        order_date=timezone.now(),
+    )
+
+    with FakeSymplaServer(error_rate=1.0) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        out = StringIO()
+        call_command('import_sympla_participants', stdout=out)
+
+    assert EventOrder.objects.get().order_id == 'kept'
+    assert not EventSalesSync.objects.exists()
+    assert '0 events synced, 0 skipped, 1 failed' in out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_webhook_sender_exercises_the_receiver(live_server, webhook_buffer):
+    """
+    Tests that the local sender signs its notifications and that repeated
+    notifications collapse into one event each when flushed.
+    """
+    out = StringIO()
+
+    call_command(
+        'send_sympla_webhooks',
+        url=live_server.url,
+        events=40,
+        distinct=10,
+        batch_size=4,
+        concurrency=2,
+        stdout=out,
+    )
+    webhook_buffer.flush()
+
+    assert '10 requests, 0 errors' in out.getvalue()
+    assert Event.objects.filter(event_id__startswith='webhook-').count() == 10  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_import_dry_run_reports_diff_without_writing(monkeypatch, tmp_path):
+    """
+    Tests that --dry-run classifies API events against the stored ones and
+    writes the NDJSON diff, leaving events and batches untouched.
+    """
+    with FakeSymplaServer(pages=2, page_size=3) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        call_command('import_sympla_events', stdout=StringIO())
+        Event.objects.filter(event_id='bench-1-0').update(name='Renamed')
+        Event.objects.filter(event_id='bench-1-1').delete()
+        stale = Event.objects.get(event_id='bench-2-2')
+        stale.pk, stale.event_id = None, 'gone'
+        stale.save()
+        events_before = Event.objects.count()
+        diff_file = tmp_path / 'diff.ndjson'
+        out = StringIO()
+
+        call_command(
+            'import_sympla_events',
+            dry_run=True,
+            diff_file=diff_file,
+            stdout=out,
+        )
+
+    assert (
+        'Dry run: 1 to create, 1 to update, 4 unchanged, 1 vanished'
+        in out.getvalue()
+    )
+    assert 'ended early' not in out.getvalue()
+    assert Event.objects.count() == events_before
+    assert LoadBatch.objects.count() == 1
+    diff = [json.loads(line) for line in diff_file.read_text().splitlines()]
+    assert diff == [
+        {
+            'event_id': 'bench-1-0',
+            'diff': 'updated',
+            'changed_fields': ['name'],
+        },
+        {'event_id': 'bench-1-1', 'diff': 'created'},
+        {'event_id': 'gone', 'diff': 'vanished'},
+    ]
+
+
+@pytest.mark.django_db
+def test_import_pipeline_writes_pages_while_fetching(monkeypatch):
+    """
+    Tests that --pipeline imports every page through the bounded queue,
+    saves the events received so far with each page and stores the wait
+    of each stage on the batch.
+    """
+    write_page = Command._write_page
+    saved_totals = []
+
+    def spy_write_page(self, *args):
+        write_page(self, *args)
+        saved_totals.append(
+            LoadBatch.objects.get(pk=self.batch.pk).events_total
+        )
+
+    monkeypatch.setattr(Command, '_write_page', spy_write_page)
+    with FakeSymplaServer(pages=3, page_size=4) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        out = StringIO()
+
+        call_command(
+            'import_sympla_events', pipeline=True, queue_depth=1, stdout=out
+        )
+
+    batch = LoadBatch.objects.get()
+    assert batch.status == Status.SUCCESS.name
+    assert batch.events_total == 12  # noqa: PLR2004
+    assert batch.events_imported_count == 12  # noqa: PLR2004
+    assert batch.pages_fetched == 3  # noqa: PLR2004
+    assert batch.pages_total == 3  # noqa: PLR2004
+    assert Event.objects.count() == 12  # noqa: PLR2004
+    assert EventChange.objects.count() == 12  # noqa: PLR2004
+    assert saved_totals == [4, 8, 12]
+    assert batch.write_wait > 0
+    assert 'Pipeline waits: fetch' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_events_snapshot_round_trip(tmp_path):
+    """
+    Tests that an exported snapshot loads back with the same ids and
+    values, NULLs and characters COPY escapes included, replacing the
+    stored events, and that new rows get ids past the loaded ones.
+    """
+    batch, events = _create_upcoming_events(3)
+    events[0].name = 'Barra \\ tab\t e\nlinha'
+    events[0].save()
+    Event.objects.filter(pk=events[1].pk).update(venue_name='Teatro')
+    LoadBatch.objects.filter(pk=batch.pk).update(http_responses={'200': 2})
+    expected = list(Event.objects.order_by('pk').values())
+    snapshot = tmp_path / 'events.ndjson.gz'
+    call_command('export_events_snapshot', str(snapshot), stdout=StringIO())
+    Event.objects.filter(pk=events[2].pk).update(name='Changed')
+    LoadBatch.objects.create(status=Status.SUCCESS.name)
+    out = StringIO()
+
+    call_command(
+        'load_events_snapshot', str(snapshot), replace=True, stdout=out
+    )
+
+    assert '1 loadbatch rows, 3 event rows loaded' in out.getvalue()
+    assert list(Event.objects.order_by('pk').values()) == expected
+    assert list(LoadBatch.objects.values_list('pk', 'http_responses')) == [
+        (batch.pk, {'200': 2})
+    ]
+    assert (
+        Event.objects.filter(start_date__gte=events[0].start_date).count() == 3  # noqa: PLR2004
+    )
+    new_batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    assert new_batch.pk > batch.pk
+
+
+@pytest.mark.django_db
+def test_events_snapshot_load_requires_replace_when_not_empty(tmp_path):
+    """
+    Tests that loading into a database with events fails without
+    --replace and leaves the stored events alone.
+    """
+    _create_upcoming_events(1)
+    snapshot = tmp_path / 'events.ndjson.gz'
+    call_command('export_events_snapshot', str(snapshot), stdout=StringIO())
+
+    with pytest.raises(CommandError, match='--replace'):
+        call_command('load_events_snapshot', str(snapshot), stdout=StringIO())
+
+    assert Event.objects.count() == 1
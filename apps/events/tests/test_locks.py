@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from apps.events.locks import import_lock
+from apps.events.models import ImportLock
+
+
+@pytest.fixture
+def row_lock_backend():
+    if connection.vendor == 'postgresql':
+        pytest.skip('PostgreSQL uses advisory locks instead of lock rows.')
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('row_lock_backend')
+def test_import_lock_is_exclusive_and_released():
+    """Tests that a held lock row blocks others until it is released."""
+    with import_lock() as acquired:
+        assert acquired
+        with import_lock() as acquired_again:
+            assert not acquired_again
+
+    assert not ImportLock.objects.exists()
+    with import_lock() as acquired:
+        assert acquired
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('row_lock_backend')
+def test_import_lock_takes_over_stale_row():
+    """Tests that an expired lock row from a dead process is reclaimed."""
+    ImportLock.objects.create(
+        name='sympla-import',
+        owner='dead-host:1',
+        expires_at=timezone.now() - timedelta(minutes=1),
+    )
+
+    with import_lock() as acquired:
+        assert acquired
+        assert ImportLock.objects.get().owner != 'dead-host:1'
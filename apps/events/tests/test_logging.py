@@ -0,0 +1,69 @@
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from apps.events.management.commands import import_sympla_events
+from utils.log_formatters import JsonFormatter
+
+
+def test_json_formatter_includes_extra_fields():
+    """Tests that the JSON formatter emits structured extra fields."""
+    record = logging.LogRecord(
+        'apps.events', logging.INFO, __file__, 1, 'Batch %s done', (7,), None
+    )
+    record.batch_id = 7
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload['message'] == 'Batch 7 done'
+    assert payload['level'] == 'INFO'
+    assert payload['batch_id'] == 7  # noqa: PLR2004
+    assert 'args' not in payload
+
+
+@patch('apps.events.management.commands.import_sympla_events.logger')
+@patch('apps.events.management.commands.import_sympla_events.SymplaService')
+@pytest.mark.django_db
+def test_import_logging_is_sampled_and_rate_limited(
+    MockSymplaService, mock_logger
+):
+    """
+    Tests that per-event and validation error logs are bounded regardless
+    of catalogue size, with lazy %-style arguments.
+    """
+    LIMIT = import_sympla_events.VALIDATION_ERROR_LOG_LIMIT
+    valid = [
+        {
+            'id': f'evt{index}',
+            'name': f'Evento {index}',
+            'start_date': '2025-10-20T20:00:00',
+            'end_date': '2025-10-20T22:00:00',
+            'address': {'name': 'Local', 'city': 'Recife'},
+            'category_prim': {'name': 'Música'},
+            'category_sec': {'name': 'Rock'},
+        }
+        for index in range(250)
+    ]
+    invalid = [{'id': f'bad{index}'} for index in range(LIMIT + 10)]
+    MockSymplaService.return_value.fetch_events.return_value = valid + invalid
+    mock_logger.isEnabledFor.return_value = False
+
+    call_command('import_sympla_events')
+
+    # 20 detailed validation errors plus one "limit reached" notice.
+    assert mock_logger.warning.call_count == LIMIT + 1
+    sampled = [
+        call
+        for call in mock_logger.info.call_args_list
+        if call.args[0].startswith('Event %s')
+    ]
+    assert len(sampled) == 3  # noqa: PLR2004  events 1, 101 and 201
+    progress = [
+        call
+        for call in mock_logger.info.call_args_list
+        if 'progress' in call.args[0]
+    ]
+    assert progress[-1].kwargs['extra']['events_processed'] == len(valid)
@@ -0,0 +1,69 @@
+from datetime import UTC, date, datetime
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+
+from apps.events import partitions
+from apps.events.models import Event, EventArchive, LoadBatch
+
+
+def test_add_months_crosses_year_boundaries():
+    """Tests month arithmetic used to compute partition ranges."""
+    assert partitions.add_months(date(2025, 11, 1), 2) == date(2026, 1, 1)
+    assert partitions.add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partitions.month_start(date(2025, 7, 24)) == date(2025, 7, 1)
+
+
+def test_partition_names_round_trip():
+    """Tests that partition names encode and decode their month."""
+    month = date(2025, 3, 1)
+    name = partitions.partition_name(month)
+
+    assert name == 'events_event_p2025_03'
+    assert partitions.parse_partition_month(name) == month
+    assert partitions.parse_partition_month('events_event_default') is None
+    assert partitions.archive_name(month) == 'events_event_archive_2025_03'
+
+
+@pytest.mark.django_db
+def test_manage_partitions_requires_postgresql():
+    """Tests that the command refuses to run on non-PostgreSQL backends."""
+    if partitions.is_supported():
+        pytest.skip('Only relevant for non-PostgreSQL backends.')
+
+    with pytest.raises(CommandError, match='requires PostgreSQL'):
+        call_command('manage_event_partitions')
+
+
+@pytest.mark.django_db
+def test_retain_months_archives_default_partition_events():
+    """
+    Tests that events of old months stored in the default partition are
+    archived with their month, which is recorded so imports skip it.
+    """
+    if not partitions.is_supported():
+        pytest.skip('Requires PostgreSQL.')
+    call_command('manage_event_partitions', convert=True, months_ahead=0)
+    old = Event.objects.create(
+        event_id='old',
+        name='Old',
+        start_date=datetime(2020, 5, 10, 20, tzinfo=UTC),
+        end_date=datetime(2020, 5, 10, 22, tzinfo=UTC),
+        category='Música',
+        load_batch=LoadBatch.objects.create(),
+    )
+    # Run the deferred foreign key check of the insert now; PostgreSQL
+    # refuses to detach a partition with checks still pending.
+    connection.check_constraints()
+    assert partitions.default_partition_months() == [date(2020, 5, 1)]
+
+    call_command('manage_event_partitions', months_ahead=0, retain_months=1)
+
+    assert not Event.objects.filter(pk=old.pk).exists()
+    archive = EventArchive.objects.get()
+    assert archive.month == date(2020, 5, 1)
+    assert archive.table_name == 'events_event_archive_2020_05'
+    assert partitions.archive_cutoff() == datetime(2020, 6, 1, tzinfo=UTC)
+    assert partitions.is_archived(old.start_date, partitions.archive_cutoff())
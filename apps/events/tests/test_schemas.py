@@ -3,7 +3,11 @@ from datetime import datetime
 import pytest
 from pydantic import ValidationError
 
-from apps.events.schemas import SymplaEventSchema
+from apps.events.schemas import (
+    SymplaEventSchema,
+    SymplaOrderSchema,
+    SymplaParticipantSchema,
+)
 from utils.enums import EventType
 
 
@@ -68,3 +72,33 @@ def test_schema_raises_validation_error_on_missing_data():
 
     with pytest.raises(ValidationError):
         SymplaEventSchema.model_validate(invalid_payload)
+
+
+def test_order_and_participant_schema_validation():
+    """
+    Tests that numeric Sympla ids are read as strings and that the
+    check-in flag is derived from the list or object Sympla sends.
+    """
+    order = SymplaOrderSchema.model_validate({
+        'id': 123,
+        'order_status': 'A',
+        'order_date': '2025-10-01 10:30:00',
+        'order_total_sale_price': '99.90',
+    })
+    checked_in = SymplaParticipantSchema.model_validate({
+        'id': 7,
+        'order_id': 123,
+        'checkin': [{'id': 1, 'check_in': True}],
+    })
+    not_checked_in = SymplaParticipantSchema.model_validate({
+        'id': 8,
+        'order_id': 123,
+        'checkin': {'id': 2, 'check_in': False},
+    })
+
+    assert order.id == '123'
+    assert order.order_date == datetime(2025, 10, 1, 10, 30)
+    assert str(order.order_total_sale_price) == '99.90'
+    assert checked_in.order_id == '123'
+    assert checked_in.checked_in is True
+    assert not_checked_in.checked_in is False
@@ -1,9 +1,14 @@
+import gzip
+import json
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 import requests
 
-from apps.events.services import SymplaService
+from apps.events.services import Organizer, SymplaService, load_organizers
+from apps.events.stats import ImportStats
+from benchmarks.fake_sympla import FakeSymplaServer, fake_sympla_process
 
 
 @patch('apps.events.services.requests.Session.get')
@@ -13,10 +18,10 @@ def test_fetch_events_success_single_page(mock_get):
     """
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         'data': [{'id': 1, 'name': 'Evento Mockado 1'}],
         'pagination': {'has_next': False},
-    }
+    })
     mock_get.return_value = mock_response
 
     service = SymplaService()
@@ -34,20 +39,20 @@ def test_fetch_events_handles_pagination(mock_get):
     response_page1 = MagicMock()
     response_page1.status_code = 200
     response_page1 = MagicMock()
-    response_page1.json.return_value = {
+    response_page1.content = orjson.dumps({
         'data': [{'id': 1, 'name': 'Evento da Página 1'}],
         'pagination': {
             'has_next': True,
             'next_page_url': 'http://api.com/page2',
         },
-    }
+    })
 
     response_page2 = MagicMock()
     EVENTS_COUNT = 2
-    response_page2.json.return_value = {
+    response_page2.content = orjson.dumps({
         'data': [{'id': 2, 'name': 'Evento da Página 2'}],
         'pagination': {'has_next': False},
-    }
+    })
 
     mock_get.side_effect = [response_page1, response_page2]
 
@@ -71,11 +76,13 @@ def test_fetch_events_handles_http_error(mock_get):
     )
     mock_get.side_effect = http_error
 
-    service = SymplaService()
+    stats = ImportStats()
+    service = SymplaService(stats=stats)
     events = service.fetch_events()
 
     assert events == []
     mock_get.assert_called_once()
+    assert stats.http_responses == {'500': 1}
 
 
 @patch('apps.events.services.requests.Session.get')
@@ -83,11 +90,13 @@ def test_fetch_events_handles_timeout(mock_get):
     """Test the fetch_events method for timeout errors."""
     mock_get.side_effect = requests.exceptions.Timeout('Request timed out')
 
-    service = SymplaService()
+    stats = ImportStats()
+    service = SymplaService(stats=stats)
     events = service.fetch_events()
 
     assert events == []
     mock_get.assert_called_once()
+    assert stats.http_responses == {'timeout': 1}
 
 
 @patch('apps.events.services.config', return_value=None)
@@ -103,3 +112,158 @@ def test_service_initialization_fails_without_token(mock_config):
     assert 'Sympla API SYMPLA_API_TOKEN is not configured.' in str(
         excinfo.value
     )
+
+
+@patch('apps.events.services.requests.Session.get')
+def test_fetch_events_collects_stats(mock_get):
+    """
+    Test that fetch_events records pages, bytes, HTTP time and responses.
+    """
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({
+        'data': [{'id': 1, 'name': 'Evento Mockado 1'}],
+        'pagination': {'has_next': False},
+    })
+    mock_get.return_value = mock_response
+    stats = ImportStats()
+
+    SymplaService(stats=stats).fetch_events()
+
+    assert stats.pages_fetched == 1
+    assert stats.http_responses == {'200': 1}
+    assert stats.bytes_downloaded == len(mock_response.content)
+    assert stats.http_time > 0
+
+
+def test_fetch_events_from_fake_sympla_server(monkeypatch):
+    """
+    Test that SymplaService crawls every page served by the local fake
+    Sympla server used by the import benchmark.
+    """
+    PAGES, PAGE_SIZE = 3, 4
+    with FakeSymplaServer(pages=PAGES, page_size=PAGE_SIZE) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        stats = ImportStats()
+        events = SymplaService(stats=stats).fetch_events()
+
+    assert len(events) == PAGES * PAGE_SIZE
+    assert events[0]['id'] == 'bench-1-0'
+    assert events[-1]['id'] == f'bench-{PAGES}-{PAGE_SIZE - 1}'
+    assert stats.pages_fetched == PAGES
+
+
+def test_fake_sympla_process_serves_from_a_child_process(monkeypatch):
+    """
+    Test that the fake Sympla server the import benchmark runs in its own
+    process serves the same pages, and stops with the block.
+    """
+    with fake_sympla_process(pages=2, page_size=3) as url:
+        monkeypatch.setenv('SYMPLA_BASE_URL', url)
+        events = SymplaService().fetch_events()
+
+    assert len(events) == 6  # noqa: PLR2004
+    assert events[0]['id'] == 'bench-1-0'
+    with pytest.raises(requests.exceptions.ConnectionError):
+        requests.get(url, timeout=1)
+
+
+def test_fetch_events_requests_compressed_transfer(monkeypatch):
+    """
+    Test that SymplaService asks for, and decodes, gzipped pages, counting
+    the compressed bytes received as downloaded.
+    """
+    stats = ImportStats()
+    with FakeSymplaServer(pages=2, page_size=3) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        events = SymplaService(stats=stats).fetch_events()
+        compressed = sum(
+            len(gzip.compress(json.dumps(server.page_payload(page)).encode()))
+            for page in (1, 2)
+        )
+
+    assert len(events) == 6  # noqa: PLR2004
+    assert server.compressed_responses == server.requests_served
+    assert stats.bytes_downloaded == compressed
+
+
+def test_fake_sympla_server_error_rate_stops_crawl(monkeypatch):
+    """Test that injected HTTP 500 errors reach SymplaService."""
+    with FakeSymplaServer(pages=5, page_size=2, error_rate=1.0) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        events = SymplaService().fetch_events()
+
+    assert events == []
+    assert server.requests_served == 1
+
+
+def test_load_organizers_parses_credentials(monkeypatch):
+    """Test that SYMPLA_ORGANIZERS is read as slug:token pairs."""
+    monkeypatch.setenv('SYMPLA_ORGANIZERS', 'acme:token-a, beta:token-b')
+
+    assert load_organizers() == [
+        Organizer(slug='acme', token='token-a'),
+        Organizer(slug='beta', token='token-b'),
+    ]
+
+    monkeypatch.setenv('SYMPLA_ORGANIZERS', 'acme')
+    with pytest.raises(ValueError, match='acme'):
+        load_organizers()
+
+
+def test_fetch_events_namespaces_organizer_events(monkeypatch):
+    """
+    Test that an organizer's token is sent, its event ids are prefixed
+    with its slug and its requests are rate limited.
+    """
+    monkeypatch.setenv('SYMPLA_RATE_LIMIT', '20')
+    with FakeSymplaServer(pages=3, page_size=1) as server:
+        monkeypatch.setenv('SYMPLA_BASE_URL', server.url)
+        service = SymplaService(organizer=Organizer('acme', 'token-a'))
+        with patch('apps.events.services.time.sleep') as mock_sleep:
+            events = service.fetch_events()
+
+    assert service.api_client.session.headers['S_Token'] == 'token-a'
+    assert [event['id'] for event in events] == [
+        'acme-bench-1-0',
+        'acme-bench-2-0',
+        'acme-bench-3-0',
+    ]
+    assert mock_sleep.call_count == 2  # noqa: PLR2004
+
+
+@patch('apps.events.services.requests.Session.get')
+def test_iter_events_yields_events_one_at_a_time(mock_get):
+    """
+    Test that iter_events streams events page by page and reports each
+    page's pagination once its events were consumed.
+    """
+    pages = [
+        {
+            'data': [{'id': 1}, {'id': 2}],
+            'pagination': {'has_next': True, 'next_page_url': 'http://p2'},
+        },
+        {'data': [{'id': 3}], 'pagination': {'has_next': False}},
+    ]
+    mock_get.side_effect = [
+        MagicMock(content=orjson.dumps(page)) for page in pages
+    ]
+    on_page = MagicMock()
+
+    events = SymplaService().iter_events(on_page=on_page)
+
+    assert next(events) == {'id': 1}
+    assert mock_get.call_count == 1
+    assert on_page.call_count == 0
+    assert [event['id'] for event in events] == [2, 3]
+    assert [call.args[0] for call in on_page.call_args_list] == [
+        page['pagination'] for page in pages
+    ]
+
+
+@patch('apps.events.services.requests.Session.get')
+def test_fetch_events_handles_invalid_json(mock_get):
+    """Test that a malformed body stops the crawl like other errors."""
+    mock_get.return_value = MagicMock(content=b'{"data": [')
+
+    assert SymplaService().fetch_events() == []
@@ -1,10 +1,30 @@
+import gzip
+import json
+import subprocess
+import sys
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
 import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import DataError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from apps.events.models import Event, LoadBatch
-from utils.enums import EventType
+from apps.events import webhooks
+from apps.events.caching import data_version
+from apps.events.metrics import record_finished_import, render_metrics
+from apps.events.middleware import ENCODERS, negotiate_encoding
+from apps.events.models import Event, EventArchive, EventChange, LoadBatch
+from apps.events.openapi import get_schema, get_schema_etag
+from apps.events.runner import run_queued_import
+from apps.events.webhooks import SIGNATURE_HEADER, sign
+from utils.enums import BatchSource, ChangeKind, EventType, Status
 
 
 @pytest.mark.django_db
@@ -48,3 +68,772 @@ def test_list_events_api_view():
 
     assert response.data[0]['name'] == 'Test Event B'
     assert response.data[0]['event_type'] == EventType.ONLINE.name
+
+
+@pytest.mark.django_db
+def test_list_events_filters_by_start_date_range():
+    """
+    Test that start_date_after/start_date_before narrow the listed events.
+    """
+    client = APIClient()
+    batch = LoadBatch.objects.create(status='SUCCESS')
+    for event_id, start in (
+        ('evt_sep', '2025-09-15T10:00:00Z'),
+        ('evt_oct', '2025-10-15T10:00:00Z'),
+        ('evt_nov', '2025-11-15T10:00:00Z'),
+    ):
+        Event.objects.create(
+            event_id=event_id,
+            name=event_id,
+            start_date=start,
+            end_date=start,
+            event_type=EventType.ONLINE.name,
+            category='Technology',
+            sub_category='Python',
+            load_batch=batch,
+        )
+
+    response = client.get(
+        '/api/events/',
+        {'start_date_after': '2025-10-01', 'start_date_before': '2025-11-01'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [event['event_id'] for event in response.data] == ['evt_oct']
+
+
+@pytest.mark.django_db
+def test_list_events_rejects_invalid_date_filter():
+    """Test that a malformed date filter returns a 400 error."""
+    client = APIClient()
+
+    response = client.get('/api/events/', {'start_date_after': 'tomorrow'})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'start_date_after' in response.data
+
+
+@pytest.mark.django_db
+def test_list_batch_changes_api_view():
+    """
+    Test that the batch changes endpoint lists the batch's change log.
+    """
+    client = APIClient()
+    batch = LoadBatch.objects.create(status='SUCCESS')
+    other_batch = LoadBatch.objects.create(status='SUCCESS')
+    EventChange.objects.create(
+        load_batch=batch,
+        event_id='evt001',
+        kind=ChangeKind.UPDATED.name,
+        changed_fields=['name', 'city'],
+    )
+    EventChange.objects.create(
+        load_batch=other_batch,
+        event_id='evt002',
+        kind=ChangeKind.CREATED.name,
+    )
+
+    response = client.get(f'/api/batches/{batch.id}/changes/')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [
+        {
+            'event_id': 'evt001',
+            'kind': ChangeKind.UPDATED.name,
+            'changed_fields': ['name', 'city'],
+        }
+    ]
+
+
+@pytest.mark.django_db
+def test_list_batch_changes_unknown_batch():
+    """Test that an unknown batch id returns 404."""
+    client = APIClient()
+
+    response = client.get('/api/batches/999/changes/')
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_api_and_importer_metrics(
+    django_assert_num_queries,
+):
+    """
+    Test that /metrics reports route latency, SQL usage and importer data,
+    Sympla API responses included, from running totals kept as batches
+    finish, so a scrape runs the same queries however many batches exist.
+    """
+    client = APIClient()
+    batch = LoadBatch.objects.create(
+        status='SUCCESS',
+        events_imported_count=3,
+        http_responses={'200': 4, '429': 1},
+    )
+    failed = LoadBatch.objects.create(
+        status='ERROR', http_responses={'429': 2}
+    )
+    LoadBatch.objects.create(status='PENDING', events_imported_count=5)
+    LoadBatch.objects.filter(pk=batch.pk).update(
+        finished_at=batch.started_at + timedelta(seconds=2)
+    )
+    record_finished_import(batch)
+    record_finished_import(failed)
+    client.get('/api/events/')
+
+    with django_assert_num_queries(3):
+        render_metrics()
+    response = client.get('/metrics')
+    body = response.content.decode()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'].startswith('text/plain')
+    assert 'http_request_duration_seconds_bucket{' in body
+    assert 'route="event-list"' in body
+    assert 'http_request_db_queries_count{route="event-list"}' in body
+    assert 'importer_last_batch_duration_seconds 2.0' in body
+    assert 'importer_events_written_total{status="SUCCESS"} 3.0' in body
+    assert 'importer_events_written_total{status="PENDING"} 5.0' in body
+    assert 'sympla_http_responses_total{status="429"} 3.0' in body
+
+
+@pytest.mark.django_db
+def test_list_events_stays_within_query_budget(assert_query_budget):
+    """
+    Test that listing events runs a constant number of queries, so
+    per-row lookups (N+1) fail the suite.
+    """
+    client = APIClient()
+    batch = LoadBatch.objects.create(status='SUCCESS')
+    Event.objects.bulk_create(
+        Event(
+            event_id=f'evt_{index}',
+            name=f'Event {index}',
+            start_date=timezone.now(),
+            end_date=timezone.now(),
+            event_type=EventType.ONLINE.name,
+            category='Technology',
+            sub_category='Python',
+            load_batch=batch,
+        )
+        for index in range(30)
+    )
+
+    with assert_query_budget('event-list'):
+        response = client.get('/api/events/', {'limit': 25})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 25  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_query_profiling_middleware_logs_requests_over_budget():
+    """
+    Test that the opt-in profiler reports SQL usage and logs slow requests.
+    """
+    with override_settings(
+        QUERY_PROFILING=True, QUERY_PROFILING_MAX_QUERIES=0
+    ):
+        client = APIClient()
+        with patch('apps.events.middleware.logger') as mock_logger:
+            response = client.get('/api/events/')
+
+    assert response['X-DB-Query-Count'] == '1'
+    mock_logger.warning.assert_called_once()
+    assert 'SELECT' in mock_logger.warning.call_args.args[-1]
+
+
+@patch('apps.events.runner._executor')
+@pytest.mark.django_db
+def test_create_import_queues_a_single_background_run(
+    mock_executor, django_capture_on_commit_callbacks
+):
+    """
+    Test that POST /api/imports/ queues one background import and returns
+    the already active batch to later callers.
+    """
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user('admin', is_staff=True))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post('/api/imports/')
+    repeated = client.post('/api/imports/')
+
+    batch = LoadBatch.objects.get()
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data['status'] == Status.QUEUED.name
+    assert response.data['phase'] == 'queued'
+    assert response['Location'].endswith(f'/api/imports/{batch.id}/')
+    mock_executor.return_value.submit.assert_called_once_with(
+        run_queued_import, batch.id
+    )
+    assert repeated.status_code == status.HTTP_200_OK
+    assert repeated.data['id'] == batch.id
+
+
+@pytest.mark.django_db
+def test_imports_api_requires_a_staff_user():
+    """
+    Test that anonymous and non-staff callers can neither start an import
+    nor poll one.
+    """
+    client = APIClient()
+    batch = LoadBatch.objects.create(status=Status.ERROR.name)
+    url = f'/api/imports/{batch.id}/'
+
+    anonymous = client.post('/api/imports/')
+    anonymous_poll = client.get(url)
+    client.force_authenticate(User.objects.create_user('viewer'))
+    non_staff = client.post('/api/imports/')
+    non_staff_poll = client.get(url)
+
+    assert anonymous.status_code in {
+        status.HTTP_401_UNAUTHORIZED,
+        status.HTTP_403_FORBIDDEN,
+    }
+    assert anonymous_poll.status_code == anonymous.status_code
+    assert non_staff.status_code == status.HTTP_403_FORBIDDEN
+    assert non_staff_poll.status_code == status.HTTP_403_FORBIDDEN
+    assert LoadBatch.objects.get() == batch
+
+
+@pytest.mark.django_db
+def test_import_progress_reports_rate_and_eta():
+    """
+    Test that polling an import reports the written events, rate and ETA.
+    """
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user('admin', is_staff=True))
+    batch = LoadBatch.objects.create(
+        status=Status.PENDING.name,
+        pages_fetched=4,
+        pages_total=4,
+        events_total=400,
+        events_imported_count=100,
+    )
+    LoadBatch.objects.filter(pk=batch.pk).update(
+        started_at=timezone.now() - timedelta(seconds=10)
+    )
+
+    response = client.get(f'/api/imports/{batch.id}/')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['phase'] == 'writing'
+    assert response.data['events_written'] == 100  # noqa: PLR2004
+    assert response.data['rate'] == pytest.approx(10, rel=0.1)
+    assert response.data['eta_seconds'] == pytest.approx(30, rel=0.1)
+
+
+@pytest.mark.django_db
+def test_import_progress_unknown_batch():
+    """Test that polling an unknown batch returns 404."""
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user('admin', is_staff=True))
+
+    response = client.get('/api/imports/999/')
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_list_events_is_compressed_once_per_body():
+    """
+    Test that gzip is negotiated on Accept-Encoding and that the
+    compressed body of an unchanged page is served from the cache.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    Event.objects.bulk_create(
+        Event(
+            event_id=f'evt{index}',
+            name=f'Event {index}',
+            start_date=timezone.now(),
+            end_date=timezone.now(),
+            event_type=EventType.ONLINE.name,
+            category='Technology',
+            sub_category='Python',
+            load_batch=batch,
+        )
+        for index in range(20)
+    )
+    client = APIClient()
+    compressor = MagicMock(wraps=ENCODERS['gzip'])
+
+    with patch.dict(ENCODERS, {'gzip': compressor}, clear=True):
+        plain = client.get('/api/events/')
+        first = client.get('/api/events/', HTTP_ACCEPT_ENCODING='gzip')
+        second = client.get('/api/events/', HTTP_ACCEPT_ENCODING='gzip')
+
+    assert 'Content-Encoding' not in plain
+    assert 'Accept-Encoding' in plain['Vary']
+    assert first['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(first.content) == plain.content
+    assert second.content == first.content
+    compressor.assert_called_once()
+
+
+def test_negotiate_encoding_honours_quality_values():
+    """Test Accept-Encoding negotiation, including refusals with q=0."""
+    assert negotiate_encoding('gzip, deflate') == 'gzip'
+    assert negotiate_encoding('deflate, *;q=0.5') == 'gzip'
+    assert negotiate_encoding('gzip;q=0, identity') is None
+    assert negotiate_encoding('') is None
+
+
+def _create_events(batch, *event_ids):
+    return [
+        Event.objects.create(
+            event_id=event_id,
+            name=f'Event {event_id}',
+            start_date=timezone.now(),
+            end_date=timezone.now(),
+            event_type=EventType.ONLINE.name,
+            category='Technology',
+            sub_category='Python',
+            load_batch=batch,
+        )
+        for event_id in event_ids
+    ]
+
+
+@pytest.mark.django_db
+def test_event_detail_is_served_from_the_cache(
+    assert_query_budget, django_assert_num_queries
+):
+    """
+    Test that an event is looked up by event_id once and then served from
+    the per-event cache, with only the data version queried.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    _create_events(batch, 'evt1')
+    client = APIClient()
+
+    with assert_query_budget('event-detail'):
+        response = client.get('/api/events/evt1/')
+    with django_assert_num_queries(1):
+        cached = client.get('/api/events/evt1/')
+    missing = client.get('/api/events/unknown/')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['event_id'] == 'evt1'
+    assert cached.data == response.data
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_data_version_follows_batches_in_one_query(
+    django_assert_num_queries,
+):
+    """
+    Test that the data version changes when a batch starts, commits a
+    chunk or finishes, and costs a single query.
+    """
+    empty = data_version()
+    batch = LoadBatch.objects.create(status=Status.PENDING.name)
+    started = data_version()
+    LoadBatch.objects.filter(pk=batch.pk).update(events_imported_count=500)
+    progressed = data_version()
+    LoadBatch.objects.filter(pk=batch.pk).update(
+        status=Status.SUCCESS.name, finished_at=timezone.now()
+    )
+
+    with django_assert_num_queries(1):
+        finished = data_version()
+
+    assert len({empty, started, progressed, finished}) == 4  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_list_events_by_ids_uses_one_query_for_misses(
+    django_assert_num_queries,
+):
+    """
+    Test that ?ids= returns the events in the requested order, reading
+    cached ones in one round-trip and the misses in a single query, and
+    that a new load batch invalidates the cached copies.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    first, *_ = _create_events(batch, 'evt1', 'evt2', 'evt3')
+    client = APIClient()
+    client.get('/api/events/', {'ids': 'evt1'})
+
+    with django_assert_num_queries(2):
+        response = client.get('/api/events/', {'ids': 'evt3,evt1,nope,evt2'})
+    Event.objects.filter(pk=first.pk).update(name='Renamed')
+    stale = client.get('/api/events/', {'ids': 'evt1'})
+    LoadBatch.objects.create(status=Status.PENDING.name)
+    fresh = client.get('/api/events/', {'ids': 'evt1'})
+
+    assert [event['event_id'] for event in response.data] == [
+        'evt3',
+        'evt1',
+        'evt2',
+    ]
+    assert stale.data[0]['name'] == 'Event evt1'
+    assert fresh.data[0]['name'] == 'Renamed'
+
+
+@pytest.mark.django_db
+def test_large_multi_get_is_fully_served_from_the_cache():
+    """
+    Test that a repeated multi-get of hundreds of ids reads every event
+    from the cache, querying only the data version.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    event_ids = [f'evt{index}' for index in range(400)]
+    _create_events(batch, *event_ids)
+    client = APIClient()
+    ids = ','.join(event_ids)
+    client.get('/api/events/', {'ids': ids})
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get('/api/events/', {'ids': ids})
+
+    assert len(response.data) == len(event_ids)
+    assert len(queries) == 1
+    assert Event._meta.db_table not in queries[0]['sql']
+
+
+@pytest.mark.django_db
+def test_upcoming_events_are_sorted_and_cached_until_a_batch_finishes(
+    assert_query_budget, django_assert_num_queries
+):
+    """
+    Test that /api/events/upcoming/ lists only events not over yet, soonest
+    first, serving repeated requests from the cache until a batch finishes.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    now = timezone.now()
+    for event_id, start in (
+        ('past', now - timedelta(days=2)),
+        ('later', now + timedelta(days=2)),
+        ('running', now - timedelta(hours=1)),
+        ('soon', now + timedelta(days=1)),
+    ):
+        Event.objects.create(
+            event_id=event_id,
+            name=event_id,
+            start_date=start,
+            end_date=start + timedelta(hours=3),
+            event_type=EventType.ONLINE.name,
+            category='Technology',
+            sub_category='Python',
+            load_batch=batch,
+        )
+    client = APIClient()
+    url = '/api/events/upcoming/'
+
+    with assert_query_budget('event-upcoming'):
+        response = client.get(url, {'limit': 10})
+    Event.objects.filter(event_id='soon').update(name='Renamed')
+    with django_assert_num_queries(1):
+        cached = client.get(url, {'limit': 10})
+    LoadBatch.objects.create(
+        status=Status.SUCCESS.name, finished_at=timezone.now()
+    )
+    refreshed = client.get(url, {'limit': 10})
+
+    assert [event['event_id'] for event in response.data['results']] == [
+        'running',
+        'soon',
+        'later',
+    ]
+    assert cached.data == response.data
+    assert refreshed.data['results'][1]['name'] == 'Renamed'
+
+
+@pytest.mark.django_db
+def test_list_events_rejects_too_many_ids():
+    """Test that the multi-get is capped and needs at least one id."""
+    client = APIClient()
+    too_many = ','.join(f'evt{index}' for index in range(501))
+
+    assert client.get('/api/events/', {'ids': too_many}).status_code == (
+        status.HTTP_400_BAD_REQUEST
+    )
+    assert client.get('/api/events/', {'ids': ' , '}).status_code == (
+        status.HTTP_400_BAD_REQUEST
+    )
+
+
+@pytest.mark.django_db
+def test_list_events_returns_sparse_fieldsets():
+    """
+    Test that ?fields= narrows both the payload and the selected columns,
+    also for ?ids=, and that unknown fields are rejected.
+    """
+    batch = LoadBatch.objects.create(status=Status.SUCCESS.name)
+    _create_events(batch, 'evt1', 'evt2')
+    client = APIClient()
+    fields = 'event_id,name,start_date'
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get('/api/events/', {'fields': fields})
+    (select,) = [
+        query['sql'].split(' FROM ')[0]
+        for query in queries
+        if 'events_event' in query['sql']
+    ]
+    by_ids = client.get('/api/events/', {'ids': 'evt2', 'fields': fields})
+    unknown = client.get('/api/events/', {'fields': 'name,secret'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [set(event) for event in response.data] == [
+        {'event_id', 'name', 'start_date'}
+    ] * 2
+    assert '"city"' not in select
+    assert '"name"' in select
+    assert by_ids.data == [
+        {
+            'event_id': 'evt2',
+            'name': 'Event evt2',
+            'start_date': by_ids.data[0]['start_date'],
+        }
+    ]
+    assert unknown.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'secret' in unknown.data['fields']
+
+
+def _post_webhook(
+    client, payload, secret='test-secret', url='/api/webhooks/sympla/'
+):
+    body = json.dumps(payload).encode()
+    return client.post(
+        url,
+        body,
+        content_type='application/json',
+        headers={SIGNATURE_HEADER: sign(body, secret)},
+    )
+
+
+def _sympla_event(event_id, name):
+    return {
+        'id': event_id,
+        'name': name,
+        'start_date': '2025-10-20T20:00:00',
+        'end_date': '2025-10-20T22:00:00',
+        'address': {'name': 'Local A', 'city': 'Recife'},
+        'category_prim': {'name': 'Música'},
+        'category_sec': {'name': 'Rock'},
+    }
+
+
+@pytest.mark.django_db
+def test_webhook_buffers_and_flushes_deduplicated_events(webhook_buffer):
+    """
+    Test that valid notifications are accepted without touching the
+    events table and flushed as one batch, keeping the latest state of
+    each event.
+    """
+    client = APIClient()
+
+    response = _post_webhook(
+        client,
+        [
+            _sympla_event('evt1', 'First name'),
+            _sympla_event('evt2', 'Other event'),
+            _sympla_event('evt1', 'Latest name'),
+            {'id': 'evt3'},
+        ],
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data['accepted'] == 3  # noqa: PLR2004
+    assert response.data['rejected'][0]['id'] == 'evt3'
+    assert not Event.objects.exists()
+    assert len(webhook_buffer) == 2  # noqa: PLR2004
+
+    assert webhook_buffer.flush() == 2  # noqa: PLR2004
+
+    batch = LoadBatch.objects.get()
+    assert batch.source == BatchSource.WEBHOOK.name
+    assert batch.status == Status.SUCCESS.name
+    assert Event.objects.get(event_id='evt1').name == 'Latest name'
+    assert EventChange.objects.filter(load_batch=batch).count() == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_webhook_flush_only_writes_changed_events(webhook_buffer):
+    """
+    Test that a flush updates changed events, skips unchanged ones and
+    records no batch when nothing changed.
+    """
+    client = APIClient()
+    _post_webhook(client, [_sympla_event('evt1', 'Name')])
+    webhook_buffer.flush()
+
+    _post_webhook(client, [_sympla_event('evt1', 'Name')])
+    unchanged = webhook_buffer.flush()
+    _post_webhook(client, {'data': [_sympla_event('evt1', 'Renamed')]})
+    changed = webhook_buffer.flush()
+
+    assert unchanged == 0
+    assert changed == 1
+    assert LoadBatch.objects.count() == 2  # noqa: PLR2004
+    assert Event.objects.get().name == 'Renamed'
+    change = EventChange.objects.latest('id')
+    assert change.kind == ChangeKind.UPDATED.name
+    assert change.changed_fields == ['name']
+
+
+@pytest.mark.django_db
+def test_webhook_ignores_events_of_archived_months(webhook_buffer):
+    """
+    Test that a flush does not write events starting in a month whose
+    partition was archived.
+    """
+    EventArchive.objects.create(month=date(2025, 10, 1))
+    recent = _sympla_event('evt2', 'Recent')
+    recent['start_date'] = '2025-11-05T20:00:00'
+    recent['end_date'] = '2025-11-05T22:00:00'
+
+    _post_webhook(APIClient(), [_sympla_event('evt1', 'Old'), recent])
+
+    assert webhook_buffer.flush() == 1
+    assert list(Event.objects.values_list('event_id', flat=True)) == ['evt2']
+
+
+@pytest.mark.django_db
+def test_webhook_rejects_unsigned_requests_and_full_buffer(
+    webhook_buffer, settings
+):
+    """
+    Test that bad signatures are refused and that a full buffer answers
+    503 so the sender retries.
+    """
+    client = APIClient()
+    webhook_buffer.max_size = 1
+
+    forged = _post_webhook(client, [_sympla_event('evt1', 'A')], 'wrong')
+    accepted = _post_webhook(client, [_sympla_event('evt1', 'A')])
+    full = _post_webhook(client, [_sympla_event('evt2', 'B')])
+    settings.SYMPLA_WEBHOOK_SECRET = ''
+    disabled = _post_webhook(client, [_sympla_event('evt1', 'A')], '')
+
+    assert forged.status_code == status.HTTP_403_FORBIDDEN
+    assert accepted.status_code == status.HTTP_202_ACCEPTED
+    assert full.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert full['Retry-After'] == '1'
+    assert disabled.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_webhook_prefixes_organizer_event_ids(webhook_buffer, monkeypatch):
+    """
+    Test that notifications sent to an organizer's URL are stored under
+    the prefixed ids the importer uses, and that unknown organizers are
+    refused.
+    """
+    monkeypatch.setenv('SYMPLA_ORGANIZERS', 'acme:token-a')
+    client = APIClient()
+
+    accepted = _post_webhook(
+        client,
+        [_sympla_event('evt1', 'Name')],
+        url='/api/webhooks/sympla/acme/',
+    )
+    unknown = _post_webhook(
+        client,
+        [_sympla_event('evt1', 'Name')],
+        url='/api/webhooks/sympla/beta/',
+    )
+    webhook_buffer.flush()
+
+    assert accepted.status_code == status.HTTP_202_ACCEPTED
+    assert unknown.status_code == status.HTTP_404_NOT_FOUND
+    assert list(Event.objects.values_list('event_id', flat=True)) == [
+        'acme-evt1'
+    ]
+
+
+@pytest.mark.django_db
+def test_webhook_drops_rows_the_database_rejects(webhook_buffer):
+    """
+    Test that values over the column limits are rejected on receipt, and
+    that a row the database still rejects is dropped on flush instead of
+    blocking the other events forever.
+    """
+    client = APIClient()
+    too_long = _post_webhook(client, [_sympla_event('evt1', 'x' * 256)])
+    _post_webhook(
+        client,
+        [_sympla_event('evt1', 'Good'), _sympla_event('poison', 'Bad')],
+    )
+    write_changes = webhooks._write_changes
+
+    def reject_poison(events):
+        if any(event.id == 'poison' for event in events):
+            raise DataError('value too long')
+        return write_changes(events)
+
+    with patch('apps.events.webhooks._write_changes', reject_poison):
+        written = webhook_buffer.flush()
+
+    assert too_long.status_code == status.HTTP_400_BAD_REQUEST
+    assert written == 1
+    assert len(webhook_buffer) == 0
+    assert list(Event.objects.values_list('event_id', flat=True)) == ['evt1']
+
+
+@pytest.fixture
+def prebuilt_schema(settings, tmp_path):
+    """Build the OpenAPI schema into a temporary OPENAPI_SCHEMA_DIR."""
+    settings.OPENAPI_SCHEMA_DIR = str(tmp_path)
+    get_schema.cache_clear()
+    get_schema_etag.cache_clear()
+    call_command('build_openapi_schema', stdout=StringIO())
+    yield tmp_path
+    get_schema.cache_clear()
+    get_schema_etag.cache_clear()
+
+
+@pytest.mark.django_db
+def test_schema_is_served_from_the_prebuilt_file(prebuilt_schema):
+    """
+    Test that /schema/ serves the build-time schema with an ETag, as YAML
+    by default and as JSON on request.
+    """
+    client = APIClient()
+
+    response = client.get('/schema/')
+    cached = client.get('/schema/', HTTP_IF_NONE_MATCH=response['ETag'])
+    as_json = client.get('/schema/', {'format': 'json'})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Content-Type'] == 'application/vnd.oai.openapi'
+    assert response.content == (prebuilt_schema / 'openapi.yaml').read_bytes()
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert '/api/events/' in json.loads(as_json.content)['paths']
+
+
+@pytest.mark.django_db
+def test_schema_builds_without_warnings(settings, tmp_path, capsys):
+    """
+    Test that every view is documented: drf-spectacular reports views it
+    cannot describe on stderr while building the schema.
+    """
+    settings.OPENAPI_SCHEMA_DIR = str(tmp_path)
+
+    call_command('build_openapi_schema', stdout=StringIO())
+
+    assert not capsys.readouterr().err
+
+
+def test_web_boot_does_not_import_importer_dependencies():
+    """
+    Test that loading the WSGI app leaves pydantic, dateutil and the
+    schema generator to the code paths that need them.
+    """
+    deferred = ['pydantic', 'dateutil', 'drf_spectacular.generators']
+    code = (
+        'import sys, sympla_integration.wsgi; '
+        f'print([name for name in {deferred!r} if name in sys.modules])'
+    )
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == '[]'
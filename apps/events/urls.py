@@ -1,7 +1,47 @@
 from django.urls import path
 
-from apps.events.views import EventListAPIView
+from apps.events.views import (
+    EventDetailAPIView,
+    EventListAPIView,
+    ImportCreateAPIView,
+    ImportDetailAPIView,
+    LoadBatchChangeListAPIView,
+    SymplaOrganizerWebhookAPIView,
+    SymplaWebhookAPIView,
+    UpcomingEventListAPIView,
+)
 
 urlpatterns = [
     path('events/', EventListAPIView.as_view(), name='event-list'),
+    path(
+        'events/upcoming/',
+        UpcomingEventListAPIView.as_view(),
+        name='event-upcoming',
+    ),
+    path(
+        'events/<str:event_id>/',
+        EventDetailAPIView.as_view(),
+        name='event-detail',
+    ),
+    path(
+        'batches/<int:batch_id>/changes/',
+        LoadBatchChangeListAPIView.as_view(),
+        name='batch-changes',
+    ),
+    path('imports/', ImportCreateAPIView.as_view(), name='import-create'),
+    path(
+        'imports/<int:batch_id>/',
+        ImportDetailAPIView.as_view(),
+        name='import-detail',
+    ),
+    path(
+        'webhooks/sympla/',
+        SymplaWebhookAPIView.as_view(),
+        name='sympla-webhook',
+    ),
+    path(
+        'webhooks/sympla/<slug:organizer>/',
+        SymplaOrganizerWebhookAPIView.as_view(),
+        name='sympla-organizer-webhook',
+    ),
 ]
@@ -1,15 +1,364 @@
-from rest_framework import generics
+from functools import cache
+from typing import List
+
+import orjson
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.views.decorators.http import condition, require_GET
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from prometheus_client import CONTENT_TYPE_LATEST
+from rest_framework import generics, status
+from rest_framework.exceptions import (
+    NotFound,
+    ParseError,
+    PermissionDenied,
+    ValidationError,
+)
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.views import APIView
+
+from apps.events.caching import get_events_data, get_upcoming_data
+from apps.events.metrics import record_webhook_events, render_metrics
+from apps.events.models import Event, EventChange, LoadBatch
+from apps.events.openapi import SCHEMA_MEDIA_TYPES, get_schema, get_schema_etag
+from apps.events.runner import enqueue_import
+from apps.events.serializers import (
+    EventChangeSerializer,
+    EventSerializer,
+    ImportProgressSerializer,
+    WebhookResultSerializer,
+)
 
-from apps.events.models import Event
-from apps.events.serializers import EventSerializer
+# OpenAPI description of the webhook receivers.
+WEBHOOK_DESCRIPTION = (
+    'Body: one Sympla event, a list of events or a page in the ``data`` '
+    'envelope of the events API.'
+)
+WEBHOOK_RESPONSES = {
+    202: WebhookResultSerializer,
+    400: OpenApiResponse(description='No valid events.'),
+    403: OpenApiResponse(description='Invalid signature.'),
+    503: OpenApiResponse(description='Buffer full; retry later.'),
+}
 
 
 class EventListAPIView(generics.ListAPIView):
     """
     API view to list all events.
+
+    Supports ``start_date_after`` and ``start_date_before`` query parameters
+    (ISO 8601) so date-range queries only touch the relevant partitions.
+    ``ids=a,b,c`` instead returns those events, in that order, from the
+    per-event cache. ``fields=a,b`` restricts each event to those fields and
+    the query to their columns.
+    """
+
+    queryset = Event.objects.all()
+    serializer_class = EventSerializer
+    pagination_class = LimitOffsetPagination
+
+    date_range_params = {
+        'start_date_after': 'start_date__gte',
+        'start_date_before': 'start_date__lt',
+    }
+    max_ids = 500
+
+    def list(self, request, *args, **kwargs):
+        if 'ids' not in request.query_params:
+            return super().list(request, *args, **kwargs)
+        event_ids = self._parse_ids(request.query_params['ids'])
+        events = get_events_data(event_ids)
+        fields = self._parse_fields()
+        return Response([
+            {field: events[event_id][field] for field in fields}
+            if fields
+            else events[event_id]
+            for event_id in event_ids
+            if event_id in events
+        ])
+
+    def _parse_fields(self) -> List[str] | None:
+        """Fields requested with ``?fields=``, or ``None`` for all."""
+        value = self.request.query_params.get('fields')
+        if value is None:
+            return None
+        fields = [
+            *dict.fromkeys(filter(None, map(str.strip, value.split(','))))
+        ]
+        allowed = EventSerializer.Meta.fields
+        unknown = [field for field in fields if field not in allowed]
+        if unknown:
+            raise ValidationError({
+                'fields': (
+                    f'Unknown fields: {", ".join(unknown)}. '
+                    f'Choose from: {", ".join(allowed)}.'
+                )
+            })
+        if not fields:
+            raise ValidationError({'fields': 'Enter at least one field.'})
+        return fields
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self._parse_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def _parse_ids(self, value: str) -> List[str]:
+        """Comma separated event ids, without blanks or duplicates."""
+        event_ids = [
+            *dict.fromkeys(filter(None, map(str.strip, value.split(','))))
+        ]
+        if not event_ids:
+            raise ValidationError({'ids': 'Enter at least one event id.'})
+        if len(event_ids) > self.max_ids:
+            raise ValidationError({
+                'ids': f'Enter at most {self.max_ids} event ids.'
+            })
+        return event_ids
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self._parse_fields()
+        if fields:
+            queryset = queryset.only(*fields)
+        for param, lookup in self.date_range_params.items():
+            value = self.request.query_params.get(param)
+            if value:
+                queryset = queryset.filter(**{
+                    lookup: self._parse_date_param(param, value)
+                })
+        return queryset
+
+    @staticmethod
+    def _parse_date_param(param: str, value: str):
+        """Parse an ISO 8601 date/datetime query parameter."""
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({param: 'Enter a valid ISO 8601 datetime.'})
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+
+class UpcomingEventListAPIView(generics.ListAPIView):
+    """
+    API view to list the events not over yet, soonest first.
+
+    Reads the ``end_date``/``start_date`` index, so the cost follows the
+    number of upcoming events rather than the table size. Pages are cached
+    until a load batch writes events.
+    """
+
+    serializer_class = EventSerializer
+    pagination_class = LimitOffsetPagination
+
+    def get_queryset(self):  # noqa: PLR6301
+        # Ordered by COALESCE(start_date, end_date), which equals start_date
+        # (never null): with a plain start_date and a LIMIT, PostgreSQL walks
+        # the start_date index from the oldest event, skipping every past
+        # one, instead of reading the upcoming ones off the end_date index.
+        return Event.objects.filter(end_date__gte=timezone.now()).order_by(
+            Coalesce('start_date', 'end_date'), 'id'
+        )
+
+    def list(self, request, *args, **kwargs):
+        render_page = super().list
+        data = get_upcoming_data(
+            request.build_absolute_uri(),
+            lambda: render_page(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+
+class EventDetailAPIView(generics.RetrieveAPIView):
+    """
+    API view to retrieve one event by its ``event_id``, served from the
+    per-event cache.
     """
 
     queryset = Event.objects.all()
     serializer_class = EventSerializer
+    lookup_field = 'event_id'
+
+    def retrieve(self, request, *args, **kwargs):
+        event_id = kwargs[self.lookup_field]
+        data = get_events_data([event_id]).get(event_id)
+        if data is None:
+            raise NotFound
+        return Response(data)
+
+
+class LoadBatchChangeListAPIView(generics.ListAPIView):
+    """
+    API view to list the event changes recorded by a load batch.
+    """
+
+    serializer_class = EventChangeSerializer
     pagination_class = LimitOffsetPagination
+
+    def get_queryset(self):
+        batch = get_object_or_404(LoadBatch, pk=self.kwargs['batch_id'])
+        return EventChange.objects.filter(load_batch=batch)
+
+
+class ImportCreateAPIView(generics.GenericAPIView):
+    """
+    API view to trigger a Sympla import in the background.
+
+    Responds ``202 Accepted`` with the queued batch, or ``200 OK`` with the
+    batch already queued or running, and a ``Location`` to poll. Only
+    staff users may start imports, which spend Sympla API quota.
+    """
+
+    serializer_class = ImportProgressSerializer
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        batch, created = enqueue_import()
+        location = reverse(
+            'import-detail', kwargs={'batch_id': batch.id}, request=request
+        )
+        return Response(
+            self.get_serializer(batch).data,
+            status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+            headers={'Location': location},
+        )
+
+
+class ImportDetailAPIView(generics.RetrieveAPIView):
+    """
+    API view to poll the progress of an import batch. Staff only, like
+    starting one: batches carry organizers and error details.
+    """
+
+    queryset = LoadBatch.objects.all()
+    serializer_class = ImportProgressSerializer
+    permission_classes = [IsAdminUser]
+    lookup_url_kwarg = 'batch_id'
+
+
+class SymplaWebhookAPIView(APIView):
+    """
+    Receives Sympla event notifications signed with
+    ``SYMPLA_WEBHOOK_SECRET``. Notifications for an organizer of
+    ``SYMPLA_ORGANIZERS`` go to its own URL, so their events get the same
+    prefixed ids as the importer gives them.
+
+    Valid events are buffered and written in micro-batches by a background
+    thread, so the response never waits on the database: ``202 Accepted``
+    with the number of events accepted and rejected, or ``503`` with
+    ``Retry-After`` when the buffer is full.
+    """
+
+    authentication_classes = []
+
+    @extend_schema(
+        operation_id='sympla_webhook',
+        request=OpenApiTypes.OBJECT,
+        responses=WEBHOOK_RESPONSES,
+        description=WEBHOOK_DESCRIPTION,
+    )
+    def post(self, request, *args, **kwargs):  # noqa: PLR6301
+        # The webhook module pulls in pydantic, which the rest of the web
+        # process does not need.
+        from apps.events.services import find_organizer  # noqa: PLC0415
+        from apps.events.webhooks import (  # noqa: PLC0415
+            SIGNATURE_HEADER,
+            BufferFull,
+            get_webhook_buffer,
+            parse_notifications,
+            verify_signature,
+        )
+
+        organizer = None
+        if 'organizer' in kwargs:
+            organizer = find_organizer(kwargs['organizer'])
+            if organizer is None:
+                raise NotFound('Unknown organizer.')
+        body = request.body
+        if not verify_signature(
+            body, request.headers.get(SIGNATURE_HEADER, '')
+        ):
+            raise PermissionDenied('Invalid webhook signature.')
+        try:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise ParseError('Invalid JSON.')
+
+        events, errors = parse_notifications(payload, organizer)
+        record_webhook_events('rejected', len(errors))
+        if not events:
+            raise ValidationError({'events': errors or 'No events.'})
+        try:
+            get_webhook_buffer().add(events)
+        except BufferFull:
+            return Response(
+                {'detail': 'Webhook buffer is full; retry later.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': '1'},
+            )
+        record_webhook_events('accepted', len(events))
+        return Response(
+            {'accepted': len(events), 'rejected': errors},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class SymplaOrganizerWebhookAPIView(SymplaWebhookAPIView):
+    """
+    Receives the notifications of one organizer of ``SYMPLA_ORGANIZERS``.
+    """
+
+    @extend_schema(
+        operation_id='sympla_organizer_webhook',
+        request=OpenApiTypes.OBJECT,
+        responses={
+            **WEBHOOK_RESPONSES,
+            404: OpenApiResponse(description='Unknown organizer.'),
+        },
+        description=WEBHOOK_DESCRIPTION,
+    )
+    def post(self, request, *args, **kwargs):
+        return super().post(request, *args, **kwargs)
+
+
+def metrics_view(request):
+    """Expose API and importer metrics in Prometheus exposition format."""
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+def _schema_format(request) -> str:
+    """``?format=json|yaml``, else JSON only if the client asks for it."""
+    fmt = request.GET.get('format')
+    if fmt in SCHEMA_MEDIA_TYPES:
+        return fmt
+    return 'json' if 'json' in request.headers.get('Accept', '') else 'yaml'
+
+
+@require_GET
+@condition(etag_func=lambda request: get_schema_etag(_schema_format(request)))
+def schema_view(request):
+    """Serve the prebuilt OpenAPI schema (see ``build_openapi_schema``)."""
+    fmt = _schema_format(request)
+    return HttpResponse(get_schema(fmt), content_type=SCHEMA_MEDIA_TYPES[fmt])
+
+
+@cache
+def _swagger_view():
+    from drf_spectacular.views import SpectacularSwaggerView  # noqa: PLC0415
+
+    return SpectacularSwaggerView.as_view(url_name='schema')
+
+
+def swagger_view(request, *args, **kwargs):
+    """Swagger UI, importing drf-spectacular's views on first use."""
+    return _swagger_view()(request, *args, **kwargs)
@@ -0,0 +1,305 @@
+import atexit
+import hashlib
+import hmac
+import logging
+import threading
+from datetime import datetime
+from functools import cache
+from typing import Any, Dict, List, Set, Tuple
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, connection, transaction
+from django.utils import timezone
+from pydantic import ValidationError
+
+from apps.events.locks import lock_events_for_write
+from apps.events.metrics import record_webhook_events
+from apps.events.models import TRACKED_FIELDS, Event, EventChange, LoadBatch
+from apps.events.partitions import archive_cutoff, is_archived
+from apps.events.schemas import SymplaEventSchema
+from apps.events.services import Organizer, load_organizers
+from utils.enums import BatchSource, ChangeKind, Status
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = 'X-Sympla-Signature'
+BULK_BATCH_SIZE = 1000
+
+
+class BufferFull(Exception):
+    """Raised when the webhook buffer cannot take more events."""
+
+
+def sign(body: bytes, secret: str) -> str:
+    """Value of ``SIGNATURE_HEADER`` for ``body``: an HMAC-SHA256."""
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f'sha256={digest}'
+
+
+def verify_signature(body: bytes, signature: str) -> bool:
+    """Check a notification against ``SYMPLA_WEBHOOK_SECRET``."""
+    secret = settings.SYMPLA_WEBHOOK_SECRET
+    if not secret:
+        logger.error('SYMPLA_WEBHOOK_SECRET is not set; webhook rejected.')
+        return False
+    return hmac.compare_digest(sign(body, secret), signature)
+
+
+def parse_notifications(
+    payload: Any, organizer: Organizer | None = None
+) -> Tuple[List[SymplaEventSchema], List[Dict[str, Any]]]:
+    """
+    Validate a notification body: one event, a list of events or a page
+    in the ``data`` envelope of the events API. Returns the valid events
+    and an error entry per invalid one.
+
+    Events of an ``organizer`` get its prefixed ids, as the importer
+    stores them.
+    """
+    if isinstance(payload, dict):
+        payload = payload.get('data', [payload])
+    if not isinstance(payload, list):
+        payload = [payload]
+    if organizer:
+        payload = [
+            {**item, 'id': organizer.event_id(item['id'])}
+            if isinstance(item, dict) and item.get('id') is not None
+            else item
+            for item in payload
+        ]
+
+    events, errors = [], []
+    for item in payload:
+        try:
+            events.append(SymplaEventSchema.model_validate(item))
+        except ValidationError as e:
+            errors.append({
+                'id': item.get('id') if isinstance(item, dict) else None,
+                'errors': [error['msg'] for error in e.errors()],
+            })
+    return events, errors
+
+
+class WebhookBuffer:
+    """
+    In-memory buffer of validated webhook events, written by a background
+    thread every ``flush_interval`` seconds or as soon as ``flush_size``
+    events are waiting.
+
+    Events are keyed by ``event_id``, so repeated notifications of an event
+    within a flush window collapse into its latest state. Events still
+    buffered when a process is killed are lost; the scheduled import
+    reconciles them.
+    """
+
+    def __init__(self, flush_interval: float, flush_size: int, max_size: int):
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.max_size = max_size
+        self._events: Dict[str, SymplaEventSchema] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, events: List[SymplaEventSchema]) -> None:
+        """Buffer ``events``, raising ``BufferFull`` past ``max_size``."""
+        with self._lock:
+            new = {event.id for event in events} - self._events.keys()
+            if len(self._events) + len(new) > self.max_size:
+                raise BufferFull
+            for event in events:
+                self._events[event.id] = event
+            size = len(self._events)
+        self._start_flusher()
+        if size >= self.flush_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Write the buffered events; returns how many were created or
+        updated. If the database rejects the data, the events are written
+        one at a time and those it still rejects are dropped, so one bad
+        row cannot block the buffer. On other failures they go back to the
+        buffer, without replacing newer notifications received meanwhile.
+        """
+        with self._lock:
+            events, self._events = self._events, {}
+        if not events:
+            return 0
+        try:
+            written = upsert_events(list(events.values()))
+        except (DataError, IntegrityError):
+            written = self._write_one_by_one(list(events.values()))
+        except Exception:
+            logger.exception(
+                'Writing %d webhook events failed; retrying on next flush.',
+                len(events),
+            )
+            with self._lock:
+                self._events = {**events, **self._events}
+            return 0
+        record_webhook_events('written', written)
+        return written
+
+    @staticmethod
+    def _write_one_by_one(events: List[SymplaEventSchema]) -> int:
+        written = 0
+        for event in events:
+            try:
+                written += upsert_events([event])
+            except (DataError, IntegrityError):
+                logger.exception(
+                    'Dropping webhook event %s: the database rejects it.',
+                    event.id,
+                    extra={'event_id': event.id},
+                )
+                record_webhook_events('dropped', 1)
+        return written
+
+    def _start_flusher(self) -> None:
+        # Started on first use, so it runs in the process serving requests
+        # and not in a gunicorn master that preloads the app and forks.
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='webhook-flusher', daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            finally:
+                connection.close()
+
+
+@cache
+def get_webhook_buffer() -> WebhookBuffer:
+    """The webhook buffer of this process."""
+    return WebhookBuffer(
+        flush_interval=settings.WEBHOOK_FLUSH_INTERVAL,
+        flush_size=settings.WEBHOOK_FLUSH_SIZE,
+        max_size=settings.WEBHOOK_BUFFER_MAX_SIZE,
+    )
+
+
+def _aware(value: Any) -> Any:
+    if isinstance(value, datetime) and timezone.is_naive(value):
+        return timezone.make_aware(value)
+    return value
+
+
+def upsert_events(events: List[SymplaEventSchema]) -> int:
+    """
+    Write ``events`` in bulk under a new webhook ``LoadBatch``.
+
+    New events are created and changed ones updated, each recorded in the
+    change log; unchanged ones are left alone and no batch is recorded if
+    nothing changed. Events of archived months are ignored. Returns the
+    number of events created or updated.
+    """
+    with transaction.atomic():
+        lock_events_for_write(*_organizers_of(events))
+        cutoff = archive_cutoff()
+        created, updated = _write_changes([
+            event
+            for event in events
+            if not is_archived(event.start_date, cutoff)
+        ])
+    if created or updated:
+        logger.info(
+            'Webhook events written: %d created, %d updated.',
+            created,
+            updated,
+        )
+    return created + updated
+
+
+def _organizers_of(events: List[SymplaEventSchema]) -> Set[str]:
+    """Slugs of the organizers of ``events``; ``''`` for the default."""
+    prefixes = [f'{organizer.slug}-' for organizer in load_organizers()]
+    return {
+        next(
+            (
+                prefix[:-1]
+                for prefix in prefixes
+                if event.id.startswith(prefix)
+            ),
+            '',
+        )
+        for event in events
+    }
+
+
+def _write_changes(events: List[SymplaEventSchema]) -> Tuple[int, int]:
+    """
+    Diff ``events`` against the stored ones and write the differences.
+    Must run in a transaction holding the events write lock, so no other
+    writer inserts the same events between the read and the writes.
+    """
+    existing = {
+        event.event_id: event
+        for event in Event.objects.filter(
+            event_id__in=[event.id for event in events]
+        ).order_by()
+    }
+    created, updated, changes = [], [], []
+    for schema in events:
+        fields = {
+            field: _aware(value)
+            for field, value in schema.to_event_fields().items()
+        }
+        event = existing.get(schema.id)
+        if event is None:
+            created.append(Event(event_id=schema.id, **fields))
+            changes.append(
+                EventChange(
+                    event_id=schema.id,
+                    kind=ChangeKind.CREATED.name,
+                    changed_fields=list(TRACKED_FIELDS),
+                )
+            )
+            continue
+        changed_fields = [
+            field
+            for field in TRACKED_FIELDS
+            if getattr(event, field) != fields[field]
+        ]
+        if not changed_fields:
+            continue
+        for field in changed_fields:
+            setattr(event, field, fields[field])
+        updated.append(event)
+        changes.append(
+            EventChange(
+                event_id=schema.id,
+                kind=ChangeKind.UPDATED.name,
+                changed_fields=changed_fields,
+            )
+        )
+    if not changes:
+        return 0, 0
+
+    batch = LoadBatch.objects.create(
+        status=Status.SUCCESS.name,
+        source=BatchSource.WEBHOOK.name,
+        events_total=len(events),
+        events_imported_count=len(changes),
+        finished_at=timezone.now(),
+    )
+    for item in (*created, *updated, *changes):
+        item.load_batch = batch
+    Event.objects.bulk_create(created, batch_size=BULK_BATCH_SIZE)
+    Event.objects.bulk_update(
+        updated, [*TRACKED_FIELDS, 'load_batch'], batch_size=BULK_BATCH_SIZE
+    )
+    EventChange.objects.bulk_create(changes, batch_size=BULK_BATCH_SIZE)
+    return len(created), len(updated)
@@ -0,0 +1,272 @@
+import argparse
+import gzip
+import json
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from urllib.parse import parse_qs, urlparse
+
+FIRST_EVENT_DATE = datetime(2025, 1, 1, 19, 0)
+EVENT_RESOURCE_PATH = re.compile(r'/events/([^/]+)/(orders|participants)$')
+
+# Directory holding the ``benchmarks`` package, from which ``python -m``
+# finds this module.
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+
+
+def build_event(page: int, index: int) -> Dict[str, Any]:
+    """Synthetic event in the shape returned by the Sympla events API."""
+    number = page * 100_000 + index
+    start = FIRST_EVENT_DATE + timedelta(hours=number)
+    online = number % 3 == 0
+    return {
+        'id': f'bench-{page}-{index}',
+        'name': f'Synthetic event {number}',
+        'start_date': start.isoformat(),
+        'end_date': (start + timedelta(hours=2)).isoformat(),
+        'address': (
+            {'address_num': 0}
+            if online
+            else {'name': f'Venue {number % 50}', 'city': 'Recife'}
+        ),
+        'category_prim': {'name': f'Category {number % 7}'},
+        'category_sec': {'name': f'Sub category {number % 13}'},
+    }
+
+
+def build_order(event_id: str, index: int) -> Dict[str, Any]:
+    """Synthetic order in the shape returned by the Sympla orders API."""
+    return {
+        'id': f'{event_id}-order-{index}',
+        'event_id': event_id,
+        'order_status': 'A',
+        'order_date': FIRST_EVENT_DATE.isoformat(),
+        'transaction_type': 'CREDIT_CARD',
+        'order_total_sale_price': 50.0,
+    }
+
+
+def build_participant(event_id: str, index: int) -> Dict[str, Any]:
+    """Synthetic participant, one per order, as the Sympla API returns."""
+    return {
+        'id': index + 1,
+        'event_id': event_id,
+        'order_id': f'{event_id}-order-{index}',
+        'ticket_number': f'TICKET-{index}',
+        'ticket_name': 'Inteira',
+        'ticket_sale_price': 50.0,
+        'checkin': [{'id': index + 1, 'check_in': index % 2 == 0}],
+    }
+
+
+class FakeSymplaServer:
+    """
+    Local stand-in for the Sympla events API.
+
+    Serves ``pages`` pages of ``page_size`` synthetic events using the same
+    ``data``/``pagination`` envelope ``SymplaService`` consumes, adding
+    ``latency`` seconds per response and failing a fraction ``error_rate``
+    of requests with HTTP 500. The random failures are seeded so runs are
+    reproducible. Bodies are gzipped for clients accepting it, as the real
+    API does. ``/events/<id>/orders`` and ``/events/<id>/participants``
+    serve ``orders_per_event`` orders, each with one participant. Use it
+    as a context manager; ``url`` is the first page.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        pages: int = 10,
+        page_size: int = 100,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        *,
+        orders_per_event: int = 2,
+    ):
+        self.pages = pages
+        self.page_size = page_size
+        self.latency = latency
+        self.error_rate = error_rate
+        self.orders_per_event = orders_per_event
+        self.random = random.Random(seed)
+        self.requests_served = 0
+        self.compressed_responses = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(
+            ('127.0.0.1', 0), self._build_handler()
+        )
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/events'
+
+    def __enter__(self) -> 'FakeSymplaServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def page_payload(self, page: int) -> Dict[str, Any]:
+        """Body of a given 1-based page."""
+        has_next = page < self.pages
+        return {
+            'data': [
+                build_event(page, index) for index in range(self.page_size)
+            ],
+            'pagination': {
+                'has_next': has_next,
+                'has_prev': page > 1,
+                'quantity': self.page_size,
+                'offset': (page - 1) * self.page_size,
+                'page': page,
+                'page_size': self.page_size,
+                'total_page': self.pages,
+                'next_page_url': (
+                    f'{self.url}?page={page + 1}' if has_next else None
+                ),
+            },
+        }
+
+    def resource_payload(self, event_id: str, resource: str) -> Dict[str, Any]:
+        """Single-page body of an event's orders or participants."""
+        build = build_order if resource == 'orders' else build_participant
+        return {
+            'data': [
+                build(event_id, index)
+                for index in range(self.orders_per_event)
+            ],
+            'pagination': {
+                'has_next': False,
+                'has_prev': False,
+                'quantity': self.orders_per_event,
+                'offset': 0,
+                'page': 1,
+                'page_size': self.orders_per_event,
+                'total_page': 1,
+                'next_page_url': None,
+            },
+        }
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests_served += 1
+            return self.random.random() < self.error_rate
+
+    def _build_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                if fake.latency:
+                    time.sleep(fake.latency)
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                page = int(query.get('page', ['1'])[0])
+                resource = EVENT_RESOURCE_PATH.search(url.path)
+
+                if fake._should_fail():
+                    self._send(500, {'message': 'Synthetic failure'})
+                elif resource:
+                    self._send(200, fake.resource_payload(*resource.groups()))
+                elif not 1 <= page <= fake.pages:
+                    self._send(404, {'message': 'Page not found'})
+                else:
+                    self._send(200, fake.page_payload(page))
+
+            def _send(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload).encode()
+                gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+                if gzipped:
+                    body = gzip.compress(body)
+                    with fake._lock:
+                        fake.compressed_responses += 1
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                if gzipped:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+        return Handler
+
+
+@contextmanager
+def fake_sympla_process(**options: Any) -> Iterator[str]:
+    """
+    Run a ``FakeSymplaServer`` in a child process and yield its ``url``.
+
+    ``options`` are those of ``FakeSymplaServer``. Building and gzipping
+    the pages then neither counts in the RSS of the process measured nor
+    competes with it for the GIL, as it does with the in-process server.
+    """
+    command = [
+        sys.executable,
+        '-m',
+        'benchmarks.fake_sympla',
+        *(
+            f'--{name.replace("_", "-")}={value}'
+            for name, value in options.items()
+        ),
+    ]
+    process = subprocess.Popen(  # noqa: S603
+        command, cwd=PROJECT_DIR, stdout=subprocess.PIPE, text=True
+    )
+    try:
+        url = process.stdout.readline().strip()
+        if not url:
+            raise RuntimeError(
+                f'Fake Sympla server exited with code {process.wait()}.'
+            )
+        yield url
+    finally:
+        process.terminate()
+        process.wait()
+        process.stdout.close()
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Serve a fake Sympla API, printing its URL, until terminated."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--orders-per-event', type=int, default=2)
+    args = parser.parse_args(argv)
+    with FakeSymplaServer(
+        pages=args.pages,
+        page_size=args.page_size,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        orders_per_event=args.orders_per_event,
+    ) as server:
+        print(server.url, flush=True)  # noqa: T201
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
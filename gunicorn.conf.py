@@ -0,0 +1,31 @@
+"""
+Gunicorn settings picked up automatically from the working directory.
+
+The application is loaded once in the master and shared copy-on-write by
+the forked workers (``preload_app``); set ``GUNICORN_PRELOAD=False`` to
+load it in every worker instead.
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set, every worker writes its metrics
+to files in that directory and ``/metrics`` merges them, so the directory
+is reset on startup and dead workers are marked so their live gauges are
+dropped.
+"""
+
+import os
+import shutil
+
+from prometheus_client import multiprocess
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True') == 'True'
+
+
+def on_starting(server):
+    metrics_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+        os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(worker.pid)
@@ -10,9 +10,10 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
-from decouple import config
+from decouple import Choices, Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -45,6 +46,9 @@ DEPENDENCIES = [
 INSTALLED_APPS = DEPENDENCIES + APPS
 
 MIDDLEWARE = [
+    'apps.events.middleware.MetricsMiddleware',
+    'apps.events.middleware.QueryProfilingMiddleware',
+    'apps.events.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -122,6 +126,100 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',  # noqa: E501
 }
 
+# SQL profiling (opt-in): logs requests over these budgets with their
+# slowest queries.
+QUERY_PROFILING = config('QUERY_PROFILING', default=False, cast=bool)
+QUERY_PROFILING_MAX_QUERIES = config(
+    'QUERY_PROFILING_MAX_QUERIES', default=10, cast=int
+)
+QUERY_PROFILING_MAX_DURATION = config(
+    'QUERY_PROFILING_MAX_DURATION', default=0.5, cast=float
+)
+QUERY_PROFILING_TOP_QUERIES = config(
+    'QUERY_PROFILING_TOP_QUERIES', default=5, cast=int
+)
+
+# Response compression: bodies shorter than COMPRESSION_MIN_LENGTH bytes
+# are sent as is, and the compressed bodies of the cached routes are kept
+# for COMPRESSION_CACHE_TTL seconds.
+COMPRESSION_MIN_LENGTH = config(
+    'COMPRESSION_MIN_LENGTH', default=512, cast=int
+)
+COMPRESSION_CACHED_ROUTES = config(
+    'COMPRESSION_CACHED_ROUTES',
+    default='event-list,event-upcoming,batch-changes,schema',
+    cast=Csv(),
+)
+COMPRESSION_CACHE_TTL = config('COMPRESSION_CACHE_TTL', default=3600, cast=int)
+
+# Cache of serialized events, upcoming pages and compressed bodies. With
+# REDIS_URL set every worker and container shares one Redis; otherwise each
+# process keeps its own in memory, holding up to CACHE_MAX_ENTRIES entries
+# (well above the 500 ids of a multi-get).
+REDIS_URL = config('REDIS_URL', default='')
+CACHE_MAX_ENTRIES = config('CACHE_MAX_ENTRIES', default=20_000, cast=int)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+        }
+    }
+
+# Seconds a serialized event stays cached by the event detail and
+# multi-get endpoints; entries are keyed on the data version anyway.
+EVENT_CACHE_TTL = config('EVENT_CACHE_TTL', default=3600, cast=int)
+
+# Seconds a page of /api/events/upcoming/ stays cached. Pages are keyed on
+# the data version, so a finished batch refreshes them; the TTL bounds how
+# long events that ended meanwhile keep being listed.
+UPCOMING_CACHE_TTL = config('UPCOMING_CACHE_TTL', default=60, cast=int)
+
+# Webhook receiver: HMAC secret shared with the sender (empty rejects every
+# notification), and when buffered notifications are written: every
+# WEBHOOK_FLUSH_INTERVAL seconds or once WEBHOOK_FLUSH_SIZE are waiting.
+# Past WEBHOOK_BUFFER_MAX_SIZE buffered events senders get a 503.
+SYMPLA_WEBHOOK_SECRET = config('SYMPLA_WEBHOOK_SECRET', default='')
+WEBHOOK_FLUSH_INTERVAL = config(
+    'WEBHOOK_FLUSH_INTERVAL', default=1.0, cast=float
+)
+WEBHOOK_FLUSH_SIZE = config('WEBHOOK_FLUSH_SIZE', default=500, cast=int)
+WEBHOOK_BUFFER_MAX_SIZE = config(
+    'WEBHOOK_BUFFER_MAX_SIZE', default=10_000, cast=int
+)
+
+# Import scheduling: interval between runs, random jitter added to each
+# wait, and how long a lock row is honoured before it is considered stale.
+IMPORT_INTERVAL = config('IMPORT_INTERVAL', default=3600, cast=int)
+IMPORT_JITTER = config('IMPORT_JITTER', default=60, cast=int)
+IMPORT_LOCK_TTL = config('IMPORT_LOCK_TTL', default=6 * 3600, cast=int)
+# Pipelined import: fetch pages while earlier ones are written, keeping at
+# most IMPORT_QUEUE_DEPTH validated pages in memory.
+IMPORT_PIPELINE = config('IMPORT_PIPELINE', default=False, cast=bool)
+IMPORT_QUEUE_DEPTH = config('IMPORT_QUEUE_DEPTH', default=4, cast=int)
+# --all-organizers on PostgreSQL: organizers imported at once, each by its
+# own process. More than the CPUs only adds contention.
+IMPORT_ORGANIZER_PROCESSES = config(
+    'IMPORT_ORGANIZER_PROCESSES', default=os.cpu_count() or 1, cast=int
+)
+
+# Participants/orders import: concurrent Sympla requests per run, and how
+# long the sales of an event not yet over are trusted before re-syncing.
+SALES_IMPORT_WORKERS = config('SALES_IMPORT_WORKERS', default=8, cast=int)
+SALES_SYNC_MAX_AGE = config('SALES_SYNC_MAX_AGE', default=6 * 3600, cast=int)
+
+# Where build_openapi_schema writes the schema served at /schema/.
+OPENAPI_SCHEMA_DIR = config(
+    'OPENAPI_SCHEMA_DIR', default=str(BASE_DIR / 'openapi')
+)
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Sympla Integration',
     'DESCRIPTION': 'API for integrating with Sympla events, allowing retrieval and management of event data.',  # noqa: E501
@@ -154,6 +252,12 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# 'json' emits one JSON object per line, including structured ``extra``
+# fields, for log aggregators.
+LOG_FORMAT = config(
+    'LOG_FORMAT', default='verbose', cast=Choices(['verbose', 'json'])
+)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -162,17 +266,20 @@ LOGGING = {
             'format': '{levelname} {asctime} {module} {message}',
             'style': '{',
         },
+        'json': {
+            '()': 'utils.log_formatters.JsonFormatter',
+        },
     },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
-            'formatter': 'verbose',
+            'formatter': LOG_FORMAT,
         },
         'file': {
             'level': 'INFO',
             'class': 'logging.FileHandler',
             'filename': BASE_DIR / 'django.log',
-            'formatter': 'verbose',
+            'formatter': LOG_FORMAT,
         },
     },
     'loggers': {
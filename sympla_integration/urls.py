@@ -17,15 +17,13 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+
+from apps.events.views import metrics_view, schema_view, swagger_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('apps.events.urls')),
-    path('schema/', SpectacularAPIView.as_view(), name='schema'),
-    path(
-        'swagger/',
-        SpectacularSwaggerView.as_view(url_name='schema'),
-        name='swagger-ui',
-    ),
+    path('metrics', metrics_view, name='metrics'),
+    path('schema/', schema_view, name='schema'),
+    path('swagger/', swagger_view, name='swagger-ui'),
 ]
@@ -10,7 +10,12 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sympla_integration.settings')
 
 application = get_wsgi_application()
+
+# Import the URLconf and views now instead of on the first request, so
+# workers forked by ``gunicorn --preload`` share them with the master.
+get_resolver().url_patterns
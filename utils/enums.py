@@ -25,6 +25,27 @@ class Status(Enum):
     SUCCESS = 'Sucesso'
     ERROR = 'Error'
     PENDING = 'Pendente'
+    QUEUED = 'Na fila'
+    SKIPPED = 'Ignorado'
+
+    @classmethod
+    def choices(cls):
+        return [(key.name, key.value) for key in cls]
+
+
+class ChangeKind(Enum):
+    CREATED = 'Criado'
+    UPDATED = 'Atualizado'
+
+    @classmethod
+    def choices(cls):
+        return [(key.name, key.value) for key in cls]
+
+
+class BatchSource(Enum):
+    IMPORT = 'Importação'
+    WEBHOOK = 'Webhook'
+    LOAD_TEST = 'Teste de carga'
 
     @classmethod
     def choices(cls):
@@ -0,0 +1,36 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else was passed via ``extra``.
+RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord('', 0, '', 0, '', (), None)).keys()
+) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+
+    Values passed through ``extra`` become top-level keys, so structured
+    summaries (batch id, counters) can be queried by log aggregators.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'timestamp': datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'message': record.getMessage(),
+        }
+        payload.update({
+            key: value
+            for key, value in vars(record).items()
+            if key not in RESERVED_ATTRS
+        })
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)